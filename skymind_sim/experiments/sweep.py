@@ -0,0 +1,306 @@
+# skymind_sim/experiments/sweep.py
+
+import argparse
+import csv
+import itertools
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from skymind_sim.utils.config_loader import ConfigLoader
+from skymind_sim.utils.log_manager import LogManager
+from skymind_sim.utils.metrics import MetricsCollector
+
+logger = LogManager.get_logger(__name__)
+
+DEFAULT_CONFIG_DIR = 'data/config'
+
+
+@dataclass
+class RunSpec:
+    """
+    تعریف یک اجرای منفرد در یک sweep.
+
+    Attributes:
+        run_id (int): شماره اجرا (ترتیب ثابت در جدول خروجی).
+        seed (int): seed قطعی این اجرا.
+        params (Dict[str, Any]): پارامترهای سناریو؛ کلیدهای نقطه‌دار (مثل 'simulation.fps')
+                                 به عنوان بازنویسی تنظیمات ConfigLoader اعمال می‌شوند.
+        steps (int): تعداد گام‌های شبیه‌سازی.
+        dt (float): طول هر گام (ثانیه).
+    """
+    run_id: int
+    seed: int
+    params: Dict[str, Any] = field(default_factory=dict)
+    steps: int = 200
+    dt: float = 0.1
+
+    @property
+    def config_overrides(self) -> Dict[str, Any]:
+        return {k: v for k, v in self.params.items() if '.' in k}
+
+    @property
+    def scenario_params(self) -> Dict[str, Any]:
+        return {k: v for k, v in self.params.items() if '.' not in k}
+
+
+class MissionAgent:
+    """
+    پهپاد سبک برای سناریوهای دسته‌ای: فقط وضعیت لازم برای DroneMover و شبکه.
+
+    `energy` بودجه باتری است و با `drain` به ازای هر واحد گرید پیموده‌شده
+    (مانند FleetState.integrate) کم می‌شود؛ پهپادی که باتری‌اش تمام شود متوقف می‌شود.
+    """
+
+    def __init__(self, agent_id: str, position, destination, metrics: MetricsCollector,
+                 energy: float = math.inf):
+        self.id = agent_id
+        self.position = position
+        self.destination = destination
+        self.energy = energy
+        self.path = []
+        self.path_history = [position]
+        self.collision_avoided = 0
+        self.active = True
+        self.neighbors = []
+        self.arrival_time = None
+        self._metrics = metrics
+
+    def drain(self, previous, energy_per_unit: float):
+        """انرژی جابه‌جایی از `previous` تا موقعیت فعلی را از باتری کم می‌کند."""
+        if not energy_per_unit:
+            return
+        travelled = math.hypot(self.position[0] - previous[0], self.position[1] - previous[1])
+        self.energy = max(self.energy - travelled * energy_per_unit, 0.0)
+        if self.energy <= 0.0:
+            self.active = False
+
+    def receive_message(self, msg, latency, success):
+        self._metrics.log_network_event(self.id, latency if success else None, success, len(self.neighbors))
+
+
+def delivery_scenario(spec: RunSpec, metrics: MetricsCollector):
+    """
+    سناریوی پیش‌فرض: ناوگانی از پهپادها از خانه‌های آزاد تصادفی به مقصدهای تصادفی
+    پرواز می‌کنند و در هر `broadcast_interval` گام برای همسایگان خود پیام broadcast می‌کنند.
+
+    پارامترهای سناریو: fleet_size, map, algorithm, use_flow_fields, comm_range,
+    packet_loss_rate, base_latency, broadcast_interval, battery_capacity.
+    مصرف انرژی از `world.energy_per_unit` خوانده می‌شود و باتری باقی‌مانده هر
+    پهپاد در ستون BatteryRemaining ثبت می‌شود.
+    """
+    from skymind_sim.layer_1_simulation.simulation import Simulation
+    from skymind_sim.layer_1_simulation.movement.drone_mover import DroneMover
+    from skymind_sim.layer_1_simulation.world.map_compiler import load_map
+    from skymind_sim.network.communication import UAVCommChannel, UAVNetworkManager
+
+    params = spec.scenario_params
+    rng = random.Random(spec.seed)
+    sim = Simulation(headless=True)
+    grid = sim.world.grid
+
+    map_path = params.get('map')
+    if map_path:
+        load_map(map_path, cell_size=grid.cell_size).apply(grid)
+
+    free = np.argwhere(grid.occupancy == 0)
+    fleet_size = int(params.get('fleet_size', 10))
+    picks = [tuple(int(v) for v in free[rng.randrange(len(free))][::-1]) for _ in range(2 * fleet_size)]
+    capacity = float(params.get('battery_capacity', 100.0))
+    energy_per_unit = sim.world.energy_per_unit
+    agents = [MissionAgent(f"drone_{i}", picks[2 * i], picks[2 * i + 1], metrics, energy=capacity)
+              for i in range(fleet_size)]
+
+    algorithm = params.get('algorithm', 'A_STAR')
+    mover = DroneMover(sim.world, algorithm=algorithm, use_flow_fields=bool(params.get('use_flow_fields', False)),
+                       history_limit=spec.steps + 1)
+    channel = UAVCommChannel(comm_range=float(params.get('comm_range', 5.0)),
+                             packet_loss_rate=float(params.get('packet_loss_rate', 0.01)),
+                             base_latency=float(params.get('base_latency', 0.05)),
+                             seed=spec.seed)
+    network = UAVNetworkManager(agents, channel)
+    interval = max(int(params.get('broadcast_interval', 10)), 1)
+
+    for step in range(spec.steps):
+        sim.step(spec.dt)
+        moving = [a for a in agents if a.active]
+        previous = [a.position for a in moving]
+        mover.move_drones(moving)
+        for agent, position in zip(moving, previous):
+            agent.drain(position, energy_per_unit)
+        for agent in agents:
+            if agent.active and tuple(agent.position) == tuple(agent.destination):
+                agent.active = False
+                agent.arrival_time = sim.sim_time
+        if step % interval == 0:
+            network.update_neighbors()
+            for agent in agents:
+                network.broadcast(agent.id, {"from": agent.id, "step": step}, size_bytes=256)
+        network.advance_to(sim.sim_time)
+
+    for agent in agents:
+        metrics.log_task(
+            agent.id, algorithm, agent.path_history, len(agent.path_history) - 1,
+            agent.energy, agent.arrival_time if agent.arrival_time is not None else sim.sim_time,
+            0, agent.collision_avoided
+        )
+
+
+def run_single(spec: RunSpec, scenario: Callable[[RunSpec, MetricsCollector], None] = delivery_scenario,
+               config_dir: str = DEFAULT_CONFIG_DIR) -> Dict[str, List[Any]]:
+    """
+    یک اجرای headless را با تنظیمات و seed مشخص انجام می‌دهد.
+
+    تنظیمات سراسری ConfigLoader برای هر اجرا از نو بارگذاری می‌شوند تا بازنویسی‌های
+    یک اجرا به اجرای بعدی در همان فرآیند نشت نکند.
+
+    Returns:
+        Dict[str, List[Any]]: جدول ستونی MetricsCollector به همراه ستون‌های run_id، seed و پارامترها.
+    """
+    ConfigLoader.reset()
+    ConfigLoader.initialize(config_dir=config_dir)
+    ConfigLoader.apply_overrides(spec.config_overrides)
+    random.seed(spec.seed)
+    np.random.seed(spec.seed % (2 ** 32))
+
+    metrics = MetricsCollector()
+    started = time.perf_counter()
+    scenario(spec, metrics)
+    elapsed = time.perf_counter() - started
+
+    columns = metrics.to_columns()
+    rows = len(columns[MetricsCollector.COLUMNS[0]])
+    table = {"run_id": [spec.run_id] * rows, "seed": [spec.seed] * rows}
+    for key, value in spec.params.items():
+        table[key] = [value] * rows
+    # The collector stores missing numbers as NaN and missing CommSuccess/NeighborCount
+    # as -1; the merged table uses None for both, like export_csv.
+    sentinels = {"CommSuccess", "NeighborCount"}
+    table.update({name: [None if (isinstance(v, float) and math.isnan(v)) or (name in sentinels and v < 0) else v
+                         for v in values.tolist()]
+                  for name, values in columns.items()})
+    table["WallTime"] = [elapsed] * rows
+    logger.info(f"Run {spec.run_id} (seed {spec.seed}) finished in {elapsed:.2f}s with {rows} row(s).")
+    return table
+
+
+def build_runs(grid: Dict[str, Sequence[Any]], repeats: int = 1, base_seed: int = 0,
+               steps: int = 200, dt: float = 0.1) -> List[RunSpec]:
+    """
+    حاصل‌ضرب دکارتی مقادیر پارامترها را در `repeats` تکرار به فهرست RunSpec تبدیل می‌کند.
+
+    seedها با SeedSequence از base_seed مشتق می‌شوند، پس به ترتیب اجرای فرآیندها بستگی ندارند.
+    """
+    keys = list(grid)
+    combos = list(itertools.product(*(grid[k] for k in keys))) or [()]
+    total = len(combos) * repeats
+    seeds = [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(base_seed).spawn(total)]
+    runs = []
+    for index, (combo, _) in enumerate(itertools.product(combos, range(repeats))):
+        runs.append(RunSpec(run_id=index, seed=seeds[index], params=dict(zip(keys, combo)), steps=steps, dt=dt))
+    return runs
+
+
+def merge_tables(tables: Iterable[Dict[str, List[Any]]]) -> Dict[str, List[Any]]:
+    """جدول‌های ستونی اجراها را در یک جدول واحد ادغام می‌کند (ستون‌های غایب با None پر می‌شوند)."""
+    tables = list(tables)
+    names: List[str] = []
+    for table in tables:
+        names.extend(name for name in table if name not in names)
+    merged = {name: [] for name in names}
+    for table in tables:
+        rows = len(next(iter(table.values()))) if table else 0
+        for name in names:
+            merged[name].extend(table.get(name, [None] * rows))
+    return merged
+
+
+def run_sweep(runs: Sequence[RunSpec], workers: Optional[int] = None,
+              scenario: Callable[[RunSpec, MetricsCollector], None] = delivery_scenario,
+              config_dir: str = DEFAULT_CONFIG_DIR) -> Dict[str, List[Any]]:
+    """
+    اجراها را روی یک process pool پخش می‌کند و نتایج را به ترتیب run_id ادغام می‌کند.
+
+    Args:
+        runs (Sequence[RunSpec]): اجراها (معمولاً از build_runs).
+        workers (Optional[int]): تعداد فرآیندها؛ 0 یعنی اجرای سریال در همین فرآیند.
+        scenario (Callable): تابع سناریو؛ باید در سطح ماژول تعریف شده باشد تا pickle شود.
+        config_dir (str): پوشه تنظیمات پایه.
+    """
+    config_dir = os.path.abspath(config_dir)
+    if workers == 0:
+        tables = [run_single(spec, scenario, config_dir) for spec in runs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            tables = list(pool.map(run_single, runs, itertools.repeat(scenario), itertools.repeat(config_dir)))
+    return merge_tables(tables)
+
+
+def write_table(table: Dict[str, List[Any]], path: str):
+    """جدول ستونی را بر اساس پسوند فایل به CSV یا NPZ (یک آرایه برای هر ستون) ذخیره می‌کند."""
+    if path.endswith('.npz'):
+        arrays = {}
+        for name, values in table.items():
+            if all(v is not None and not isinstance(v, (list, tuple, dict)) for v in values):
+                arrays[name] = np.asarray(values)
+            else:
+                arrays[name] = np.asarray([v if isinstance(v, str) else json.dumps(v) for v in values])
+        np.savez_compressed(path, **arrays)
+        return
+    names = list(table)
+    rows = len(table[names[0]]) if names else 0
+    with open(path, mode="w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(names)
+        for i in range(rows):
+            writer.writerow([table[name][i] for name in names])
+
+
+def _parse_value(text: str) -> Any:
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run a parameter sweep of headless SkyMind simulations.")
+    parser.add_argument("--param", action="append", default=[], metavar="KEY=V1,V2",
+                        help="sweep values for a scenario parameter (fleet_size, map, packet_loss_rate, ...) "
+                             "or a dotted config override such as world.energy_per_unit; repeatable")
+    parser.add_argument("--repeats", type=int, default=1, help="runs per parameter combination")
+    parser.add_argument("--seed", type=int, default=0, help="base seed for deriving per-run seeds")
+    parser.add_argument("--steps", type=int, default=200, help="simulation steps per run")
+    parser.add_argument("--dt", type=float, default=0.1, help="fixed time step in seconds")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (0 = serial)")
+    parser.add_argument("--config-dir", default=DEFAULT_CONFIG_DIR, help="base configuration directory")
+    parser.add_argument("--output", default="sweep_results.csv", help="output table (.csv or .npz)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    grid = {}
+    for entry in args.param:
+        key, _, values = entry.partition('=')
+        if not values:
+            raise SystemExit(f"Invalid --param '{entry}', expected KEY=V1,V2,...")
+        grid[key.strip()] = [_parse_value(v.strip()) for v in values.split(',')]
+
+    runs = build_runs(grid, repeats=args.repeats, base_seed=args.seed, steps=args.steps, dt=args.dt)
+    logger.info(f"Starting sweep with {len(runs)} run(s) on {args.workers or os.cpu_count()} worker(s).")
+    started = time.perf_counter()
+    table = run_sweep(runs, workers=args.workers, config_dir=args.config_dir)
+    write_table(table, args.output)
+    logger.info(f"Sweep finished in {time.perf_counter() - started:.1f}s; results written to {args.output}.")
+
+
+if __name__ == '__main__':
+    main()
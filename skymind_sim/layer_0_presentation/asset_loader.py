@@ -3,42 +3,130 @@
 import pygame
 import os
 import logging
-from typing import Dict
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class _AtlasPage:
+    """One texture-atlas surface filled with a simple shelf packer."""
+
+    def __init__(self, size: Tuple[int, int]):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.width, self.height = size
+        self._shelf_y = 0
+        self._shelf_h = 0
+        self._x = 0
+        # Number of cached variants still stored in this page
+        self.live = 0
+
+    def insert(self, image: pygame.Surface) -> Optional[pygame.Surface]:
+        """Copies `image` into the page and returns the subsurface holding it, or None if it does not fit."""
+        w, h = image.get_size()
+        if w > self.width or h > self.height:
+            return None
+        if self._x + w > self.width:
+            self._shelf_y += self._shelf_h
+            self._x, self._shelf_h = 0, 0
+        if self._shelf_y + h > self.height:
+            return None
+        rect = pygame.Rect(self._x, self._shelf_y, w, h)
+        self.surface.blit(image, rect)
+        self._x += w
+        self._shelf_h = max(self._shelf_h, h)
+        return self.surface.subsurface(rect)
+
 
 class AssetLoader:
     """
     A static class responsible for loading and caching game assets like images and fonts.
+
+    Scaled (and optionally rotated) variants are cached separately, keyed on
+    (image, size, rotation bucket), in an LRU cache of `_variant_limit`
+    entries, so every drone of the same type shares one surface instead of
+    scaling its own copy. With `configure(atlas_size=...)` the variants are
+    packed into shared atlas pages and handed out as subsurfaces. A page is
+    released once LRU eviction has dropped all of its variants, and if more
+    than `_atlas_page_limit` pages are live the atlas is cleared and refilled
+    from the variants requested next, so the atlas never outgrows the cache.
+    Shared surfaces must be treated as read-only by their users.
     """
     _image_cache: Dict[str, pygame.Surface] = {}
     _font_cache: Dict[str, pygame.font.Font] = {}
+    _variant_cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+    _variant_limit = 512
+    _rotation_step = 15.0  # degrees per rotation bucket
+    _atlas_size: Optional[Tuple[int, int]] = None
+    _atlas_pages: List[_AtlasPage] = []
+    _atlas_page_limit = 8
+    # Atlas page of each packed variant, so evicting it can release the page
+    _variant_pages: Dict[tuple, _AtlasPage] = {}
+    # Images decoded before a display mode existed; converted on first use
+    _unconverted: Set[str] = set()
+    # Background loads in flight, keyed ("image", name) or ("font", "<name>_<size>")
+    _pending: Dict[tuple, Future] = {}
+    # SDL_ttf is not thread-safe: fonts are only ever created under this lock
+    _font_lock = threading.Lock()
     _assets_path = os.path.join(os.path.dirname(__file__), '..', '..', 'assets')
     _image_path = os.path.join(_assets_path, 'images')
     _font_path = os.path.join(_assets_path, 'fonts')
 
     @staticmethod
-    def _load_image(name: str) -> pygame.Surface:
-        """Loads an image file into a pygame.Surface."""
-        logger = logging.getLogger(__name__)
+    def _decode_image(name: str) -> pygame.Surface:
+        """Decodes an image file without converting it (safe to call from a worker thread)."""
         full_path = os.path.join(AssetLoader._image_path, name)
         try:
-            image = pygame.image.load(full_path)
-            # Convert alpha for better blitting performance
-            if image.get_alpha():
-                image = image.convert_alpha()
-            else:
-                image = image.convert()
-            logger.info(f"Successfully loaded image: {name}")
-            return image
+            return pygame.image.load(full_path)
         except pygame.error as e:
-            logger.error(f"Cannot load image: {name} from path {full_path}. Error: {e}")
+            logging.getLogger(__name__).error(f"Cannot load image: {name} from path {full_path}. Error: {e}")
             raise
 
+    @staticmethod
+    def _convert(image: pygame.Surface) -> Optional[pygame.Surface]:
+        """Converts an image to the display format, or returns None while there is no display mode."""
+        if not (pygame.display.get_init() and pygame.display.get_surface() is not None):
+            return None
+        return image.convert_alpha() if image.get_alpha() else image.convert()
+
+    @staticmethod
+    def _load_image(name: str) -> pygame.Surface:
+        """Loads an image file into a pygame.Surface."""
+        image = AssetLoader._decode_image(name)
+        # Convert alpha for better blitting performance (needs a display mode)
+        converted = AssetLoader._convert(image)
+        if converted is None:
+            AssetLoader._unconverted.add(name)
+        else:
+            image = converted
+        logging.getLogger(__name__).info(f"Successfully loaded image: {name}")
+        return image
+
+    @staticmethod
+    def store_image(name: str, image: pygame.Surface):
+        """Adds an image decoded elsewhere (e.g. by AssetPreloader); it is converted on first use."""
+        AssetLoader._unconverted.add(name)
+        AssetLoader._image_cache[name] = image
+
+    @staticmethod
+    def _wait_pending(key: tuple):
+        """Waits for a background load of `key`, if one is in flight, instead of loading it twice."""
+        future = AssetLoader._pending.get(key)
+        if future is not None:
+            try:
+                future.result()
+            except Exception:
+                pass  # Fall back to loading synchronously, which reports the error
+
     # --- THIS IS THE FIX ---
     @staticmethod
     # -----------------------
     def get_image(name: str) -> pygame.Surface:
         """
         Retrieves a cached image or loads it if it's not in the cache.
+
+        If a preloader is decoding the image in the background, this waits for
+        it instead of decoding it a second time.
         
         Args:
             name (str): The filename of the image in the assets/images folder.
@@ -46,10 +134,149 @@ class AssetLoader:
         Returns:
             pygame.Surface: The loaded image surface.
         """
+        if name not in AssetLoader._image_cache:
+            AssetLoader._wait_pending(("image", name))
         if name not in AssetLoader._image_cache:
             AssetLoader._image_cache[name] = AssetLoader._load_image(name)
+        if name in AssetLoader._unconverted:
+            converted = AssetLoader._convert(AssetLoader._image_cache[name])
+            if converted is not None:
+                AssetLoader._image_cache[name] = converted
+                AssetLoader._unconverted.discard(name)
         return AssetLoader._image_cache[name]
 
+    @staticmethod
+    def configure(cache_size: Optional[int] = None, rotation_step: Optional[float] = None,
+                  atlas_size: Optional[Tuple[int, int]] = None, use_atlas: Optional[bool] = None,
+                  atlas_pages: Optional[int] = None):
+        """
+        Adjusts the scaled-variant cache; changing it clears the cached variants.
+
+        Args:
+            cache_size (Optional[int]): Maximum number of cached variants (LRU eviction beyond it).
+            rotation_step (Optional[float]): Width of a rotation bucket in degrees.
+            atlas_size (Optional[Tuple[int, int]]): Pack variants into atlas pages of this size.
+            use_atlas (Optional[bool]): False turns the atlas off again.
+            atlas_pages (Optional[int]): Maximum number of live atlas pages before the atlas is repacked.
+        """
+        if cache_size is not None:
+            AssetLoader._variant_limit = max(int(cache_size), 1)
+        if rotation_step is not None:
+            AssetLoader._rotation_step = float(rotation_step)
+        if atlas_size is not None:
+            AssetLoader._atlas_size = tuple(atlas_size)
+        if use_atlas is False:
+            AssetLoader._atlas_size = None
+        if atlas_pages is not None:
+            AssetLoader._atlas_page_limit = max(int(atlas_pages), 1)
+        AssetLoader.clear_variants()
+
+    @staticmethod
+    def clear_variants():
+        """Drops every cached scaled variant and atlas page."""
+        AssetLoader._variant_cache.clear()
+        AssetLoader._variant_pages.clear()
+        AssetLoader._atlas_pages = []
+
+    @staticmethod
+    def rotation_bucket(angle: float) -> int:
+        """Returns the rotation bucket an angle (degrees) falls into."""
+        step = AssetLoader._rotation_step
+        buckets = max(int(round(360.0 / step)), 1)
+        return int(round((angle % 360.0) / step)) % buckets
+
+    @staticmethod
+    def _cache_variant(key: tuple, surface: pygame.Surface) -> pygame.Surface:
+        if AssetLoader._atlas_size is not None:
+            page = AssetLoader._atlas_pages[-1] if AssetLoader._atlas_pages else None
+            packed = page.insert(surface) if page is not None else None
+            if packed is None:
+                if len(AssetLoader._atlas_pages) >= AssetLoader._atlas_page_limit:
+                    # Live variants are scattered over too many pages: start over and repack on demand.
+                    AssetLoader.clear_variants()
+                page = _AtlasPage(AssetLoader._atlas_size)
+                packed = page.insert(surface)
+                if packed is not None:
+                    AssetLoader._atlas_pages.append(page)
+            if packed is not None:
+                surface = packed
+                page.live += 1
+                AssetLoader._variant_pages[key] = page
+        cache = AssetLoader._variant_cache
+        cache[key] = surface
+        while len(cache) > AssetLoader._variant_limit:
+            evicted, _ = cache.popitem(last=False)
+            AssetLoader._release_page(evicted)
+        return surface
+
+    @staticmethod
+    def _release_page(key: tuple):
+        """Drops an evicted variant's claim on its atlas page and frees the page once it is empty."""
+        page = AssetLoader._variant_pages.pop(key, None)
+        if page is None:
+            return
+        page.live -= 1
+        if page.live <= 0 and page in AssetLoader._atlas_pages:
+            AssetLoader._atlas_pages.remove(page)
+
+    @staticmethod
+    def get_scaled(name: str, size: Tuple[int, int], angle: float = 0.0) -> pygame.Surface:
+        """
+        Retrieves the image scaled to `size` and rotated to the bucket of `angle`, shared by all callers.
+
+        Args:
+            name (str): The filename of the image in the assets/images folder.
+            size (Tuple[int, int]): Target size in pixels (before rotation).
+            angle (float): Rotation in degrees, counter-clockwise; snapped to the rotation bucket.
+
+        Returns:
+            pygame.Surface: The cached variant; do not draw onto it.
+        """
+        size = (int(size[0]), int(size[1]))
+        bucket = AssetLoader.rotation_bucket(angle)
+        key = (name, size, bucket)
+        cache = AssetLoader._variant_cache
+        surface = cache.get(key)
+        if surface is not None:
+            cache.move_to_end(key)
+            return surface
+        surface = pygame.transform.scale(AssetLoader.get_image(name), size)
+        if bucket:
+            surface = pygame.transform.rotate(surface, bucket * AssetLoader._rotation_step)
+        return AssetLoader._cache_variant(key, surface)
+
+    @staticmethod
+    def get_placeholder(size: Tuple[int, int], color=(255, 0, 255)) -> pygame.Surface:
+        """Returns a shared solid-colour surface used when an image cannot be loaded."""
+        size = (int(size[0]), int(size[1]))
+        key = ("#placeholder", size, tuple(color))
+        cache = AssetLoader._variant_cache
+        surface = cache.get(key)
+        if surface is not None:
+            cache.move_to_end(key)
+            return surface
+        surface = pygame.Surface(size)
+        surface.fill(color)
+        return AssetLoader._cache_variant(key, surface)
+
+    @staticmethod
+    def _load_font(name: str, size: int) -> pygame.font.Font:
+        """Loads a font, falling back to pygame's default font (serialized by `_font_lock`)."""
+        full_path = os.path.join(AssetLoader._font_path, name)
+        with AssetLoader._font_lock:
+            try:
+                font = pygame.font.Font(full_path, size)
+                logging.getLogger(__name__).info(f"Successfully loaded font: {name} with size {size}")
+                return font
+            except (pygame.error, OSError) as e:
+                logging.getLogger(__name__).error(f"Cannot load font: {name}. Using default. Error: {e}")
+                return pygame.font.Font(None, size) # Fallback to default font
+
+    @staticmethod
+    def store_font(name: str, size: int, font: pygame.font.Font):
+        """Adds a font loaded elsewhere (e.g. by AssetPreloader) to the cache."""
+        AssetLoader._font_cache[f"{name}_{size}"] = font
+
     @staticmethod
     def get_font(name: str, size: int) -> pygame.font.Font:
         """
@@ -64,11 +291,7 @@ class AssetLoader:
         """
         key = f"{name}_{size}"
         if key not in AssetLoader._font_cache:
-            full_path = os.path.join(AssetLoader._font_path, name)
-            try:
-                AssetLoader._font_cache[key] = pygame.font.Font(full_path, size)
-                logging.getLogger(__name__).info(f"Successfully loaded font: {name} with size {size}")
-            except pygame.error as e:
-                logging.getLogger(__name__).error(f"Cannot load font: {name}. Using default. Error: {e}")
-                AssetLoader._font_cache[key] = pygame.font.Font(None, size) # Fallback to default font
+            AssetLoader._wait_pending(("font", key))
+        if key not in AssetLoader._font_cache:
+            AssetLoader._font_cache[key] = AssetLoader._load_font(name, size)
         return AssetLoader._font_cache[key]
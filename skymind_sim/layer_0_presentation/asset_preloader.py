@@ -0,0 +1,162 @@
+# skymind_sim/layer_0_presentation/asset_preloader.py
+
+import json
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import pygame
+
+from skymind_sim.layer_0_presentation.asset_loader import AssetLoader
+
+# Manifest priorities
+STARTUP = "startup"
+LAZY = "lazy"
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tga")
+FONT_EXTENSIONS = (".ttf", ".otf")
+
+ProgressCallback = Callable[[int, int, str], None]
+
+
+class AssetPreloader:
+    """
+    Decodes the assets listed in a manifest on a thread pool and hands them to AssetLoader.
+
+    The manifest (`assets/manifest.json` by default) lists images and fonts
+    with a priority:
+
+        {"images": [{"name": "drone_2.png", "priority": "startup"}],
+         "fonts": [{"name": "Roboto-Regular.ttf", "sizes": [16, 24], "priority": "lazy"}]}
+
+    `start` submits the startup assets at once and the lazy ones behind them,
+    so lazy assets load in the background while the first frames run. While a
+    load is in flight, AssetLoader waits for it instead of loading the asset
+    a second time. Images are only decoded on the workers; conversion to the
+    display format happens on the main thread the first time they are used.
+    SDL_ttf is not thread-safe, so fonts are created one at a time on a
+    separate single-thread pool and only image decoding runs in parallel.
+    Without a manifest file every image is treated as a startup asset and
+    every font is skipped, since the sizes are unknown.
+    """
+
+    def __init__(self, manifest_path: Optional[str] = None, workers: int = 4):
+        self.logger = logging.getLogger(__name__)
+        self.manifest_path = manifest_path or os.path.join(AssetLoader._assets_path, "manifest.json")
+        self.workers = max(int(workers), 1)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._font_pool: Optional[ThreadPoolExecutor] = None
+        self._startup: List[Future] = []
+        self._lazy: List[Future] = []
+        self._lock = threading.Lock()
+        self.done = 0
+        self.cancelled = 0
+        self.failed: List[str] = []
+
+    def load_manifest(self) -> Dict[str, List[dict]]:
+        """Reads the manifest, or builds one from the contents of the asset folders if it is missing."""
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            return {"images": manifest.get("images", []), "fonts": manifest.get("fonts", [])}
+        images = []
+        if os.path.isdir(AssetLoader._image_path):
+            images = [{"name": name, "priority": STARTUP} for name in sorted(os.listdir(AssetLoader._image_path))
+                      if name.lower().endswith(IMAGE_EXTENSIONS)]
+        return {"images": images, "fonts": []}
+
+    @property
+    def total(self) -> int:
+        return len(self._startup) + len(self._lazy)
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the submitted assets that have finished (loaded, failed or cancelled; 1.0 if none)."""
+        return self.done / self.total if self.total else 1.0
+
+    def start(self) -> "AssetPreloader":
+        """Submits every manifest entry to the thread pool, startup assets first."""
+        if self._pool is not None:
+            return self
+        if not pygame.font.get_init():
+            pygame.font.init()
+        manifest = self.load_manifest()
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="assets")
+        self._font_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="assets-fonts")
+        for priority, futures in ((STARTUP, self._startup), (LAZY, self._lazy)):
+            for entry in manifest["images"]:
+                if entry.get("priority", STARTUP) == priority:
+                    futures.append(self._submit(("image", entry["name"]), self._load_image, entry["name"]))
+            for entry in manifest["fonts"]:
+                if entry.get("priority", LAZY) == priority:
+                    for size in entry.get("sizes", []):
+                        key = ("font", f"{entry['name']}_{size}")
+                        futures.append(self._submit(key, self._load_font, entry["name"], int(size),
+                                                    pool=self._font_pool))
+        self.logger.info(f"Preloading {len(self._startup)} startup and {len(self._lazy)} lazy asset(s) "
+                         f"on {self.workers} image thread(s) and one font thread.")
+        return self
+
+    def _submit(self, key: tuple, loader: Callable, *args, pool: Optional[ThreadPoolExecutor] = None) -> Future:
+        future = (pool or self._pool).submit(loader, *args)
+        future.asset_name = key[1]
+        AssetLoader._pending[key] = future
+        future.add_done_callback(lambda f: self._finished(key, f))
+        return future
+
+    def _finished(self, key: tuple, future: Future):
+        try:
+            with self._lock:
+                self.done += 1
+                if future.cancelled():
+                    # Dropped by shutdown(); AssetLoader loads it on demand instead.
+                    self.cancelled += 1
+                    return
+                if future.exception() is not None:
+                    self.failed.append(key[1])
+        finally:
+            AssetLoader._pending.pop(key, None)
+
+    @staticmethod
+    def _load_image(name: str):
+        AssetLoader.store_image(name, AssetLoader._decode_image(name))
+
+    @staticmethod
+    def _load_font(name: str, size: int):
+        AssetLoader.store_font(name, size, AssetLoader._load_font(name, size))
+
+    def wait_startup(self, progress: Optional[ProgressCallback] = None, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until the startup assets are loaded, reporting each one as it finishes.
+
+        Args:
+            progress (Optional[ProgressCallback]): Called as progress(loaded, total, name)
+                                                   for each startup asset.
+            timeout (Optional[float]): Seconds to wait in total.
+
+        Returns:
+            bool: True if every startup asset finished (successfully or not) in time.
+        """
+        from concurrent.futures import as_completed, TimeoutError as FutureTimeout
+
+        total = len(self._startup)
+        try:
+            for loaded, future in enumerate(as_completed(self._startup, timeout=timeout), start=1):
+                if progress is not None:
+                    progress(loaded, total, future.asset_name)
+        except FutureTimeout:
+            self.logger.warning(f"Startup assets still loading after {timeout}s; continuing.")
+            return False
+        if self.failed:
+            self.logger.warning(f"Failed to preload: {', '.join(self.failed)}")
+        return True
+
+    def shutdown(self, wait: bool = False):
+        """Stops the pools; with wait=False, lazy assets not yet started are dropped (and loaded on demand)."""
+        for pool in (self._pool, self._font_pool):
+            if pool is not None:
+                pool.shutdown(wait=wait, cancel_futures=not wait)
+        self._pool = None
+        self._font_pool = None
@@ -30,17 +30,21 @@ class Camera:
         self.half_w = self.screen_width // 2
         self.half_h = self.screen_height // 2
 
-    def update(self, dt: float):
+    def update(self, dt: float, center=None):
         """
         Updates the camera's offset to center on the target, clamping to world boundaries.
         
         Args:
             dt (float): Delta time, not directly used here but good practice for updates.
+            center: Optional pixel position to center on instead of the target's rect
+                    (e.g. the target's interpolated render position).
         """
-        if self.target:
+        if center is None and self.target:
+            center = self.target.rect.center
+        if center is not None:
             # Center the camera on the target's position
-            target_x = self.target.rect.centerx - self.half_w
-            target_y = self.target.rect.centery - self.half_h
+            target_x = center[0] - self.half_w
+            target_y = center[1] - self.half_h
             
             # Clamp the camera's position to the world boundaries
             # The camera cannot show an area outside of the world map.
@@ -1,7 +1,8 @@
 # skymind_sim/layer_0_presentation/renderer.py
 import pygame
 import logging
-from typing import Optional
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 
 from skymind_sim.utils.config_loader import ConfigLoader
 # We need Camera for type hinting, but to avoid circular import, use a string
@@ -10,8 +11,19 @@ from skymind_sim.utils.config_loader import ConfigLoader
 class Renderer:
     """Handles all drawing operations for the simulation."""
 
-    def __init__(self):
-        """Initializes Pygame, the display window, and the font."""
+    # Above this many dirty rectangles a single full flip is cheaper than a partial update.
+    MAX_DIRTY_RECTS = 4096
+    # Side of a cached static-layer tile in pixels; memory stays bounded whatever the map size.
+    STATIC_TILE_SIZE = 512
+
+    def __init__(self, surface: Optional[pygame.Surface] = None):
+        """
+        Initializes Pygame, the display window, and the font.
+
+        Args:
+            surface (Optional[pygame.Surface]): Draw onto this off-screen surface instead of
+                                                opening a window (e.g. for frame capture).
+        """
         self.logger = logging.getLogger(__name__)
 
         window_config = ConfigLoader.get('window')
@@ -20,42 +32,133 @@ class Renderer:
         self.caption = window_config.get('caption', 'SkyMind Drone Simulation')
         self.bg_color = tuple(window_config.get('bg_color', [0, 0, 0]))
 
-        # Initialize Pygame and the display window
-        pygame.init()
-        pygame.display.set_caption(self.caption)
-        self.screen = pygame.display.set_mode((self.width, self.height))
-        self.logger.info(f"Display initialized with size {self.width}x{self.height}.")
-        
+        if surface is not None:
+            self.screen = surface
+            self.width, self.height = surface.get_size()
+            self.to_display = False
+            self.logger.info(f"Off-screen renderer initialized with size {self.width}x{self.height}.")
+        else:
+            # Initialize Pygame and the display window
+            pygame.init()
+            pygame.display.set_caption(self.caption)
+            self.screen = pygame.display.set_mode((self.width, self.height))
+            self.to_display = True
+            self.logger.info(f"Display initialized with size {self.width}x{self.height}.")
+
         self.camera: Optional['Camera'] = None
 
+        # Static layer cache (grid lines + obstacles) as LRU tiles, dropped when the grid changes
+        self._tiles: "OrderedDict[Tuple[int, int], pygame.Surface]" = OrderedDict()
+        self._static_key = None
+        tile = self.STATIC_TILE_SIZE
+        # Enough tiles for the viewport on either side of a scroll
+        self._tile_limit = 2 * (-(-self.width // tile) + 1) * (-(-self.height // tile) + 1)
+        # Camera offset and drone rects of the previous frame, for dirty-rect updates
+        self._last_offset = None
+        self._dirty: List[pygame.Rect] = []
+
     def set_camera(self, camera: 'Camera'):
         """Sets the camera object for the renderer."""
         self.camera = camera
         self.logger.info("Camera has been set for the renderer.")
 
-    def render(self, world):
+    def invalidate(self):
+        """Forces the static layer to be rebuilt and the next frame to be fully redrawn."""
+        self._tiles.clear()
+        self._static_key = None
+        self._last_offset = None
+
+    def _sync_static(self, grid):
+        """Drops the cached static tiles if the grid changed since they were rendered."""
+        key = (id(grid), grid.version, grid.cell_size)
+        if key != self._static_key:
+            self._tiles.clear()
+            self._static_key = key
+            self._last_offset = None
+            self.logger.debug(f"Static layer invalidated for grid version {grid.version}.")
+
+    def _static_tile(self, grid, tx: int, ty: int) -> pygame.Surface:
+        tile = self._tiles.get((tx, ty))
+        if tile is None:
+            size = self.STATIC_TILE_SIZE
+            tile = grid.render_static_layer(self.bg_color, pygame.Rect(tx * size, ty * size, size, size))
+            self._tiles[(tx, ty)] = tile
+            while len(self._tiles) > self._tile_limit:
+                self._tiles.popitem(last=False)
+        else:
+            self._tiles.move_to_end((tx, ty))
+        return tile
+
+    def _draw_static(self, grid, areas: List[pygame.Rect], offset: Tuple[int, int]):
+        """Copies the static layer under the given screen areas onto the screen, tile by tile."""
+        world_rect = pygame.Rect((0, 0), grid.get_world_size_in_pixels())
+        size = self.STATIC_TILE_SIZE
+        batch = []
+        for rect in areas:
+            area = rect.move(offset)
+            if not world_rect.contains(area):
+                self.screen.fill(self.bg_color, rect)
+            clip = area.clip(world_rect)
+            if not clip.width or not clip.height:
+                continue
+            for ty in range(clip.top // size, (clip.bottom - 1) // size + 1):
+                for tx in range(clip.left // size, (clip.right - 1) // size + 1):
+                    tile = self._static_tile(grid, tx, ty)
+                    part = clip.clip(pygame.Rect((tx * size, ty * size), tile.get_size()))
+                    batch.append((tile, (part.left - offset[0], part.top - offset[1]),
+                                  part.move(-tx * size, -ty * size)))
+        self.screen.blits(batch, doreturn=False)
+
+    def render(self, world, camera_offset=None):
         """
         Renders the entire simulation world for one frame.
 
+        The grid lines and obstacles come from a static layer cached as
+        fixed-size tiles (only the tiles near the viewport are kept). When the
+        camera has not moved since the last frame, only the areas covered by
+        drones in the previous and current frame are restored and pushed to
+        the display; otherwise the visible tiles of the static layer are
+        blitted in one call and the whole display is flipped.
+
         Args:
-            world: The World object containing all game elements.
+            world: The World object containing all game elements, or any object with a
+                   `grid` and a `draw_entities(surface, camera_offset)` method (e.g. a SnapshotView).
+            camera_offset: Offset to draw at instead of the camera's (e.g. from a snapshot).
         """
-        if not self.camera:
+        if camera_offset is None and not self.camera:
             self.logger.error("Renderer cannot render without a camera.")
             return
 
-        # 1. Fill the background
-        self.screen.fill(self.bg_color)
+        # 1. Get the camera offset (whole pixels, so the static layer and sprites line up)
+        raw_offset = self.camera.get_offset() if camera_offset is None else camera_offset
+        offset = (int(raw_offset[0]), int(raw_offset[1]))
+        camera_offset = pygame.math.Vector2(offset)
+        self._sync_static(world.grid)
+
+        if offset != self._last_offset:
+            # 2a. Full frame: background, then the visible window of the static layer
+            self._draw_static(world.grid, [self.screen.get_rect()], offset)
+            rects = world.draw_entities(self.screen, camera_offset)
+            self._present(None)
+        else:
+            # 2b. Same view: erase last frame's drones from the static layer, redraw drones
+            previous = self._dirty
+            self._draw_static(world.grid, previous, offset)
+            rects = world.draw_entities(self.screen, camera_offset)
+            self._present(previous + rects)
 
-        # 2. Get the camera offset
-        camera_offset = self.camera.get_offset()
+        self._dirty = rects
+        self._last_offset = offset
 
-        # 3. Draw the world (which will draw the grid and entities)
-        world.draw(self.screen, camera_offset)
+    def _present(self, rects: Optional[List[pygame.Rect]]):
+        """Pushes the frame to the display: the given areas only, or everything for None."""
+        if not self.to_display:
+            return
+        if rects is None or len(rects) > self.MAX_DIRTY_RECTS:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
 
-        # 4. Update the display
-        pygame.display.flip()
-        
     def get_screen_size(self) -> tuple[int, int]:
         """Returns the screen size (width, height)."""
         return self.width, self.height
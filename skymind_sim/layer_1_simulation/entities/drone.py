@@ -3,45 +3,135 @@
 import pygame
 from pygame.math import Vector2
 import logging
+from typing import Optional
 
 from skymind_sim.utils.config_loader import ConfigLoader
+from skymind_sim.layer_1_simulation.entities.fleet import FleetState
 from skymind_sim.layer_0_presentation.asset_loader import AssetLoader
 
 class Drone:
-    """Represents a drone in the simulation."""
+    """
+    Represents a drone in the simulation.
 
-    def __init__(self, drone_id: str, grid, position=(0.0, 0.0)):
+    When created with a `FleetState`, the drone owns no kinematic state of its
+    own: `position`, `velocity`, `speed` and `energy` are views onto its row in
+    the fleet arrays, which `World.update` integrates for all drones at once.
+    Vectors returned by these properties are copies, so assign them back
+    (e.g. `drone.position += offset`) instead of mutating them in place.
+    """
+
+    def __init__(self, drone_id: str, grid, position=(0.0, 0.0), fleet: Optional[FleetState] = None,
+                 headless: bool = False):
         self.logger = logging.getLogger(__name__)
         self.id = drone_id
         self.grid = grid
-        
-        # Position and Movement
-        self.position = Vector2(position)  # Grid coordinates (can be float for smooth movement)
-        self.velocity = Vector2(0, 0)
-        
+
         # Load drone-specific configuration
         config = ConfigLoader.get('drone')
-        self.speed = config.get('speed', 5.0)  # Grid units per second
+        speed = config.get('speed', 5.0)  # Grid units per second
+
+        # Position and Movement
+        self._fleet = fleet
+        if fleet is not None:
+            self._index = fleet.add((float(position[0]), float(position[1])), speed)
+        else:
+            self._index = None
+            self._position = Vector2(position)  # Grid coordinates (can be float for smooth movement)
+            self._velocity = Vector2(0, 0)
+            self._speed = speed
+            self._energy = float('inf')
+        
         self.image_name = config.get('default_image', 'drone_2.png')
         fallback_radius = config.get('fallback_radius', 15.0)
 
+        if headless:
+            # Headless drones carry no surface; the rect is kept for camera/collision queries.
+            self.image = None
+            self._rect = pygame.Rect(0, 0, int(self.grid.cell_size[0]), int(self.grid.cell_size[1]))
+            self._rect.center = self.grid.grid_to_pixel(self.position)
+            self.logger.debug(f"Headless drone '{self.id}' initialized at grid_pos {list(self.position)}.")
+            return
+
         try:
-            # Load the primary image
-            original_image = AssetLoader.get_image(self.image_name)
-            # Scale the image to fit the cell size
-            self.image = pygame.transform.scale(original_image, self.grid.cell_size)
+            # The image scaled to the cell size, shared by all drones (treat it as read-only)
+            self.image = AssetLoader.get_scaled(self.image_name, self.grid.cell_size)
         except Exception as e:
             self.logger.warning(
                 f"Failed to load image '{self.image_name}' for drone '{self.id}'. Using a placeholder. Error: {e}"
             )
-            # Create a magenta placeholder surface if image fails to load
+            # Use a shared magenta placeholder surface if image fails to load
             placeholder_size = (int(self.grid.cell_size[0] * 0.8), int(self.grid.cell_size[1] * 0.8))
-            self.image = pygame.Surface(placeholder_size)
-            self.image.fill((255, 0, 255))  # Magenta color
+            self.image = AssetLoader.get_placeholder(placeholder_size, (255, 0, 255))  # Magenta color
         
-        self.rect = self.image.get_rect()
+        self._rect = self.image.get_rect()
         self.logger.info(f"Drone '{self.id}' initialized at grid_pos {list(self.position)}.")
 
+    @property
+    def fleet_index(self) -> Optional[int]:
+        """Row of this drone in the fleet arrays, or None for a standalone drone."""
+        return self._index
+
+    @property
+    def position(self) -> Vector2:
+        if self._fleet is None:
+            return self._position
+        x, y = self._fleet.positions[self._index]
+        return Vector2(float(x), float(y))
+
+    @position.setter
+    def position(self, value):
+        if self._fleet is None:
+            self._position = Vector2(value)
+        else:
+            self._fleet.positions[self._index] = (float(value[0]), float(value[1]))
+
+    @property
+    def velocity(self) -> Vector2:
+        if self._fleet is None:
+            return self._velocity
+        vx, vy = self._fleet.velocities[self._index]
+        return Vector2(float(vx), float(vy))
+
+    @velocity.setter
+    def velocity(self, value):
+        if self._fleet is None:
+            self._velocity = Vector2(value)
+        else:
+            self._fleet.velocities[self._index] = (float(value[0]), float(value[1]))
+
+    @property
+    def speed(self) -> float:
+        return self._speed if self._fleet is None else float(self._fleet.speeds[self._index])
+
+    @speed.setter
+    def speed(self, value: float):
+        if self._fleet is None:
+            self._speed = value
+        else:
+            self._fleet.speeds[self._index] = value
+
+    @property
+    def energy(self) -> float:
+        return self._energy if self._fleet is None else float(self._fleet.energy[self._index])
+
+    @energy.setter
+    def energy(self, value: float):
+        if self._fleet is None:
+            self._energy = value
+        else:
+            self._fleet.energy[self._index] = value
+
+    @property
+    def rect(self) -> pygame.Rect:
+        # Fleet drones are not updated one by one, so centre the rect lazily.
+        if self._fleet is not None:
+            self._rect.center = self.grid.grid_to_pixel(self.position)
+        return self._rect
+
+    @rect.setter
+    def rect(self, value: pygame.Rect):
+        self._rect = value
+
     def move(self, direction_intent: Vector2):
         """
         Sets the drone's velocity based on a direction intent vector.
@@ -61,7 +151,7 @@ class Drone:
         
         # Update the rect for rendering
         pixel_pos = self.grid.grid_to_pixel(self.position)
-        self.rect.center = pixel_pos
+        self._rect.center = pixel_pos
 
     def draw(self, surface: pygame.Surface, camera_offset: Vector2):
         """
@@ -70,7 +160,12 @@ class Drone:
         Args:
             surface (pygame.Surface): The surface to draw on (usually the screen).
             camera_offset (Vector2): The offset calculated by the camera.
+
+        Returns:
+            Optional[pygame.Rect]: The screen area that was touched, or None for a headless drone.
         """
+        if self.image is None:
+            return None
         # Adjust the drone's rect position by the camera offset for rendering
         draw_rect = self.rect.move(-camera_offset)
-        surface.blit(self.image, draw_rect)
+        return surface.blit(self.image, draw_rect)
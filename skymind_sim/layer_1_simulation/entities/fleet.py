@@ -0,0 +1,124 @@
+# skymind_sim/layer_1_simulation/entities/fleet.py
+
+import logging
+import numpy as np
+from typing import Sequence
+
+
+class FleetState:
+    """
+    Structure-of-arrays store for the kinematic state of every drone.
+
+    Positions and velocities are kept in contiguous (N, 2) float64 arrays
+    (grid units and grid units per second), with per-drone speed, energy and
+    an active flag alongside. `integrate` advances the whole fleet in a
+    single vectorized call, and `Drone` objects created with a fleet act as
+    lightweight views onto their row.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.logger = logging.getLogger(__name__)
+        capacity = max(int(capacity), 1)
+        self.size = 0
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float64)
+        self.speeds = np.zeros(capacity, dtype=np.float64)
+        self.energy = np.zeros(capacity, dtype=np.float64)
+        self.active = np.zeros(capacity, dtype=bool)
+
+    @property
+    def capacity(self) -> int:
+        """Returns the number of rows currently allocated."""
+        return len(self.positions)
+
+    def _grow(self, required: int):
+        """Doubles the allocated rows until `required` drones fit."""
+        capacity = self.capacity
+        while capacity < required:
+            capacity *= 2
+        if capacity == self.capacity:
+            return
+        for name in ("positions", "velocities", "speeds", "energy", "active"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+        self.logger.debug(f"FleetState grown to {capacity} rows.")
+
+    def add(self, position: Sequence[float], speed: float, energy: float = np.inf) -> int:
+        """
+        Adds a drone to the fleet.
+
+        Args:
+            position (Sequence[float]): Initial (x, y) grid position.
+            speed (float): Maximum speed in grid units per second.
+            energy (float): Initial energy budget (inf for unlimited).
+
+        Returns:
+            int: The row index of the new drone.
+        """
+        self._grow(self.size + 1)
+        index = self.size
+        self.positions[index] = position
+        self.velocities[index] = 0.0
+        self.speeds[index] = speed
+        self.energy[index] = energy
+        self.active[index] = True
+        self.size += 1
+        return index
+
+    def add_many(self, positions: np.ndarray, speed: float, energy: float = np.inf) -> np.ndarray:
+        """
+        Adds many drones at once.
+
+        Args:
+            positions (np.ndarray): Array of shape (N, 2) with initial grid positions.
+            speed (float): Maximum speed shared by the new drones.
+            energy (float): Initial energy budget shared by the new drones.
+
+        Returns:
+            np.ndarray: The row indices of the new drones.
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        count = len(positions)
+        self._grow(self.size + count)
+        rows = np.arange(self.size, self.size + count)
+        self.positions[rows] = positions
+        self.velocities[rows] = 0.0
+        self.speeds[rows] = speed
+        self.energy[rows] = energy
+        self.active[rows] = True
+        self.size += count
+        return rows
+
+    def integrate(self, dt: float, energy_per_unit: float = 0.0):
+        """
+        Advances every active drone by one time step.
+
+        Args:
+            dt (float): Time step in seconds.
+            energy_per_unit (float): Energy drained per grid unit travelled. Drones
+                                     that run out of energy stop moving.
+        """
+        n = self.size
+        if n == 0:
+            return
+        moving = self.active[:n] & (self.energy[:n] > 0)
+        step = self.velocities[:n] * dt
+        step[~moving] = 0.0
+        self.positions[:n] += step
+        if energy_per_unit:
+            drained = np.hypot(step[:, 0], step[:, 1]) * energy_per_unit
+            np.maximum(self.energy[:n] - drained, 0.0, out=self.energy[:n])
+
+    def set_velocities(self, directions: np.ndarray):
+        """
+        Sets every drone's velocity from an (N, 2) array of direction intents,
+        scaled by each drone's speed.
+        """
+        n = self.size
+        self.velocities[:n] = np.asarray(directions, dtype=np.float64).reshape(n, 2) * self.speeds[:n, None]
+
+    def pixel_positions(self, cell_size: Sequence[float]) -> np.ndarray:
+        """Returns the (N, 2) pixel positions of all drones for the given cell size."""
+        return self.positions[:self.size] * np.asarray(cell_size, dtype=np.float64)
@@ -3,29 +3,50 @@
 # ============================================
 # -*- coding: utf-8 -*-
 import logging
+from collections import defaultdict, deque
+from typing import Optional
+import numpy as np
 from skymind_sim.layer_3_intelligence.pathfinding.path_planner import PathPlanner
 from skymind_sim.layer_1_simulation.world.world import World
 
 
 class DroneMover:
-    def __init__(self, world: World):
+    def __init__(self, world: World, algorithm: str = "A_STAR", cache_size: int = 1024,
+                 use_flow_fields: bool = False, history_limit: Optional[int] = 1024):
         # دریافت منبع موانع و نقشه
         self.world = world
-        self.path_planner = PathPlanner(world.grid_map, obstacles=world.obstacles)
+        # پهپادهایی که مبدا/مقصد مشترک دارند (مثل ایستگاه شارژ) از کش مسیر استفاده می‌کنند
+        self.path_planner = PathPlanner(algorithm, cache_size=cache_size)
+        # در این حالت پهپادهای با مقصد مشترک گام بعدی را از یک میدان جریان مشترک می‌خوانند
+        self.use_flow_fields = use_flow_fields
+        # سقف طول path_history هر پهپاد (None = نامحدود)؛ مسیر کامل را TelemetryRecorder ثبت می‌کند
+        self.history_limit = history_limit
 
-    def _safe_plan_path(self, start, destination):
+    def _record_history(self, drone):
+        """موقعیت جدید را به path_history اضافه می‌کند و طول آن را به history_limit محدود نگه می‌دارد."""
+        history = drone.path_history
+        if self.history_limit is not None and getattr(history, "maxlen", None) != self.history_limit:
+            history = drone.path_history = deque(history, maxlen=self.history_limit)
+        history.append(drone.position)
+
+    def _safe_plan_path(self, start, destination, agent_id=None):
         """برنامه‌ریزی مسیر امن با بررسی بن‌بست"""
         try:
-            return self.path_planner.plan_path(start, destination)
+            path = self.path_planner.plan_path(self.world.grid, start, destination, agent_id=agent_id)
         except Exception as e:
             logging.error(f"Path planning failed: {e}")
             return [start]
+        return path if path else [start]
 
     def move_drone(self, drone):
         """حرکت مرحله‌ای پهپاد با مدیریت مسیر"""
         if not drone.active or drone.position == drone.destination:
             return
 
+        if self.use_flow_fields:
+            self._move_with_flow_field(drone)
+            return
+
         next_step = None
 
         # اگر مسیر از قبل وجود دارد
@@ -33,7 +54,7 @@ class DroneMover:
             next_step = drone.path[1]
         else:
             # اگر مسیر خالی باشد، مسیر جدید ایجاد کن
-            drone.path = self._safe_plan_path(drone.position, drone.destination)
+            drone.path = self._safe_plan_path(drone.position, drone.destination, drone.id)
             if len(drone.path) > 1:
                 next_step = drone.path[1]
 
@@ -41,9 +62,55 @@ class DroneMover:
         if next_step:
             if not self.world.check_collision(next_step):
                 drone.position = next_step
-                drone.path_history.append(drone.position)  # 🟩 ثبت موقعیت جدید
+                self._record_history(drone)  # 🟩 ثبت موقعیت جدید
                 drone.path.pop(0)
                 logging.debug(f"[{drone.id[:8]}] moved to {next_step}")
             else:
                 drone.collision_avoided += 1
-                drone.path = self._safe_plan_path(drone.position, drone.destination)
+                # با D* Lite فقط بخش آسیب‌دیده مسیر ترمیم می‌شود
+                drone.path = self._safe_plan_path(drone.position, drone.destination, drone.id)
+
+    def _move_with_flow_field(self, drone):
+        """حرکت یک گام با خواندن میدان جریان مشترک مقصد (بدون برنامه‌ریزی مجدد)"""
+        field = self.path_planner.get_flow_field(self.world.grid, drone.destination)
+        next_step = field.next_step(drone.position)
+        if next_step is None:
+            return
+        if not self.world.check_collision(next_step):
+            drone.position = next_step
+            self._record_history(drone)
+            logging.debug(f"[{drone.id[:8]}] moved to {next_step}")
+        else:
+            drone.collision_avoided += 1
+
+    def move_drones(self, drones):
+        """
+        حرکت یک گام برای همه پهپادها. در حالت میدان جریان، پهپادها بر اساس مقصد
+        گروه‌بندی می‌شوند و گام بعدی هر گروه با یک فراخوانی برداری محاسبه می‌شود.
+        """
+        if not self.use_flow_fields:
+            for drone in drones:
+                self.move_drone(drone)
+            return
+
+        groups = defaultdict(list)
+        for drone in drones:
+            if drone.active and drone.position != drone.destination:
+                groups[(int(drone.destination[0]), int(drone.destination[1]))].append(drone)
+
+        occupancy = self.world.grid.occupancy
+        for destination, group in groups.items():
+            field = self.path_planner.get_flow_field(self.world.grid, destination)
+            positions = np.array([d.position for d in group], dtype=np.int64).reshape(-1, 2)
+            steps = field.next_steps(positions)
+            moved = np.any(steps != positions, axis=1)
+            blocked = np.zeros(len(group), dtype=bool)
+            blocked[moved] = occupancy[steps[moved, 1], steps[moved, 0]] != 0
+            for drone, step, has_moved, is_blocked in zip(group, steps.tolist(), moved, blocked):
+                if not has_moved:
+                    continue
+                if is_blocked:
+                    drone.collision_avoided += 1
+                    continue
+                drone.position = tuple(step)
+                self._record_history(drone)
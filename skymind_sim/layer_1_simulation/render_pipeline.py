@@ -0,0 +1,173 @@
+# skymind_sim/layer_1_simulation/render_pipeline.py
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+
+@dataclass(frozen=True)
+class FrameSnapshot:
+    """
+    The state one rendered frame needs, published by the simulation thread.
+
+    `positions` and `previous` are read-only (N, 2) arrays of grid positions
+    after the last published step and after the one before it, so the
+    consumer can interpolate between them. They live in a buffer slot that is
+    not written to while the snapshot is held (see `SnapshotBuffer`).
+    `sim_span` is the simulation time between those two states, which covers
+    every step of the batch (and of any skipped publishes) since then.
+    """
+    step: int
+    sim_time: float
+    published_at: float
+    drone_ids: Tuple[str, ...]
+    images: Tuple[Optional[pygame.Surface], ...]
+    positions: np.ndarray
+    previous: np.ndarray
+    camera_offset: Tuple[float, float]
+    previous_camera_offset: Tuple[float, float]
+    sim_span: float = 0.0
+
+    def camera_offset_at(self, alpha: float) -> Tuple[float, float]:
+        """The camera offset `alpha` of the way from the previous snapshot to this one."""
+        (x0, y0), (x1, y1) = self.previous_camera_offset, self.camera_offset
+        return x0 + (x1 - x0) * alpha, y0 + (y1 - y0) * alpha
+
+
+class SnapshotBuffer:
+    """
+    Double-buffered hand-off of FrameSnapshots from the simulation thread to the render thread.
+
+    The producer writes a new snapshot into the slot that is neither the
+    published one nor the one the consumer holds, then publishes it by
+    swapping an index under a lock; the consumer `acquire`s the latest
+    snapshot and `release`s it when the frame is drawn. Neither side ever
+    waits on the other: if the consumer still holds the only free slot, the
+    producer skips that publish and the next one catches up.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._slots: List[Optional[FrameSnapshot]] = [None, None]
+        self._positions = [np.empty((0, 2)), np.empty((0, 2))]
+        self._previous = [np.empty((0, 2)), np.empty((0, 2))]
+        self._front = -1
+        self._reading = -1
+        self._images: Tuple[Optional[pygame.Surface], ...] = ()
+        self._ids: Tuple[str, ...] = ()
+        self.published = 0
+        self.skipped = 0
+
+    def _arrays(self, slot: int, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        if self._positions[slot].shape[0] != count:
+            self._positions[slot] = np.empty((count, 2), dtype=np.float64)
+            self._previous[slot] = np.empty((count, 2), dtype=np.float64)
+        positions, previous = self._positions[slot], self._previous[slot]
+        positions.flags.writeable = True
+        previous.flags.writeable = True
+        return positions, previous
+
+    def publish(self, world, step: int, sim_time: float, camera_offset: Tuple[float, float]) -> bool:
+        """
+        Copies the drawable world state into a free slot and makes it the latest snapshot.
+
+        Called from the simulation thread only.
+
+        Returns:
+            bool: False if the publish was skipped because no slot was free.
+        """
+        with self._lock:
+            front, reading = self._front, self._reading
+        back = 0 if front < 0 else 1 - front
+        if back == reading:
+            self.skipped += 1
+            return False
+
+        drones = world.drones
+        count = len(drones)
+        if len(self._ids) != count:
+            self._ids = tuple(drones)
+            self._images = tuple(drone.image for drone in drones.values())
+        positions, previous = self._arrays(back, count)
+        if world.fleet is not None and world.fleet.size == count:
+            np.copyto(positions, world.fleet.positions[:count])
+        else:
+            for i, drone in enumerate(drones.values()):
+                position = drone.position
+                positions[i] = (position[0], position[1])
+
+        last = self._slots[front] if front >= 0 else None
+        if last is not None and last.positions.shape[0] == count:
+            np.copyto(previous, last.positions)
+            previous_offset = last.camera_offset
+            sim_span = sim_time - last.sim_time
+        else:
+            np.copyto(previous, positions)
+            previous_offset = camera_offset
+            sim_span = 0.0
+        positions.flags.writeable = False
+        previous.flags.writeable = False
+
+        self._slots[back] = FrameSnapshot(step, sim_time, time.perf_counter(), self._ids, self._images,
+                                          positions, previous, tuple(camera_offset), tuple(previous_offset),
+                                          sim_span)
+        with self._lock:
+            self._front = back
+        self.published += 1
+        return True
+
+    def acquire(self) -> Optional[FrameSnapshot]:
+        """Returns the latest snapshot (None before the first publish) and holds it until `release`."""
+        with self._lock:
+            if self._front < 0:
+                return None
+            self._reading = self._front
+            return self._slots[self._reading]
+
+    def release(self):
+        with self._lock:
+            self._reading = -1
+
+
+class SnapshotView:
+    """
+    A read-only stand-in for World that `Renderer.render` can draw from another thread.
+
+    Drones are drawn from a FrameSnapshot, interpolated by `alpha` between its
+    previous and current positions, culled to the viewport with one vectorized
+    test and drawn with a single `Surface.blits` call. `grid` is the live grid,
+    used for the cached static layer.
+    """
+
+    def __init__(self, grid, snapshot: FrameSnapshot, alpha: float = 1.0):
+        self.grid = grid
+        self.snapshot = snapshot
+        self.alpha = min(max(alpha, 0.0), 1.0)
+
+    def draw_entities(self, surface: pygame.Surface, camera_offset) -> List[pygame.Rect]:
+        snapshot = self.snapshot
+        if not snapshot.drone_ids:
+            return []
+        cw, ch = self.grid.cell_size
+        positions = snapshot.previous + (snapshot.positions - snapshot.previous) * self.alpha
+        centers = positions * (cw, ch)
+        width, height = surface.get_size()
+        left, top = int(camera_offset[0]), int(camera_offset[1])
+        visible = np.flatnonzero((centers[:, 0] + cw > left) & (centers[:, 0] - cw < left + width)
+                                 & (centers[:, 1] + ch > top) & (centers[:, 1] - ch < top + height))
+        batch = []
+        images = snapshot.images
+        for i in visible.tolist():
+            image = images[i]
+            if image is None:
+                continue
+            rect = image.get_rect()
+            rect.center = (float(centers[i, 0]), float(centers[i, 1]))
+            batch.append((image, rect.move(-left, -top)))
+        if not batch:
+            return []
+        return [rect for rect in surface.blits(batch) if rect]
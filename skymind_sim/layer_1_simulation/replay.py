@@ -0,0 +1,230 @@
+# skymind_sim/layer_1_simulation/replay.py
+
+import json
+import logging
+import random
+import struct
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+MAGIC = b"SKYRPL01"
+
+# One replay record. `a`/`b` hold the payload of the record kind:
+#   KIND_STEP   -> a = dt (written only when dt changes)
+#   KIND_INTENT -> a, b = movement intent x, y (written only when it changes)
+#   KIND_DRAW   -> a = drawn value, b = channel index
+#   KIND_END    -> tick = last step recorded so far (written on every flush)
+RECORD_DTYPE = np.dtype([
+    ("tick", "<i8"),
+    ("kind", "u1"),
+    ("a", "<f8"),
+    ("b", "<f8"),
+])
+
+KIND_STEP = 0
+KIND_INTENT = 1
+KIND_DRAW = 2
+KIND_END = 3
+
+
+class _RecordingRandom(random.Random):
+    """A drop-in replacement for a channel RNG that logs every `random()` draw."""
+
+    def __init__(self, recorder: "ReplayRecorder", channel: int, source: random.Random):
+        super().__init__()
+        self.setstate(source.getstate())
+        self._recorder = recorder
+        self._channel = channel
+
+    def random(self) -> float:
+        value = super().random()
+        self._recorder.record_draw(self._channel, value)
+        return value
+
+
+class _ReplayRandom(random.Random):
+    """Serves the draws of one channel back from a replay log, in order."""
+
+    def __init__(self, values: np.ndarray, channel: int):
+        super().__init__()
+        self._values = values
+        self._cursor = 0
+        self._channel = channel
+
+    def random(self) -> float:
+        if self._cursor >= len(self._values):
+            raise RuntimeError(f"Replay log has no more recorded draws for channel {self._channel}.")
+        value = float(self._values[self._cursor])
+        self._cursor += 1
+        return value
+
+
+class ReplayRecorder:
+    """
+    Records everything that makes a simulation run non-reproducible.
+
+    Per step the recorder logs the time step (only when it changes) and the
+    player's movement intent (only when it changes); attached communication
+    channels log each packet-loss draw. Records are fixed-size binary rows
+    (RECORD_DTYPE) appended to the log after a small JSON header, so a run of
+    millions of ticks with steady input stays a few kilobytes and a crashed
+    run still leaves a usable log up to the last flush. Because steady steps
+    write nothing, every flush also appends a KIND_END record holding the
+    last recorded step, which tells the replay where the run ended.
+    """
+
+    def __init__(self, path: str, meta: Optional[Dict[str, Any]] = None, buffer_size: int = 4096):
+        self.path = path
+        self.tick = 0
+        self._last_step = -1
+        self._end_written = -1
+        self.buffer_size = max(int(buffer_size), 1)
+        self._rows: List[tuple] = []
+        self._last_dt: Optional[float] = None
+        self._last_intent: Optional[tuple] = None
+        self._channels = 0
+        header = json.dumps(meta or {}).encode("utf-8")
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        self._file.write(struct.pack("<I", len(header)))
+        self._file.write(header)
+
+    def attach_channel(self, channel) -> int:
+        """
+        Wraps the channel's RNG so that its draws are logged.
+
+        The wrapped RNG continues from the channel's current state, so seeding is unaffected.
+
+        Returns:
+            int: The channel index; attach channels in the same order when replaying.
+        """
+        index = self._channels
+        channel.rng = _RecordingRandom(self, index, channel.rng)
+        self._channels += 1
+        return index
+
+    def record_step(self, tick: int, dt: float, intent=None):
+        """Logs the start of a step: its time step and the movement intent applied in it."""
+        self.tick = tick
+        self._last_step = max(self._last_step, tick)
+        if dt != self._last_dt:
+            self._append(tick, KIND_STEP, dt, 0.0)
+            self._last_dt = dt
+        if intent is not None:
+            intent = (float(intent[0]), float(intent[1]))
+            if intent != self._last_intent:
+                self._append(tick, KIND_INTENT, intent[0], intent[1])
+                self._last_intent = intent
+
+    def record_draw(self, channel: int, value: float):
+        """Logs one stochastic draw made during the current step."""
+        self._append(self.tick, KIND_DRAW, value, float(channel))
+
+    def _append(self, tick: int, kind: int, a: float, b: float):
+        self._rows.append((tick, kind, a, b))
+        if len(self._rows) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Appends the buffered records, followed by an end marker for the last recorded step, to the log."""
+        if self._file is None:
+            return
+        if self._last_step > self._end_written:
+            self._rows.append((self._last_step, KIND_END, 0.0, 0.0))
+            self._end_written = self._last_step
+        if self._rows:
+            np.array(self._rows, dtype=RECORD_DTYPE).tofile(self._file)
+            self._file.flush()
+            self._rows.clear()
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class ReplayEngine:
+    """
+    Re-drives a Simulation from a replay log.
+
+    Steps before `render_from` are executed without rendering or frame
+    pacing, so reaching a late tick costs only the simulation work itself;
+    from `render_from` on, each step is rendered (if the simulation has a
+    renderer) at the configured frame rate.
+    """
+
+    def __init__(self, path: str):
+        self.logger = logging.getLogger(__name__)
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"'{path}' is not a replay log.")
+            (header_len,) = struct.unpack("<I", f.read(4))
+            self.meta = json.loads(f.read(header_len).decode("utf-8"))
+            records = np.fromfile(f, dtype=RECORD_DTYPE)
+
+        steps = records[records["kind"] == KIND_STEP]
+        intents = records[records["kind"] == KIND_INTENT]
+        draws = records[records["kind"] == KIND_DRAW]
+        self._dt_ticks, self._dt_values = steps["tick"], steps["a"]
+        self._intent_ticks = intents["tick"]
+        self._intent_values = np.stack([intents["a"], intents["b"]], axis=1) if len(intents) else np.zeros((0, 2))
+        self._draws = draws
+        ends = records["tick"][records["kind"] == KIND_END]
+        # A log cut short by a crash may hold records past its last end marker.
+        self.last_tick = int(max(ends.max() if len(ends) else -1, records["tick"].max())) if len(records) else -1
+
+    def attach_channel(self, channel, index: int):
+        """Replaces the channel's RNG with the recorded draws of channel `index`."""
+        values = self._draws["a"][self._draws["b"] == index]
+        channel.rng = _ReplayRandom(values, index)
+
+    def dt_at(self, tick: int) -> Optional[float]:
+        i = int(np.searchsorted(self._dt_ticks, tick, side="right")) - 1
+        return float(self._dt_values[i]) if i >= 0 else None
+
+    def intent_at(self, tick: int) -> tuple:
+        i = int(np.searchsorted(self._intent_ticks, tick, side="right")) - 1
+        return tuple(self._intent_values[i]) if i >= 0 else (0.0, 0.0)
+
+    def run(self, simulation, until_tick: Optional[int] = None, render_from: Optional[int] = None) -> int:
+        """
+        Replays the recorded steps into `simulation`.
+
+        Args:
+            simulation: A freshly built Simulation (same config and map as the recording).
+            until_tick (Optional[int]): Last tick to execute; defaults to the last recorded tick.
+            render_from (Optional[int]): First tick to render; None never renders.
+
+        Returns:
+            int: The number of steps executed.
+        """
+        from pygame.math import Vector2
+
+        until_tick = self.last_tick if until_tick is None else until_tick
+        executed = 0
+        while simulation.should_run and simulation.current_step <= until_tick:
+            tick = simulation.current_step
+            dt = self.dt_at(tick)
+            if dt is None:
+                raise ValueError(f"Replay log has no time step recorded at or before tick {tick}.")
+            rendering = render_from is not None and tick >= render_from and simulation.renderer is not None
+            if rendering:
+                simulation.clock.tick(simulation.fps)
+                if simulation.input_handler is not None and simulation.input_handler.handle_events()["quit"]:
+                    simulation.stop()
+                    break
+            simulation.movement_intent = Vector2(self.intent_at(tick))
+            simulation._update(dt)
+            if rendering:
+                simulation._render()
+            executed += 1
+        self.logger.info(f"Replayed {executed} step(s) up to tick {simulation.current_step - 1}.")
+        return executed
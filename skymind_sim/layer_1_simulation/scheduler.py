@@ -1,45 +1,125 @@
 # path: skymind_sim/layer_1_simulation/scheduler.py
 
-from typing import List, TYPE_CHECKING
-from skymind_sim.utils.config_manager import ConfigManager
+from typing import Dict, List, Optional, TYPE_CHECKING
+from skymind_sim.utils.event_system import Event, EventHandle, EventQueue, EventType
 from skymind_sim.utils.log_manager import LogManager
+from skymind_sim.utils.telemetry import TelemetryRecorder
 
 if TYPE_CHECKING:
     from .entities.drone import Drone
+    from skymind_sim.utils.config_manager import ConfigManager
 
 class Scheduler:
-    """Manages the order and timing of agent actions."""
-    def __init__(self, config_manager: ConfigManager):
+    """
+    Manages the order and timing of agent actions.
+
+    Agents are driven by an event queue instead of being polled: each agent
+    has at most one pending AGENT_STEP event and only runs on the ticks it is
+    scheduled for. The value returned by `agent.step(tick)` decides when it
+    runs next:
+
+    * None          -> the next tick (the classic fixed-tick behaviour),
+    * an int tick   -> that tick (e.g. the end of a straight cruise leg),
+    * Scheduler.SLEEP -> not at all, until `wake()` is called.
+    """
+    SLEEP = object()
+
+    def __init__(self, config_manager: Optional['ConfigManager'] = None):
         self.config_manager = config_manager
         self.logger = LogManager.get_logger(__name__)
         self.current_tick = 0
         self.agents: List['Drone'] = []
+        self.events = EventQueue(start_time=0)
+        self._pending: Dict[int, EventHandle] = {}
+        # Optional TelemetryRecorder sampled after every executed tick
+        self.telemetry: Optional[TelemetryRecorder] = None
         self.logger.info("Scheduler initialized.")
 
     def add(self, agent: 'Drone'):
         """Adds an agent to the scheduler's list to be managed."""
         if agent not in self.agents:
             self.agents.append(agent)
+            self.wake(agent, self.current_tick)
             self.logger.info(f"Agent '{agent.get_id()}' added to the scheduler.")
         else:
             self.logger.warning(f"Attempted to add agent '{agent.get_id()}' which is already in the scheduler.")
 
-    # -- START OF MODIFIED SECTION --
-    def execute_tick(self):
-        """Executes a single time step (tick) for all registered agents."""
-        self.logger.debug(f"Executing tick {self.current_tick} for {len(self.agents)} agents.")
-        
-        if not self.agents:
-            self.logger.debug("No agents in scheduler to execute.")
-            self.current_tick += 1
+    def wake(self, agent: 'Drone', tick: Optional[int] = None) -> EventHandle:
+        """
+        Schedules the agent's next step, replacing any step already pending for it.
+
+        Args:
+            agent: The agent to run.
+            tick (Optional[int]): Tick to run at; defaults to the current tick.
+        """
+        self.cancel(agent)
+        tick = self.current_tick if tick is None else max(int(tick), self.current_tick)
+        handle = self.events.schedule_at(tick, EventType.AGENT_STEP, agent, self._run_agent)
+        self._pending[id(agent)] = handle
+        return handle
+
+    def cancel(self, agent: 'Drone') -> bool:
+        """Cancels the agent's pending step, if any."""
+        handle = self._pending.pop(id(agent), None)
+        return handle.cancel() if handle is not None else False
+
+    def _run_agent(self, event: Event):
+        agent = event.data
+        tick = int(event.timestamp)
+        self._pending.pop(id(agent), None)
+        try:
+            # Pass the current tick to the agent's step method
+            next_tick = agent.step(tick)
+        except Exception as e:
+            self.logger.error(f"Error during agent '{agent.get_id()}' step on tick {tick}: {e}", exc_info=True)
+            next_tick = None
+        if next_tick is self.SLEEP or id(agent) in self._pending:
             return
+        self.wake(agent, tick + 1 if next_tick is None else max(int(next_tick), tick + 1))
 
+    def rewind(self, tick: int):
+        """
+        Moves the scheduler to `tick` (forwards or backwards), e.g. after a snapshot restore.
+
+        Every pending agent step is dropped, the event clock is set to `tick` and
+        each agent is woken at it; other pending events are left untouched.
+        """
+        for agent in self.agents:
+            self.cancel(agent)
+        self.current_tick = int(tick)
+        self.events.now = self.current_tick
         for agent in self.agents:
-            try:
-                # Pass the current tick to the agent's step method
-                agent.step(self.current_tick)
-            except Exception as e:
-                self.logger.error(f"Error during agent '{agent.get_id()}' step on tick {self.current_tick}: {e}", exc_info=True)
-        
+            self.wake(agent, self.current_tick)
+        self.logger.info(f"Scheduler moved to tick {self.current_tick} with {len(self.agents)} agent(s).")
+
+    def execute_tick(self):
+        """Executes a single time step (tick), running only the agents scheduled for it."""
+        self.logger.debug(f"Executing tick {self.current_tick} ({len(self.events)} pending event(s)).")
+        self.events.run_until(self.current_tick)
+        if self.telemetry is not None:
+            self.telemetry.capture(self.current_tick, self.agents)
         self.current_tick += 1
-    # -- END OF MODIFIED SECTION --
+
+    def advance_to_next_event(self) -> Optional[int]:
+        """
+        Skips idle ticks and executes the next tick that has something scheduled.
+
+        Returns:
+            Optional[int]: The executed tick, or None if nothing is scheduled.
+        """
+        next_time = self.events.peek_time()
+        if next_time is None:
+            return None
+        self.current_tick = max(self.current_tick, int(next_time))
+        tick = self.current_tick
+        self.execute_tick()
+        return tick
+
+    def run_until(self, tick: int):
+        """Executes all scheduled work up to and including `tick`, warping over idle ticks."""
+        while True:
+            next_time = self.events.peek_time()
+            if next_time is None or next_time > tick:
+                break
+            self.advance_to_next_event()
+        self.current_tick = max(self.current_tick, tick + 1)
@@ -2,23 +2,68 @@
 
 import pygame
 import logging
+import threading
+import time
+from typing import Optional
+from pygame.math import Vector2
 from skymind_sim.layer_1_simulation.world.world import World
+from skymind_sim.layer_1_simulation.render_pipeline import SnapshotBuffer, SnapshotView
 from skymind_sim.layer_0_presentation.renderer import Renderer
 from skymind_sim.layer_0_presentation.camera import Camera
 from skymind_sim.layer_0_presentation.input_handler import InputHandler
 from skymind_sim.utils.config_loader import ConfigLoader
 
 class Simulation:
-    """Main class to run the simulation and manage the game loop."""
+    """
+    Main class to run the simulation and manage the game loop.
 
-    def __init__(self, config_path=None):
+    In headless mode (`headless=True` or the `headless` key of the simulation
+    config) no display, renderer, camera or drone sprites are created and
+    `run` advances the world with an unthrottled fixed-dt loop, so batch
+    experiments run as fast as the CPU allows on machines without a display.
+
+    In windowed mode simulation and rendering are decoupled: the elapsed frame
+    time (scaled by `time_scale`) is added to an accumulator that is drained in
+    steps of exactly `fixed_dt`, at most `max_steps_per_frame` per frame, and
+    each frame is drawn with drone positions interpolated between the last
+    two steps.
+
+    In threaded mode (`threaded=True` or the `threaded_render` key of the
+    simulation config) the simulation runs on a worker thread and publishes
+    double-buffered FrameSnapshots; the main thread handles input and draws
+    the latest snapshot with `Renderer.render`, so a slow `flip()` never
+    stalls `World.update`. The window and event loop stay on the main thread
+    because SDL requires that on some platforms.
+    """
+
+    def __init__(self, config_path=None, headless: Optional[bool] = None, threaded: Optional[bool] = None):
         self.logger = logging.getLogger(__name__)
         self.logger.info("Initializing Simulation components...")
         
         # Load configurations
         sim_config = ConfigLoader.get('simulation')
         self.fps = sim_config.get('fps', 60)
+        self.fixed_dt = sim_config.get('fixed_dt', 1.0 / self.fps)
+        self.max_steps_per_frame = max(int(sim_config.get('max_steps_per_frame', 5)), 1)
+        self.time_scale = sim_config.get('time_scale', 1.0)
+        self.headless = sim_config.get('headless', False) if headless is None else headless
+        self.threaded = sim_config.get('threaded_render', False) if threaded is None else threaded
         self.should_run = True
+        self.movement_intent = Vector2(0, 0)
+        self.current_step = 0
+        self.sim_time = 0.0
+        # Optional ReplayRecorder that logs the time step and intent of every step
+        self.recorder = None
+
+        if self.headless:
+            self.renderer = None
+            self.world = World(headless=True)
+            self.player_drone = self.world.get_player_drone()
+            self.camera = None
+            self.input_handler = None
+            self.clock = None
+            self.logger.info("Headless simulation initialized successfully.")
+            return
 
         # --- REORDERED INITIALIZATION ---
 
@@ -51,18 +96,144 @@ class Simulation:
         self.clock = pygame.time.Clock()
         self.logger.info("Simulation initialized successfully.")
 
-    def run(self):
-        """Starts the main simulation loop."""
-        self.logger.info("Simulation loop started.")
-        
-        while self.should_run:
-            dt = self.clock.tick(self.fps) / 1000.0
+    def run(self, steps: Optional[int] = None, dt: Optional[float] = None):
+        """
+        Starts the main simulation loop.
+
+        Args:
+            steps (Optional[int]): Number of simulation steps to run; None runs until `stop()`
+                                   is called (or the window is closed).
+            dt (Optional[float]): Fixed time step in seconds. Defaults to `fixed_dt`.
+        """
+        if self.headless:
+            self.run_headless(steps, dt)
+            return
+        if self.threaded:
+            self.run_threaded(steps, dt)
+            return
+
+        step_dt = self.fixed_dt if dt is None else dt
+        self.logger.info(f"Simulation loop started (dt={step_dt}, max {self.max_steps_per_frame} step(s)/frame).")
+        accumulator = 0.0
+        executed = 0
+
+        while self.should_run and (steps is None or executed < steps):
+            frame_time = self.clock.tick(self.fps) / 1000.0
             self._handle_events()
-            self._update(dt)
-            self._render()
+            accumulator += frame_time * self.time_scale
+
+            frame_steps = 0
+            while accumulator >= step_dt and frame_steps < self.max_steps_per_frame \
+                    and (steps is None or executed < steps):
+                self.world.save_previous_positions()
+                self._update(step_dt)
+                accumulator -= step_dt
+                frame_steps += 1
+                executed += 1
+            if accumulator >= step_dt and frame_steps == self.max_steps_per_frame:
+                # The simulation cannot keep up: drop the backlog instead of spiralling.
+                self.logger.debug(f"Dropping {accumulator // step_dt:.0f} step(s) of simulation backlog.")
+                accumulator %= step_dt
+
+            self._render(accumulator / step_dt)
 
         self.logger.info("Simulation loop finished.")
 
+    def run_headless(self, steps: Optional[int] = None, dt: Optional[float] = None):
+        """
+        Advances the simulation with a fixed time step and no rendering or frame pacing.
+
+        Args:
+            steps (Optional[int]): Number of steps to run; None runs until `stop()` is called.
+            dt (Optional[float]): Fixed time step in seconds (defaults to `fixed_dt`).
+        """
+        dt = self.fixed_dt if dt is None else dt
+        self.logger.info(f"Headless loop started (steps={steps}, dt={dt}).")
+        executed = 0
+        while self.should_run and (steps is None or executed < steps):
+            self._update(dt)
+            executed += 1
+        self.logger.info(f"Headless loop finished after {executed} step(s).")
+
+    def step(self, dt: Optional[float] = None):
+        """
+        Advances the simulation by exactly one step, without rendering or logging.
+
+        Meant for drivers that interleave their own per-step work (e.g. batch scenarios).
+
+        Args:
+            dt (Optional[float]): Time step in seconds (defaults to `fixed_dt`).
+        """
+        self._update(self.fixed_dt if dt is None else dt)
+
+    def run_threaded(self, steps: Optional[int] = None, dt: Optional[float] = None):
+        """
+        Runs the simulation on a worker thread while this thread renders published snapshots.
+
+        Args:
+            steps (Optional[int]): Number of simulation steps to run; None runs until `stop()`
+                                   is called (or the window is closed).
+            dt (Optional[float]): Fixed time step in seconds. Defaults to `fixed_dt`.
+        """
+        step_dt = self.fixed_dt if dt is None else dt
+        self.snapshots = SnapshotBuffer()
+        worker = threading.Thread(target=self._simulation_worker, args=(steps, step_dt),
+                                  name="simulation", daemon=True)
+        self.logger.info(f"Threaded loop started (dt={step_dt}).")
+        worker.start()
+        try:
+            while self.should_run and worker.is_alive():
+                self.clock.tick(self.fps)
+                self._handle_events()
+                snapshot = self.snapshots.acquire()
+                if snapshot is None:
+                    continue
+                try:
+                    # One snapshot can cover a batch of steps: interpolate over all of them.
+                    span = snapshot.sim_span if snapshot.sim_span > 0 else step_dt
+                    alpha = (time.perf_counter() - snapshot.published_at) * self.time_scale / span
+                    view = SnapshotView(self.world.grid, snapshot, alpha)
+                    self.renderer.render(view, camera_offset=snapshot.camera_offset_at(view.alpha))
+                finally:
+                    self.snapshots.release()
+        finally:
+            self.should_run = False
+            worker.join()
+        self.logger.info(f"Threaded loop finished after {self.current_step} step(s) "
+                         f"({self.snapshots.published} snapshot(s) published, {self.snapshots.skipped} skipped).")
+
+    def _simulation_worker(self, steps: Optional[int], dt: float):
+        """Simulation thread of `run_threaded`: fixed steps paced to wall time, one snapshot per batch."""
+        interval = dt / self.time_scale if self.time_scale > 0 else dt
+        next_time = time.perf_counter()
+        executed = 0
+        try:
+            while self.should_run and (steps is None or executed < steps):
+                now = time.perf_counter()
+                if now < next_time:
+                    time.sleep(min(next_time - now, 0.005))
+                    continue
+                batch = 0
+                while next_time <= now and batch < self.max_steps_per_frame and (steps is None or executed < steps):
+                    self._update(dt)
+                    next_time += interval
+                    batch += 1
+                    executed += 1
+                if next_time <= now:
+                    # The simulation cannot keep up: drop the backlog instead of spiralling.
+                    next_time = now
+                self.snapshots.publish(self.world, self.current_step, self.sim_time, self._camera_offset())
+        except Exception as e:
+            self.logger.error(f"Simulation thread stopped on step {self.current_step}: {e}", exc_info=True)
+
+    def _camera_offset(self):
+        """Moves the camera to the player's current position and returns its offset."""
+        if not self.camera:
+            return (0.0, 0.0)
+        self.camera.update(0.0)
+        offset = self.camera.get_offset()
+        return (float(offset.x), float(offset.y))
+
     def _handle_events(self):
         """Processes user input and other events."""
         events_result = self.input_handler.handle_events()
@@ -74,15 +245,30 @@ class Simulation:
 
     def _update(self, dt: float):
         """Updates the state of all simulation objects."""
+        if self.recorder is not None:
+            self.recorder.record_step(self.current_step, dt, self.movement_intent)
         if self.player_drone:
             self.player_drone.move(self.movement_intent)
         
         self.world.update(dt)
-        self.camera.update(dt)
+        self.current_step += 1
+        self.sim_time += dt
+
+    def _render(self, alpha: float = 1.0):
+        """
+        Renders the simulation state to the screen.
 
-    def _render(self):
-        """Renders the simulation state to the screen."""
-        self.renderer.render(self.world)
+        Args:
+            alpha (float): Fraction of a step elapsed since the last update; drones and
+                           the camera are drawn this far between their last two positions.
+        """
+        if self.renderer:
+            self.world.render_alpha = alpha
+            if self.camera:
+                target = self.camera.target
+                center = self.world.grid.grid_to_pixel(self.world.render_position(target)) if target else None
+                self.camera.update(0.0, center)
+            self.renderer.render(self.world)
 
     def stop(self):
         """Stops the simulation."""
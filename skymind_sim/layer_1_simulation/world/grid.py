@@ -1,30 +1,83 @@
 # skymind_sim/layer_1_simulation/world/grid.py
 
+import math
 import pygame
 import logging
-from typing import Tuple
+import numpy as np
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from skymind_sim.utils.config_loader import ConfigLoader
 
+# Values stored in the occupancy array.
+FREE = 0
+BLOCKED = 1
+
+# Number of obstacle-layer changes remembered for incremental planners.
+CHANGE_JOURNAL_SIZE = 256
+
+
+class Cell:
+    """
+    A lightweight, on-demand view of a single grid cell used by the classic
+    object-based planners. Cells are created lazily by `Grid.get_cell` and
+    are discarded by `Grid.reset_pathfinding_data`, so the grid never holds
+    one Python object per cell.
+    """
+    __slots__ = ("position", "is_obstacle", "g_score", "f_score")
+
+    def __init__(self, position: Tuple[int, int], is_obstacle: bool):
+        self.position = position
+        self.is_obstacle = is_obstacle
+        self.g_score = math.inf
+        self.f_score = math.inf
+
+    def __lt__(self, other: "Cell") -> bool:
+        # Used by heapq to break ties between equal f_scores.
+        return self.f_score < other.f_score
+
+    def __repr__(self):
+        return f"Cell(position={self.position}, is_obstacle={self.is_obstacle})"
+
+
 class Grid:
     """
     Represents the logical and visual grid of the simulation world.
+
+    The source of truth for the map is `occupancy`, a compact uint8 array of
+    shape (height, width) indexed as [y, x], where non-zero means blocked.
+    An optional float32 `cost` layer of the same shape holds per-cell
+    traversal costs. `version` is incremented every time the obstacle layer
+    changes so that planners and caches can detect stale data, and a short
+    journal of the changed cells lets incremental planners repair their
+    search state instead of starting over (see `changes_since`).
     """
-    def __init__(self):
+    def __init__(self, width: Optional[int] = None, height: Optional[int] = None,
+                 cell_size: Optional[Tuple[int, int]] = None):
         self.logger = logging.getLogger(__name__)
 
         grid_config = ConfigLoader.get('grid')
-        self.width = grid_config.get('width_in_cells', 50)  # World width in grid cells
-        self.height = grid_config.get('height_in_cells', 40) # World height in grid cells
-        cell_w = grid_config.get('cell_width_pixels', 30)
-        cell_h = grid_config.get('cell_height_pixels', 30)
-        self.cell_size = (cell_w, cell_h)
+        self.width = width if width is not None else grid_config.get('width_in_cells', 50)  # World width in grid cells
+        self.height = height if height is not None else grid_config.get('height_in_cells', 40) # World height in grid cells
+        if cell_size is None:
+            cell_size = (grid_config.get('cell_width_pixels', 30), grid_config.get('cell_height_pixels', 30))
+        self.cell_size = tuple(cell_size)
         self.grid_line_color = tuple(grid_config.get('line_color', [40, 40, 40]))
+        self.obstacle_color = tuple(grid_config.get('obstacle_color', [90, 90, 110]))
         
         # Calculate total world size in pixels
         self.world_width_pixels = self.width * self.cell_size[0]
         self.world_height_pixels = self.height * self.cell_size[1]
 
+        # Occupancy and (optional) cost layers
+        self.occupancy = np.zeros((self.height, self.width), dtype=np.uint8)
+        self.cost: Optional[np.ndarray] = None
+        self.version = 0
+        self._journal: deque = deque(maxlen=CHANGE_JOURNAL_SIZE)
+
+        # Cells handed out to object-based planners since the last reset
+        self._cells: Dict[Tuple[int, int], Cell] = {}
+
         self.logger.info(f"Grid initialized with dimensions {self.width}x{self.height} and cell size {self.cell_size}.")
 
     def get_world_size_in_cells(self) -> Tuple[int, int]:
@@ -52,7 +105,245 @@ class Grid:
         gx = int(pixel_pos[0] // self.cell_size[0])
         gy = int(pixel_pos[1] // self.cell_size[1])
         return gx, gy
-        
+
+    # ------------------------------------------------------------------
+    # Occupancy queries
+    # ------------------------------------------------------------------
+    def in_bounds(self, x: int, y: int) -> bool:
+        """Returns True if (x, y) lies inside the grid."""
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def is_obstacle(self, x: int, y: int) -> bool:
+        """Returns True if the cell at (x, y) is blocked. Out-of-bounds cells count as blocked."""
+        if not self.in_bounds(x, y):
+            return True
+        return bool(self.occupancy[y, x])
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        """Returns True if the cell at (x, y) is inside the grid and not blocked."""
+        return not self.is_obstacle(x, y)
+
+    def get_cost(self, x: int, y: int) -> float:
+        """Returns the traversal cost of the cell at (x, y), or 1.0 if no cost layer is set."""
+        if self.cost is None:
+            return 1.0
+        return float(self.cost[y, x])
+
+    # ------------------------------------------------------------------
+    # Obstacle stamping
+    # ------------------------------------------------------------------
+    def _mark_changed(self, cells: Optional[np.ndarray] = None):
+        """
+        Bumps the obstacle version, journals the changed cells and drops any cached Cell views.
+
+        Args:
+            cells (Optional[np.ndarray]): Flat indices (y * width + x) of the changed cells,
+                                          or None if the change is too broad to track.
+        """
+        if cells is not None and cells.size > (self.width * self.height) // 4:
+            cells = None
+        self.version += 1
+        self._journal.append((self.version, cells))
+        self._cells.clear()
+
+    def changes_since(self, version: int) -> Optional[np.ndarray]:
+        """
+        Returns the flat indices of all cells changed after `version`.
+
+        Returns:
+            Optional[np.ndarray]: Unique flat cell indices (possibly empty), or None if
+                                  the journal cannot account for every change since
+                                  `version` and callers must rebuild from scratch.
+        """
+        if version == self.version:
+            return np.empty(0, dtype=np.intp)
+        if version > self.version:
+            return None
+        pending = [entry for entry in self._journal if entry[0] > version]
+        expected = range(version + 1, self.version + 1)
+        if len(pending) != len(expected) or any(v != e for (v, _), e in zip(pending, expected)):
+            return None
+        if any(cells is None for _, cells in pending):
+            return None
+        return np.unique(np.concatenate([cells for _, cells in pending]))
+
+    def set_obstacle(self, x: int, y: int, blocked: bool = True):
+        """
+        Marks a single cell as blocked or free.
+
+        Args:
+            x (int): Cell column.
+            y (int): Cell row.
+            blocked (bool): True to block the cell, False to clear it.
+        """
+        if not self.in_bounds(x, y):
+            self.logger.warning(f"Ignoring obstacle outside the grid at ({x}, {y}).")
+            return
+        value = BLOCKED if blocked else FREE
+        if self.occupancy[y, x] != value:
+            self.occupancy[y, x] = value
+            self._mark_changed(np.array([y * self.width + x], dtype=np.intp))
+
+    def stamp_positions(self, positions: Iterable[Sequence[int]], blocked: bool = True) -> int:
+        """
+        Marks many cells at once using vectorized indexing.
+
+        `version` only changes (and the change is only journaled) if at least
+        one cell actually changed, so re-stamping the same cells every tick
+        keeps path caches and flow fields valid.
+
+        Args:
+            positions (Iterable[Sequence[int]]): (x, y) cell coordinates.
+            blocked (bool): True to block the cells, False to clear them.
+
+        Returns:
+            int: The number of in-bounds cells that were stamped.
+        """
+        coords = np.asarray(list(positions), dtype=np.intp).reshape(-1, 2)
+        if coords.size == 0:
+            return 0
+        xs, ys = coords[:, 0], coords[:, 1]
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        if not inside.all():
+            self.logger.warning(f"Ignoring {int((~inside).sum())} obstacle cell(s) outside the grid.")
+        value = BLOCKED if blocked else FREE
+        xs, ys = xs[inside], ys[inside]
+        differs = self.occupancy[ys, xs] != value
+        if differs.any():
+            self.occupancy[ys, xs] = value
+            self._mark_changed(np.unique(ys[differs] * self.width + xs[differs]))
+        return int(inside.sum())
+
+    def add_obstacle(self, obstacle) -> int:
+        """Stamps all cells of an `Obstacle` into the occupancy array."""
+        return self.stamp_positions(obstacle.get_positions())
+
+    def stamp_rectangles(self, rects: Iterable[Sequence[float]], in_pixels: bool = False,
+                         blocked: bool = True) -> int:
+        """
+        Marks axis-aligned rectangles as blocked (or free).
+
+        Like `stamp_positions`, this only bumps `version` if a cell actually changed.
+
+        Args:
+            rects (Iterable[Sequence[float]]): (x, y, width, height) tuples.
+            in_pixels (bool): If True the rectangles are given in world pixels and
+                              every cell they touch is stamped; otherwise in cells.
+            blocked (bool): True to block the cells, False to clear them.
+
+        Returns:
+            int: The number of rectangles that overlapped the grid.
+        """
+        value = BLOCKED if blocked else FREE
+        stamped = 0
+        changed = []
+        for x, y, w, h in rects:
+            if in_pixels:
+                x0 = int(math.floor(x / self.cell_size[0]))
+                y0 = int(math.floor(y / self.cell_size[1]))
+                x1 = int(math.ceil((x + w) / self.cell_size[0]))
+                y1 = int(math.ceil((y + h) / self.cell_size[1]))
+            else:
+                x0, y0, x1, y1 = int(x), int(y), int(x + w), int(y + h)
+            x0, y0 = max(x0, 0), max(y0, 0)
+            x1, y1 = min(x1, self.width), min(y1, self.height)
+            if x0 >= x1 or y0 >= y1:
+                continue
+            region = self.occupancy[y0:y1, x0:x1]
+            differs = region != value
+            if differs.any():
+                changed.append(np.add.outer(np.arange(y0, y1) * self.width, np.arange(x0, x1))[differs])
+                region[...] = value
+            stamped += 1
+        if changed:
+            self._mark_changed(np.unique(np.concatenate(changed)))
+        return stamped
+
+    def load_obstacles_from_map(self, map_data: dict) -> int:
+        """
+        Stamps the obstacle rectangles of a JSON map from `data/maps`.
+
+        Supported entries are `[x, y, w, h]` lists and `{"x", "y", "width", "height"}`
+        objects (both in pixels), and `{"position": [x, y], "size": [w, h]}` objects
+        (in cells).
+
+        Returns:
+            int: The number of rectangles that overlapped the grid.
+        """
+        pixel_rects: List[Tuple[float, float, float, float]] = []
+        cell_rects: List[Tuple[float, float, float, float]] = []
+        for entry in map_data.get("obstacles", []):
+            if isinstance(entry, (list, tuple)):
+                pixel_rects.append(tuple(entry[:4]))
+            elif "position" in entry:
+                pos = entry["position"]
+                size = entry.get("size", [1, 1])
+                cell_rects.append((pos[0], pos[1], size[0], size[1]))
+            else:
+                pixel_rects.append((entry.get("x", 0), entry.get("y", 0),
+                                    entry.get("width", self.cell_size[0]), entry.get("height", self.cell_size[1])))
+        return self.stamp_rectangles(pixel_rects, in_pixels=True) + self.stamp_rectangles(cell_rects)
+
+    def load_occupancy(self, occupancy: np.ndarray) -> int:
+        """
+        Replaces the whole occupancy layer (e.g. from a snapshot or a compiled map).
+
+        Only the cells that actually differ are journaled, so incremental planners
+        can still repair their searches.
+
+        Returns:
+            int: The number of cells that changed.
+        """
+        occupancy = np.asarray(occupancy)
+        if occupancy.shape != self.occupancy.shape:
+            raise ValueError(f"Occupancy shape {occupancy.shape} does not match grid shape {self.occupancy.shape}.")
+        changed = np.flatnonzero(self.occupancy.ravel() != (occupancy.ravel() != 0))
+        if changed.size:
+            self.occupancy[:] = occupancy != 0
+            self._mark_changed(changed)
+        return int(changed.size)
+
+    def set_cost_layer(self, cost: Optional[np.ndarray]):
+        """
+        Sets (or removes, with None) the per-cell traversal cost layer.
+
+        Args:
+            cost (Optional[np.ndarray]): Array of shape (height, width).
+        """
+        if cost is not None:
+            cost = np.asarray(cost, dtype=np.float32)
+            if cost.shape != self.occupancy.shape:
+                raise ValueError(f"Cost layer shape {cost.shape} does not match grid shape {self.occupancy.shape}.")
+        self.cost = cost
+        self._mark_changed()
+
+    # ------------------------------------------------------------------
+    # Cell API used by the object-based planners
+    # ------------------------------------------------------------------
+    def get_cell(self, x: int, y: int) -> Optional[Cell]:
+        """Returns the Cell view at (x, y), creating it on first use, or None if out of bounds."""
+        if not self.in_bounds(x, y):
+            return None
+        key = (x, y)
+        cell = self._cells.get(key)
+        if cell is None:
+            cell = Cell(key, bool(self.occupancy[y, x]))
+            self._cells[key] = cell
+        return cell
+
+    def get_neighbors(self, cell: Cell) -> List[Cell]:
+        """Returns the walkable 4-connected neighbours of a cell."""
+        x, y = cell.position
+        neighbors = []
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if self.in_bounds(nx, ny) and not self.occupancy[ny, nx]:
+                neighbors.append(self.get_cell(nx, ny))
+        return neighbors
+
+    def reset_pathfinding_data(self):
+        """Discards the Cell views handed out since the last search."""
+        self._cells.clear()
+
     def draw(self, surface: pygame.Surface, camera_offset: pygame.math.Vector2):
         """
         Draws the grid lines on the given surface, adjusted by the camera offset.
@@ -83,3 +374,44 @@ class Grid:
                 start_pos = (x_pos, 0 - camera_offset.y)
                 end_pos = (x_pos, self.world_height_pixels - camera_offset.y)
                 pygame.draw.line(surface, self.grid_line_color, start_pos, end_pos)
+
+    def render_static_layer(self, background=(0, 0, 0), area: Optional[pygame.Rect] = None) -> pygame.Surface:
+        """
+        Pre-renders the static part of the map (background, blocked cells and grid lines).
+
+        The result only depends on the obstacle layer, so callers can cache it and
+        rebuild it when `version` changes instead of redrawing every line each frame.
+        Blocked cells are filled one horizontal run at a time.
+
+        Args:
+            background: Fill colour of free cells.
+            area (Optional[pygame.Rect]): Part of the world (in pixels) to render; defaults to
+                                          the whole world. Large maps should be rendered in tiles,
+                                          since a world-sized surface can take gigabytes.
+        """
+        world_rect = pygame.Rect(0, 0, self.world_width_pixels, self.world_height_pixels)
+        area = world_rect if area is None else pygame.Rect(area).clip(world_rect)
+        surface = pygame.Surface(area.size)
+        surface.fill(background)
+        cw, ch = self.cell_size
+        x_lo, y_lo = area.left // cw, area.top // ch
+        x_hi, y_hi = min(-(-area.right // cw), self.width), min(-(-area.bottom // ch), self.height)
+
+        # Start/end columns of each run of blocked cells, per row
+        padded = np.zeros((max(y_hi - y_lo, 0), max(x_hi - x_lo, 0) + 2), dtype=np.int8)
+        padded[:, 1:-1] = self.occupancy[y_lo:y_hi, x_lo:x_hi] != 0
+        edges = np.diff(padded, axis=1)
+        run_rows, run_starts = np.nonzero(edges == 1)
+        _, run_ends = np.nonzero(edges == -1)
+        for y, x0, x1 in zip(run_rows.tolist(), run_starts.tolist(), run_ends.tolist()):
+            rect = pygame.Rect((x_lo + x0) * cw, (y_lo + y) * ch, (x1 - x0) * cw, ch)
+            # Surface.fill shifts (rather than clips) rects with a negative corner, so clip explicitly.
+            surface.fill(self.obstacle_color, rect.move(-area.left, -area.top).clip(surface.get_rect()))
+
+        left, right = -area.left, self.world_width_pixels - area.left
+        top, bottom = -area.top, self.world_height_pixels - area.top
+        for y in range(y_lo, y_hi + 1):
+            pygame.draw.line(surface, self.grid_line_color, (left, y * ch - area.top), (right, y * ch - area.top))
+        for x in range(x_lo, x_hi + 1):
+            pygame.draw.line(surface, self.grid_line_color, (x * cw - area.left, top), (x * cw - area.left, bottom))
+        return surface
@@ -0,0 +1,264 @@
+# skymind_sim/layer_1_simulation/world/map_compiler.py
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from skymind_sim.layer_1_simulation.world.grid import Grid
+from skymind_sim.utils.config_loader import ConfigLoader
+
+MAGIC = b"SKYMAP01"
+# Bump when the compiled layout or the parsing rules change to invalidate old caches.
+COMPILER_VERSION = 1
+_ALIGN = 64
+
+# ASCII map legend
+ASCII_BLOCKED = "#"
+ASCII_START = "S"
+ASCII_END = "E"
+
+logger = logging.getLogger(__name__)
+
+
+class CompiledMap:
+    """
+    A map reduced to what the simulation needs: a bit-packed occupancy layer and metadata.
+
+    `packed` is the np.packbits form of the (height, width) occupancy array,
+    one row per grid row, and is usually a read-only memory map onto the
+    cache file. `meta` holds the grid size, the cell size used for pixel
+    coordinates, and the markers found in the source: `starts` and `ends`
+    ([x, y] cells), `spawns` ({"id", "position"} with cell positions) and `goals`.
+    """
+
+    def __init__(self, packed: np.ndarray, meta: Dict[str, Any]):
+        self.packed = packed
+        self.meta = meta
+        self._occupancy: Optional[np.ndarray] = None
+
+    @property
+    def width(self) -> int:
+        return self.meta["width"]
+
+    @property
+    def height(self) -> int:
+        return self.meta["height"]
+
+    @property
+    def starts(self) -> List[Tuple[int, int]]:
+        return [tuple(p) for p in self.meta["starts"]]
+
+    @property
+    def ends(self) -> List[Tuple[int, int]]:
+        return [tuple(p) for p in self.meta["ends"]]
+
+    @property
+    def spawns(self) -> List[Dict[str, Any]]:
+        return self.meta["spawns"]
+
+    @property
+    def occupancy(self) -> np.ndarray:
+        """The unpacked (height, width) uint8 occupancy array (unpacked once, on first use)."""
+        if self._occupancy is None:
+            self._occupancy = np.unpackbits(self.packed, axis=1, count=self.width)
+        return self._occupancy
+
+    def apply(self, grid: Grid) -> int:
+        """
+        Loads the map into `grid`.
+
+        A map smaller or larger than the grid is cropped or padded with free
+        cells at the bottom/right, the same clipping stamping rectangles does.
+
+        Returns:
+            int: The number of grid cells that changed.
+        """
+        occupancy = self.occupancy
+        if occupancy.shape != grid.occupancy.shape:
+            fitted = np.zeros_like(grid.occupancy)
+            h = min(grid.height, self.height)
+            w = min(grid.width, self.width)
+            fitted[:h, :w] = occupancy[:h, :w]
+            occupancy = fitted
+        return grid.load_occupancy(occupancy)
+
+
+# ----------------------------------------------------------------------
+# Parsing
+# ----------------------------------------------------------------------
+def _default_cell_size() -> Tuple[int, int]:
+    grid_config = ConfigLoader.get('grid')
+    return grid_config.get('cell_width_pixels', 30), grid_config.get('cell_height_pixels', 30)
+
+
+def _parse_ascii(text: str) -> Tuple[np.ndarray, Dict[str, Any]]:
+    lines = [line.rstrip("\r\n") for line in text.splitlines()]
+    while lines and not lines[-1].strip():
+        lines.pop()
+    height = len(lines)
+    width = max((len(line) for line in lines), default=0)
+    chars = np.full((height, width), ord(" "), dtype=np.uint8)
+    for y, line in enumerate(lines):
+        chars[y, :len(line)] = np.frombuffer(line.encode("latin-1", "replace"), dtype=np.uint8)
+    starts = np.argwhere(chars == ord(ASCII_START))[:, ::-1]
+    ends = np.argwhere(chars == ord(ASCII_END))[:, ::-1]
+    occupancy = (chars == ord(ASCII_BLOCKED)).astype(np.uint8)
+    meta = {"name": None, "starts": starts.tolist(), "ends": ends.tolist(), "spawns": [], "goals": []}
+    return occupancy, meta
+
+
+def _parse_json(data: Dict[str, Any], cell_size: Tuple[int, int]) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """
+    Rasterizes the JSON map schemas found in data/maps.
+
+    * `grid_size: [w, h]`: size in cells.
+    * `dimensions: [w, h]`: size in pixels.
+    * `width`/`height` with `cell_size` (the Environment schema): size in cells.
+    * `width`/`height` without `cell_size`: size in pixels.
+
+    A `cell_size` stored in the map overrides the one passed in.
+    """
+    if "cell_size" in data:
+        size = data["cell_size"]
+        cell_size = (size, size) if isinstance(size, (int, float)) else tuple(size)
+    cw, ch = cell_size
+    if "grid_size" in data:
+        width, height = data["grid_size"]
+    elif "dimensions" in data:
+        width, height = -(-data["dimensions"][0] // cw), -(-data["dimensions"][1] // ch)
+    elif "cell_size" in data:
+        width, height = data.get("width", 25), data.get("height", 20)
+    else:
+        width, height = -(-data.get("width", 0) // cw), -(-data.get("height", 0) // ch)
+
+    grid = Grid(int(width), int(height), (cw, ch))
+    grid.load_obstacles_from_map(data)
+
+    spawns = []
+    for index, drone in enumerate(data.get("drones", [])):
+        if "start_position" in drone:
+            position = list(drone["start_position"][:2])
+        else:
+            position = list(grid.pixel_to_grid((drone.get("x", 0), drone.get("y", 0))))
+        spawns.append({"id": drone.get("id", index), "position": [int(v) for v in position]})
+    goals = [[int(g["x"]), int(g["y"])] if isinstance(g, dict) else [int(v) for v in g[:2]]
+             for g in data.get("goals", [])]
+    meta = {"name": data.get("map_name", data.get("name")), "starts": [s["position"] for s in spawns],
+            "ends": list(goals), "spawns": spawns, "goals": goals, "cell_size": [cw, ch]}
+    return grid.occupancy, meta
+
+
+def compile_map(path: str, cell_size: Optional[Tuple[int, int]] = None) -> CompiledMap:
+    """
+    Parses a map file (`.txt` ASCII or `.json`) into a CompiledMap without touching the cache.
+
+    Args:
+        path (str): The map file.
+        cell_size (Optional[Tuple[int, int]]): Cell size in pixels for maps given in pixels;
+                                               defaults to the grid config.
+    """
+    if cell_size is None:
+        cell_size = _default_cell_size()
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    if path.lower().endswith(".json"):
+        occupancy, meta = _parse_json(json.loads(text), tuple(cell_size))
+    else:
+        occupancy, meta = _parse_ascii(text)
+        meta["name"] = os.path.splitext(os.path.basename(path))[0]
+    height, width = occupancy.shape
+    meta.setdefault("cell_size", list(cell_size))
+    meta.update({"width": int(width), "height": int(height), "source": os.path.basename(path)})
+    return CompiledMap(np.packbits(occupancy != 0, axis=1), meta)
+
+
+# ----------------------------------------------------------------------
+# Binary cache
+# ----------------------------------------------------------------------
+def _cache_key(source: bytes, cell_size: Tuple[int, int]) -> str:
+    digest = hashlib.sha256(source)
+    digest.update(f"|v{COMPILER_VERSION}|{cell_size[0]}x{cell_size[1]}".encode("ascii"))
+    return digest.hexdigest()[:24]
+
+
+def save_compiled(compiled: CompiledMap, path: str):
+    """Writes a compiled map atomically, so concurrent runs never read a partial file."""
+    header = json.dumps(compiled.meta).encode("utf-8")
+    data_start = -(-(len(MAGIC) + 4 + len(header)) // _ALIGN) * _ALIGN
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            f.write(b"\0" * (data_start - f.tell()))
+            f.write(np.ascontiguousarray(compiled.packed, dtype=np.uint8).tobytes())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_compiled(path: str) -> CompiledMap:
+    """Opens a compiled map; the packed occupancy is a read-only memory map onto the file."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"'{path}' is not a compiled map.")
+        (header_len,) = struct.unpack("<I", f.read(4))
+        meta = json.loads(f.read(header_len).decode("utf-8"))
+    data_start = -(-(len(MAGIC) + 4 + header_len) // _ALIGN) * _ALIGN
+    shape = (meta["height"], -(-meta["width"] // 8))
+    if shape[0] * shape[1] == 0:
+        return CompiledMap(np.zeros(shape, dtype=np.uint8), meta)
+    packed = np.memmap(path, dtype=np.uint8, mode="r", offset=data_start, shape=shape)
+    return CompiledMap(packed, meta)
+
+
+def load_map(path: str, cell_size: Optional[Tuple[int, int]] = None, cache_dir: Optional[str] = None,
+             use_cache: bool = True) -> CompiledMap:
+    """
+    Loads a map through the compiled-map cache.
+
+    The cache file is keyed on a hash of the source bytes (plus the compiler
+    version and cell size), so editing a map recompiles it and renaming or
+    copying it does not.
+
+    Args:
+        path (str): The source map (`.txt` or `.json`).
+        cell_size (Optional[Tuple[int, int]]): Cell size in pixels; defaults to the grid config.
+        cache_dir (Optional[str]): Cache directory; defaults to `.cache` next to the map.
+        use_cache (bool): If False, always compile and never write the cache.
+    """
+    if cell_size is None:
+        cell_size = _default_cell_size()
+    cell_size = tuple(int(v) for v in cell_size)
+    if not use_cache:
+        return compile_map(path, cell_size)
+
+    with open(path, "rb") as f:
+        key = _cache_key(f.read(), cell_size)
+    cache_dir = cache_dir or os.path.join(os.path.dirname(os.path.abspath(path)), ".cache")
+    stem = os.path.splitext(os.path.basename(path))[0]
+    cache_path = os.path.join(cache_dir, f"{stem}-{key}.skymap")
+    if os.path.exists(cache_path):
+        try:
+            return load_compiled(cache_path)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable map cache '{cache_path}': {e}")
+
+    compiled = compile_map(path, cell_size)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        save_compiled(compiled, cache_path)
+        logger.info(f"Compiled map '{path}' cached at '{cache_path}'.")
+    except OSError as e:
+        logger.warning(f"Could not write map cache '{cache_path}': {e}")
+    return compiled
@@ -0,0 +1,399 @@
+# skymind_sim/layer_1_simulation/world/partitioned_world.py
+
+import logging
+import math
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from skymind_sim.layer_1_simulation.world.grid import Grid
+
+# name -> (per-row shape, dtype) of the shared drone arrays
+_DRONE_FIELDS = {
+    "positions": ((2,), np.float64),
+    "velocities": ((2,), np.float64),
+    "active": ((), np.bool_),
+    "owner": ((), np.int32),
+    "halo": ((), np.bool_),
+    "collisions": ((), np.int64),
+    "neighbor_count": ((), np.int32),
+    "min_separation": ((), np.float64),
+}
+
+
+def _attach(spec: Dict[str, Tuple[str, tuple, str]]) -> Tuple[List[shared_memory.SharedMemory], Dict[str, np.ndarray]]:
+    """Attaches to shared memory blocks created by the coordinator and wraps them as arrays."""
+    blocks, arrays = [], {}
+    for key, (name, shape, dtype) in spec.items():
+        try:
+            block = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python < 3.13 has no `track` argument. Worker processes share the
+            # coordinator's resource tracker, so the duplicate registration is harmless.
+            block = shared_memory.SharedMemory(name=name)
+        blocks.append(block)
+        arrays[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    return blocks, arrays
+
+
+class TileLayout:
+    """Splits a width x height grid into tiles_x x tiles_y rectangular tiles."""
+
+    def __init__(self, width: int, height: int, tiles_x: int, tiles_y: int):
+        self.width, self.height = width, height
+        self.tiles_x, self.tiles_y = tiles_x, tiles_y
+        self.tile_w = math.ceil(width / tiles_x)
+        self.tile_h = math.ceil(height / tiles_y)
+
+    @property
+    def count(self) -> int:
+        return self.tiles_x * self.tiles_y
+
+    def tile_of(self, positions: np.ndarray) -> np.ndarray:
+        """Returns the tile id of each (x, y) position; out-of-grid positions map to the nearest tile."""
+        tx = np.clip((positions[:, 0] // self.tile_w).astype(np.int64), 0, self.tiles_x - 1)
+        ty = np.clip((positions[:, 1] // self.tile_h).astype(np.int64), 0, self.tiles_y - 1)
+        return (ty * self.tiles_x + tx).astype(np.int32)
+
+    def bounds(self, tile: int) -> Tuple[float, float, float, float]:
+        """Returns (x0, y0, x1, y1) of a tile in grid units."""
+        tx, ty = tile % self.tiles_x, tile // self.tiles_x
+        return (tx * self.tile_w, ty * self.tile_h,
+                min((tx + 1) * self.tile_w, self.width), min((ty + 1) * self.tile_h, self.height))
+
+    def min_extent(self) -> float:
+        """Returns the shortest side of any tile (the last row and column can be narrower)."""
+        x0, y0, x1, y1 = self.bounds(self.count - 1)
+        return min(x1 - x0, y1 - y0)
+
+    def adjacent(self, tile: int) -> List[int]:
+        """Returns the up to 8 tiles touching `tile` (excluding itself)."""
+        tx, ty = tile % self.tiles_x, tile // self.tiles_x
+        result = []
+        for ny in range(max(ty - 1, 0), min(ty + 2, self.tiles_y)):
+            for nx in range(max(tx - 1, 0), min(tx + 2, self.tiles_x)):
+                if (nx, ny) != (tx, ty):
+                    result.append(ny * self.tiles_x + nx)
+        return result
+
+
+def _count_neighbors(query: np.ndarray, query_rows: np.ndarray, candidates: np.ndarray,
+                     candidate_rows: np.ndarray, radius: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    For each query position, counts candidates within `radius` and finds the nearest one.
+
+    Candidates are binned into cells of size `radius` and sorted by cell key, so each
+    query only examines the 3x3 surrounding cells. All work is vectorized.
+    """
+    counts = np.zeros(len(query), dtype=np.int32)
+    nearest = np.full(len(query), np.inf)
+    if len(query) == 0 or len(candidates) == 0:
+        return counts, nearest
+
+    cand_cells = np.floor(candidates / radius).astype(np.int64)
+    offset = cand_cells.min(axis=0) - 1
+    span = int(cand_cells[:, 1].max() - offset[1]) + 2
+    keys = (cand_cells[:, 0] - offset[0]) * span + (cand_cells[:, 1] - offset[1])
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+
+    query_cells = np.floor(query / radius).astype(np.int64) - offset
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            cx, cy = query_cells[:, 0] + dx, query_cells[:, 1] + dy
+            valid = (cx >= 0) & (cy >= 0) & (cy < span)
+            qkeys = np.where(valid, cx * span + cy, -1)
+            lo = np.searchsorted(sorted_keys, qkeys, side="left")
+            hi = np.searchsorted(sorted_keys, qkeys, side="right")
+            lengths = np.where(valid, hi - lo, 0)
+            total = int(lengths.sum())
+            if total == 0:
+                continue
+            q_idx = np.repeat(np.arange(len(query)), lengths)
+            starts = np.repeat(lo - (np.cumsum(lengths) - lengths), lengths)
+            c_idx = order[starts + np.arange(total)]
+            distance = np.hypot(*(query[q_idx] - candidates[c_idx]).T)
+            hit = (distance <= radius) & (query_rows[q_idx] != candidate_rows[c_idx])
+            np.add.at(counts, q_idx[hit], 1)
+            np.minimum.at(nearest, q_idx[hit], distance[hit])
+    return counts, nearest
+
+
+class _TileStepper:
+    """The three phases one tile runs per tick, operating on the shared arrays."""
+
+    def __init__(self, tile: int, layout: TileLayout, arrays: Dict[str, np.ndarray], radius: float):
+        self.tile = tile
+        self.layout = layout
+        self.arrays = arrays
+        self.radius = radius
+        self.adjacent = np.asarray(layout.adjacent(tile), dtype=np.int32)
+        self._mine = np.empty(0, dtype=np.int64)
+
+    def integrate(self, size: int, dt: float) -> int:
+        """Phase 1: advances this tile's drones; moves into blocked cells are rejected."""
+        a = self.arrays
+        self._mine = np.flatnonzero((a["owner"][:size] == self.tile) & a["active"][:size])
+        rows = self._mine
+        if rows.size == 0:
+            return 0
+        new = a["positions"][rows] + a["velocities"][rows] * dt
+        cx, cy = np.floor(new[:, 0]).astype(np.int64), np.floor(new[:, 1]).astype(np.int64)
+        occupancy = a["occupancy"]
+        inside = (cx >= 0) & (cx < occupancy.shape[1]) & (cy >= 0) & (cy < occupancy.shape[0])
+        free = np.zeros(rows.size, dtype=bool)
+        free[inside] = occupancy[cy[inside], cx[inside]] == 0
+        a["positions"][rows[free]] = new[free]
+        blocked = rows[~free]
+        a["velocities"][blocked] = 0.0
+        a["collisions"][blocked] += 1
+        return int(rows.size)
+
+    def migrate(self) -> int:
+        """Phase 2: hands drones to the tile they now lie in and flags drones in the halo band."""
+        a = self.arrays
+        rows = self._mine
+        if rows.size == 0:
+            return 0
+        positions = a["positions"][rows]
+        new_owner = self.layout.tile_of(positions)
+        migrated = int(np.count_nonzero(new_owner != self.tile))
+        a["owner"][rows] = new_owner
+        halo = np.zeros(rows.size, dtype=bool)
+        for tile in np.unique(new_owner):
+            in_tile = new_owner == tile
+            x0, y0, x1, y1 = self.layout.bounds(int(tile))
+            p = positions[in_tile]
+            halo[in_tile] = ((p[:, 0] - x0 < self.radius) | (x1 - p[:, 0] < self.radius) |
+                             (p[:, 1] - y0 < self.radius) | (y1 - p[:, 1] < self.radius))
+        a["halo"][rows] = halo
+        return migrated
+
+    def interact(self, size: int):
+        """Phase 3: neighbor counts and nearest separation, using own drones plus adjacent halos."""
+        a = self.arrays
+        owner, active = a["owner"][:size], a["active"][:size]
+        mine = np.flatnonzero((owner == self.tile) & active)
+        if mine.size == 0:
+            return
+        ghosts = np.flatnonzero(a["halo"][:size] & active & np.isin(owner, self.adjacent))
+        candidates = np.concatenate((mine, ghosts))
+        positions = a["positions"]
+        counts, nearest = _count_neighbors(positions[mine], mine, positions[candidates], candidates, self.radius)
+        a["neighbor_count"][mine] = counts
+        a["min_separation"][mine] = nearest
+
+
+def _tile_worker(tile: int, layout: TileLayout, spec, radius: float, conn, barrier):
+    """Worker process loop: waits for (size, dt) commands and runs the three tile phases."""
+    blocks, arrays = _attach(spec)
+    stepper = _TileStepper(tile, layout, arrays, radius)
+    try:
+        while True:
+            command = conn.recv()
+            if command is None:
+                break
+            size, dt = command
+            try:
+                moved = stepper.integrate(size, dt)
+                barrier.wait()
+                migrated = stepper.migrate()
+                barrier.wait()
+                stepper.interact(size)
+                conn.send((moved, migrated))
+            except Exception as e:
+                barrier.abort()
+                conn.send(e)
+    finally:
+        del stepper, arrays
+        for block in blocks:
+            block.close()
+
+
+class PartitionedWorld:
+    """
+    Domain-decomposed drone simulation stepped by one worker process per spatial tile.
+
+    The grid is split into tiles_x x tiles_y tiles. Drone state lives in
+    shared memory; each worker integrates only the drones its tile owns,
+    rejecting moves into blocked cells. When a drone crosses a tile boundary,
+    its owner is switched, so the drone migrates to the neighbouring worker
+    on the next tick. Drones within `interaction_radius` of a tile edge are
+    flagged as halo drones; since ghosts come only from adjacent tiles, the
+    radius may not exceed the shortest tile side. Each worker reads the halo drones of adjacent
+    tiles as ghosts when it computes per-drone neighbor counts and nearest
+    separation. The three phases (integrate, migrate, interact) are
+    separated by barriers, so every worker sees a consistent state.
+
+    With `processes=0`, the tiles are stepped one after another in the calling
+    process. This gives identical results and suits tests and single-core machines.
+    """
+
+    def __init__(self, grid: Grid, tiles: Optional[Tuple[int, int]] = None, capacity: int = 1024,
+                 interaction_radius: float = 2.0, processes: Optional[int] = None):
+        self.logger = logging.getLogger(__name__)
+        if tiles is None:
+            cores = mp.cpu_count()
+            tiles_x = max(int(math.sqrt(cores)), 1)
+            tiles = (tiles_x, max(cores // tiles_x, 1))
+        self.layout = TileLayout(grid.width, grid.height, int(tiles[0]), int(tiles[1]))
+        if interaction_radius > self.layout.min_extent():
+            raise ValueError(f"interaction_radius {interaction_radius} exceeds the smallest tile side "
+                             f"{self.layout.min_extent()}; neighbors beyond adjacent tiles would be missed.")
+        self.grid = grid
+        self.capacity = int(capacity)
+        self.radius = float(interaction_radius)
+        self.size = 0
+        self.tick = 0
+
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self._spec: Dict[str, Tuple[str, tuple, str]] = {}
+        self.arrays: Dict[str, np.ndarray] = {}
+        for key, (row_shape, dtype) in _DRONE_FIELDS.items():
+            self._allocate(key, (self.capacity,) + row_shape, dtype)
+        self._allocate("occupancy", grid.occupancy.shape, np.uint8)
+        self.sync_grid()
+
+        self._workers: List[mp.Process] = []
+        self._conns = []
+        use_processes = self.layout.count if processes is None else processes
+        if use_processes:
+            self._start_workers()
+        else:
+            self._steppers = [_TileStepper(t, self.layout, self.arrays, self.radius)
+                              for t in range(self.layout.count)]
+        self.logger.info(
+            f"PartitionedWorld created with {self.layout.tiles_x}x{self.layout.tiles_y} tiles "
+            f"({'processes' if self._workers else 'in-process'}), capacity {self.capacity}."
+        )
+
+    def _allocate(self, key: str, shape: tuple, dtype):
+        nbytes = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+        block = shared_memory.SharedMemory(create=True, size=nbytes)
+        self._blocks.append(block)
+        array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        array.fill(0)
+        self.arrays[key] = array
+        self._spec[key] = (block.name, shape, np.dtype(dtype).str)
+
+    def _start_workers(self):
+        ctx = mp.get_context()
+        barrier = ctx.Barrier(self.layout.count, timeout=120)
+        for tile in range(self.layout.count):
+            parent, child = ctx.Pipe()
+            worker = ctx.Process(target=_tile_worker, daemon=True,
+                                 args=(tile, self.layout, self._spec, self.radius, child, barrier))
+            worker.start()
+            self._workers.append(worker)
+            self._conns.append(parent)
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+    @property
+    def positions(self) -> np.ndarray:
+        return self.arrays["positions"][:self.size]
+
+    @property
+    def velocities(self) -> np.ndarray:
+        return self.arrays["velocities"][:self.size]
+
+    @property
+    def owners(self) -> np.ndarray:
+        return self.arrays["owner"][:self.size]
+
+    @property
+    def neighbor_counts(self) -> np.ndarray:
+        return self.arrays["neighbor_count"][:self.size]
+
+    @property
+    def min_separation(self) -> np.ndarray:
+        return self.arrays["min_separation"][:self.size]
+
+    def sync_grid(self):
+        """Copies the grid's occupancy into shared memory (call between steps after map changes)."""
+        self.arrays["occupancy"][:] = self.grid.occupancy
+
+    def add_drones(self, positions: Sequence, velocities: Optional[Sequence] = None) -> np.ndarray:
+        """
+        Adds drones and assigns each to the tile containing it.
+
+        Returns:
+            np.ndarray: The row indices of the new drones.
+
+        Raises:
+            ValueError: If the shared arrays have no room left.
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        count = len(positions)
+        if self.size + count > self.capacity:
+            raise ValueError(f"PartitionedWorld capacity {self.capacity} exceeded.")
+        rows = np.arange(self.size, self.size + count)
+        a = self.arrays
+        a["positions"][rows] = positions
+        a["velocities"][rows] = 0.0 if velocities is None else np.asarray(velocities, dtype=np.float64).reshape(-1, 2)
+        a["active"][rows] = True
+        a["owner"][rows] = self.layout.tile_of(positions)
+        a["min_separation"][rows] = np.inf
+        self.size += count
+        return rows
+
+    # ------------------------------------------------------------------
+    # Stepping
+    # ------------------------------------------------------------------
+    def step(self, dt: float) -> Dict[str, int]:
+        """
+        Advances all tiles by one tick.
+
+        Returns:
+            Dict[str, int]: 'moved' (drones integrated) and 'migrated' (tile crossings) this tick.
+        """
+        moved = migrated = 0
+        if self._workers:
+            for conn in self._conns:
+                conn.send((self.size, dt))
+            errors = []
+            for conn in self._conns:
+                result = conn.recv()
+                if isinstance(result, Exception):
+                    errors.append(result)
+                else:
+                    moved += result[0]
+                    migrated += result[1]
+            if errors:
+                raise RuntimeError(f"Tile worker failed on tick {self.tick}: {errors[0]!r}")
+        else:
+            for stepper in self._steppers:
+                moved += stepper.integrate(self.size, dt)
+            for stepper in self._steppers:
+                migrated += stepper.migrate()
+            for stepper in self._steppers:
+                stepper.interact(self.size)
+        self.tick += 1
+        return {"moved": moved, "migrated": migrated}
+
+    def close(self):
+        """Stops the workers and releases the shared memory."""
+        for conn in self._conns:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for worker in self._workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        self._workers, self._conns = [], []
+        self.arrays = {}
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,246 @@
+# skymind_sim/layer_1_simulation/world/snapshot.py
+
+import json
+import logging
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+MAGIC = b"SKYSNAP1"
+_ALIGN = 64
+
+logger = logging.getLogger(__name__)
+
+
+def _aligned(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+class WorldSnapshot:
+    """
+    Compact binary snapshot of the simulation state.
+
+    The snapshot captures:
+    - grid occupancy (and the cost layer, if one is set);
+    - every drone's position, velocity, speed, energy, energy-model charge and planned path;
+    - the world tick and `Scheduler.current_tick`;
+    - the internal state of each `UAVCommChannel` RNG.
+
+    File layout: an 8-byte magic, a little-endian u64 header length, a JSON
+    header, then each array as raw bytes at a 64-byte aligned offset.
+    `load` memory-maps the file and returns zero-copy views onto it. The
+    default copy-on-write mode ('c') lets many forked experiments branch from
+    one warmed-up snapshot without copying it or modifying the file.
+
+    Pending scheduler events hold arbitrary callbacks and are not captured.
+    On restore, the scheduler's pending agent steps are dropped and every
+    agent is woken again at the restored tick (see `Scheduler.rewind`).
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray], meta: Dict[str, Any]):
+        self.arrays = arrays
+        self.meta = meta
+
+    # ------------------------------------------------------------------
+    # Capture / restore
+    # ------------------------------------------------------------------
+    @classmethod
+    def capture(cls, world, scheduler=None, channels: Sequence = (), agents: Iterable = ()) -> "WorldSnapshot":
+        """
+        Captures the state of a world and its companions.
+
+        Args:
+            world: The World (its grid and drones).
+            scheduler: Optional Scheduler whose current_tick is stored.
+            channels: UAVCommChannel objects whose RNG state is stored, in order.
+            agents: Extra drone-like agents not registered in world.drones.
+        """
+        drones = list(world.drones.values()) + list(agents)
+        count = len(drones)
+        paths = [list(getattr(d, "path", None) or []) for d in drones]
+        offsets = np.zeros(count + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(p) for p in paths])
+        points = np.array([(int(p[0]), int(p[1])) for path in paths for p in path],
+                          dtype=np.int64).reshape(-1, 2)
+
+        fleet = getattr(world, "fleet", None)
+        fleet_ordered = fleet is not None and not list(agents) and fleet.size == count and \
+            all(d.fleet_index == i for i, d in enumerate(drones))
+        if fleet_ordered:
+            positions = fleet.positions[:count].copy()
+            velocities = fleet.velocities[:count].copy()
+            speeds = fleet.speeds[:count].copy()
+            energy = fleet.energy[:count].copy()
+        else:
+            positions = np.array([(d.position[0], d.position[1]) for d in drones], dtype=np.float64).reshape(-1, 2)
+            velocities = np.array([(d.velocity[0], d.velocity[1]) if getattr(d, "velocity", None) is not None
+                                   else (0.0, 0.0) for d in drones], dtype=np.float64).reshape(-1, 2)
+            speeds = np.array([getattr(d, "speed", np.nan) for d in drones], dtype=np.float64)
+            energy = np.array([getattr(d, "energy", np.nan) for d in drones], dtype=np.float64)
+        charges = np.array([getattr(getattr(d, "energy_model", None), "current_charge", np.nan)
+                            for d in drones], dtype=np.float64)
+
+        grid = world.grid
+        arrays = {
+            "occupancy": grid.occupancy.copy(),
+            "positions": positions,
+            "velocities": velocities,
+            "speeds": speeds,
+            "energy": energy,
+            "charges": charges,
+            "path_offsets": offsets,
+            "path_points": points,
+        }
+        if grid.cost is not None:
+            arrays["cost"] = grid.cost.copy()
+
+        rng_states = []
+        for channel in channels:
+            version, internal, gauss_next = channel.rng.getstate()
+            rng_states.append({"version": version, "gauss_next": gauss_next})
+            arrays[f"rng_{len(rng_states) - 1}"] = np.asarray(internal, dtype=np.uint32)
+
+        meta = {
+            "drone_ids": [d.id for d in drones],
+            "world_tick": getattr(world, "tick", 0),
+            "scheduler_tick": scheduler.current_tick if scheduler is not None else None,
+            "rng": rng_states,
+            "grid": {"width": grid.width, "height": grid.height},
+        }
+        return cls(arrays, meta)
+
+    def path(self, index: int) -> List[tuple]:
+        """Returns the stored path of drone `index` as a list of (x, y) cells."""
+        start, end = self.arrays["path_offsets"][index:index + 2]
+        return [tuple(p) for p in self.arrays["path_points"][start:end].tolist()]
+
+    def restore(self, world, scheduler=None, channels: Sequence = (), agents: Iterable = ()):
+        """
+        Writes the snapshot back into live objects.
+
+        Drones are matched by id, first among world.drones and then among `agents`.
+        Drones that exist only in the snapshot are created with world.add_drone.
+        Everything is validated before the first live object is changed, so a
+        failed restore leaves the world, scheduler and channels untouched.
+
+        Raises:
+            ValueError: If the grid size, the drone ids, the scheduler or the number of channels does not match.
+        """
+        grid = world.grid
+        arrays, meta = self.arrays, self.meta
+        by_id = dict(world.drones)
+        by_id.update({a.id: a for a in agents})
+        self._validate(grid, by_id, hasattr(world, "add_drone"), channels, scheduler)
+
+        grid.load_occupancy(arrays["occupancy"])
+        if "cost" in arrays:
+            grid.set_cost_layer(np.array(arrays["cost"]))
+        elif grid.cost is not None:
+            grid.set_cost_layer(None)
+
+        positions, velocities = arrays["positions"], arrays["velocities"]
+        for i, drone_id in enumerate(meta["drone_ids"]):
+            drone = by_id.get(drone_id)
+            if drone is None:
+                drone = world.add_drone(drone_id, (float(positions[i, 0]), float(positions[i, 1])))
+            drone.position = (float(positions[i, 0]), float(positions[i, 1]))
+            if hasattr(drone, "velocity"):
+                drone.velocity = (float(velocities[i, 0]), float(velocities[i, 1]))
+            for attribute, column in (("speed", "speeds"), ("energy", "energy")):
+                value = float(arrays[column][i])
+                if hasattr(drone, attribute) and not np.isnan(value):
+                    setattr(drone, attribute, value)
+            charge = float(arrays["charges"][i])
+            if not np.isnan(charge) and getattr(drone, "energy_model", None) is not None:
+                drone.energy_model.current_charge = charge
+            path = self.path(i)
+            if path or hasattr(drone, "path"):
+                drone.path = path
+
+        if hasattr(world, "tick"):
+            world.tick = meta["world_tick"]
+        if scheduler is not None:
+            scheduler.rewind(meta["scheduler_tick"])
+
+        for i, (channel, state) in enumerate(zip(channels, meta["rng"])):
+            internal = tuple(int(v) for v in arrays[f"rng_{i}"])
+            channel.rng.setstate((state["version"], internal, state["gauss_next"]))
+        logger.info(f"Snapshot restored: {len(meta['drone_ids'])} drone(s), world tick {meta['world_tick']}.")
+
+    def _validate(self, grid, by_id: Dict[str, Any], can_add: bool, channels: Sequence, scheduler=None):
+        """Raises ValueError if the snapshot cannot be restored into these objects."""
+        meta = self.meta
+        if scheduler is not None:
+            if meta["scheduler_tick"] is None:
+                raise ValueError("Snapshot was captured without a scheduler; cannot restore one.")
+            if not callable(getattr(scheduler, "rewind", None)):
+                raise ValueError(f"{type(scheduler).__name__} cannot be rewound to a snapshot tick.")
+        shape = (grid.height, grid.width)
+        if tuple(self.arrays["occupancy"].shape) != shape:
+            raise ValueError(f"Snapshot grid {meta['grid']['width']}x{meta['grid']['height']} does not match "
+                             f"grid {grid.width}x{grid.height}.")
+        if "cost" in self.arrays and tuple(self.arrays["cost"].shape) != shape:
+            raise ValueError(f"Snapshot cost layer shape {self.arrays['cost'].shape} does not match grid shape {shape}.")
+        drone_ids = meta["drone_ids"]
+        if len(set(drone_ids)) != len(drone_ids):
+            raise ValueError("Snapshot holds duplicate drone ids.")
+        missing = [drone_id for drone_id in drone_ids if drone_id not in by_id]
+        if missing and not can_add:
+            raise ValueError(f"Drone(s) {', '.join(missing)} not found and the world cannot create drones.")
+        if len(channels) != len(meta["rng"]):
+            raise ValueError(f"Snapshot holds {len(meta['rng'])} channel RNG state(s), got {len(channels)} channel(s).")
+
+    # ------------------------------------------------------------------
+    # Binary I/O
+    # ------------------------------------------------------------------
+    def save(self, path: str):
+        """Writes the snapshot to `path` in the aligned binary layout."""
+        layout, offset = {}, 0
+        for name, array in self.arrays.items():
+            offset = _aligned(offset)
+            layout[name] = {"offset": offset, "dtype": array.dtype.str, "shape": list(array.shape)}
+            offset += array.nbytes
+        header = json.dumps({"meta": self.meta, "arrays": layout}).encode("utf-8")
+        data_start = _aligned(len(MAGIC) + 8 + len(header))
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            for name, array in self.arrays.items():
+                f.seek(data_start + layout[name]["offset"])
+                f.write(np.ascontiguousarray(array).tobytes())
+            f.truncate(data_start + offset)
+
+    @classmethod
+    def load(cls, path: str, mmap_mode: Optional[str] = "c") -> "WorldSnapshot":
+        """
+        Loads a snapshot.
+
+        Args:
+            path (str): Snapshot file written by `save`.
+            mmap_mode (Optional[str]): 'c' (copy-on-write views, default), 'r' (read-only views)
+                                       or None (read everything into memory).
+
+        Raises:
+            ValueError: If the file is not a snapshot.
+        """
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"'{path}' is not a world snapshot.")
+            (header_len,) = struct.unpack("<Q", f.read(8))
+            header = json.loads(f.read(header_len).decode("utf-8"))
+        data_start = _aligned(len(MAGIC) + 8 + header_len)
+
+        if mmap_mode is None:
+            raw = np.fromfile(path, dtype=np.uint8)
+        else:
+            raw = np.memmap(path, dtype=np.uint8, mode=mmap_mode)
+        arrays = {}
+        for name, info in header["arrays"].items():
+            dtype = np.dtype(info["dtype"])
+            shape = tuple(info["shape"])
+            start = data_start + info["offset"]
+            nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+            arrays[name] = raw[start:start + nbytes].view(dtype).reshape(shape)
+        return cls(arrays, header["meta"])
@@ -2,20 +2,28 @@
 
 import pygame
 import logging
-from typing import Dict, Optional
+import numpy as np
+from typing import Dict, List, Optional
 
 from skymind_sim.utils.config_loader import ConfigLoader
 from skymind_sim.layer_1_simulation.world.grid import Grid
 from skymind_sim.layer_1_simulation.entities.drone import Drone
-# Assuming you might have other entities like Obstacle in the future
-# from skymind_sim.layer_1_simulation.world.obstacle import Obstacle
+from skymind_sim.layer_1_simulation.entities.fleet import FleetState
+from skymind_sim.layer_1_simulation.world.obstacle import Obstacle
+from skymind_sim.utils.spatial_hash import SpatialHash
+from skymind_sim.utils.telemetry import TelemetryRecorder
 
 class World:
     """
     Manages the simulation environment, including the grid and all entities within it.
+
+    In fleet mode (`use_fleet=True` or the `use_fleet` key of the world config),
+    drone kinematics live in a shared `FleetState` and `update` advances every
+    drone with a single vectorized integration instead of a per-drone loop.
+    In headless mode drones are created without sprites or surfaces.
     """
 
-    def __init__(self):
+    def __init__(self, use_fleet: Optional[bool] = None, headless: bool = False):
         self.logger = logging.getLogger(__name__)
         self.logger.info("Initializing World...")
 
@@ -23,11 +31,33 @@ class World:
         self.grid = Grid()
         self.logger.info(f"Grid created with size: {self.grid.width}x{self.grid.height}")
 
+        world_config = ConfigLoader.get('world')
+        if use_fleet is None:
+            use_fleet = world_config.get('use_fleet', False)
+        self.fleet: Optional[FleetState] = FleetState() if use_fleet else None
+        self.energy_per_unit = world_config.get('energy_per_unit', 0.0)
+        self.headless = headless
+
+        # Optional TelemetryRecorder sampled at the end of every update
+        self.telemetry: Optional[TelemetryRecorder] = None
+        self.tick = 0
+
         # Containers for entities
         self.drones: Dict[str, Drone] = {}
-        # self.obstacles = []
+        self.obstacles: List[Obstacle] = []
         self.player_drone: Optional[Drone] = None
 
+        # Uniform-grid index of drone positions (in grid cells) used to cull drawing to the viewport
+        self.spatial_index = SpatialHash(world_config.get('render_index_cell_size', 8))
+        self._draw_order: Dict[str, int] = {}
+        self._fleet_ids: List[str] = []
+        self._index_cells = np.empty((0, 2), dtype=np.int64)
+
+        # Positions before the last fixed step, for drawing between steps (see render_position)
+        self.render_alpha = 1.0
+        self._previous_positions: Optional[np.ndarray] = None
+        self._previous_by_id: Dict[str, pygame.math.Vector2] = {}
+
         self._initialize_entities()
         self.logger.info("World initialized successfully.")
 
@@ -41,14 +71,7 @@ class World:
         player_start_pos = world_config.get('player_start_position', [5, 5])
         
         # Create the player drone
-        self.player_drone = Drone(
-            drone_id="player_1",
-            # --- THIS IS THE FIX ---
-            position=player_start_pos,
-            # -----------------------
-            grid=self.grid
-        )
-        self.drones[self.player_drone.id] = self.player_drone
+        self.player_drone = self.add_drone("player_1", player_start_pos)
         self.logger.info(f"Player drone '{self.player_drone.id}' created at position {player_start_pos}.")
 
     def update(self, dt: float):
@@ -58,8 +81,37 @@ class World:
         Args:
             dt (float): The time elapsed since the last frame.
         """
-        for drone in self.drones.values():
-            drone.update(dt)
+        if self.fleet is not None:
+            self.fleet.integrate(dt, self.energy_per_unit)
+        else:
+            for drone in self.drones.values():
+                drone.update(dt)
+
+        if self.telemetry is not None:
+            if self.fleet is not None:
+                self.telemetry.capture_fleet(self.tick, self.fleet, self._fleet_ids)
+            else:
+                self.telemetry.capture(self.tick, self.drones.values())
+        self.tick += 1
+
+    def add_drone(self, drone_id: str, position) -> Drone:
+        """
+        Creates a drone at the given grid position and registers it with the world.
+
+        Args:
+            drone_id (str): Unique identifier of the drone.
+            position: Initial (x, y) grid position.
+
+        Returns:
+            Drone: The new drone (a view onto the fleet arrays in fleet mode).
+        """
+        drone = Drone(drone_id=drone_id, grid=self.grid, position=position, fleet=self.fleet,
+                      headless=self.headless)
+        self.drones[drone.id] = drone
+        self._draw_order.setdefault(drone.id, len(self._draw_order))
+        if self.fleet is not None:
+            self._fleet_ids.append(drone.id)
+        return drone
 
     def draw(self, surface: pygame.Surface, camera_offset: pygame.math.Vector2):
         """
@@ -73,8 +125,113 @@ class World:
         self.grid.draw(surface, camera_offset)
 
         # Draw all other entities
-        for drone in self.drones.values():
-            drone.draw(surface, camera_offset)
+        self.draw_entities(surface, camera_offset)
+
+    def draw_entities(self, surface: pygame.Surface, camera_offset: pygame.math.Vector2) -> List[pygame.Rect]:
+        """
+        Draws the moving entities only (no grid), e.g. on top of a cached static layer.
+
+        Only drones whose sprite intersects the viewport (`camera_offset` plus the
+        surface size) are drawn. Candidates come from `spatial_index`, so the cost
+        follows the number of visible drones rather than the fleet size, and they
+        are drawn with a single batched `Surface.blits` call in insertion order.
+
+        Returns:
+            List[pygame.Rect]: The non-empty screen areas that were drawn, for dirty-rect updates.
+        """
+        self.sync_spatial_index()
+        cw, ch = self.grid.cell_size
+        width, height = surface.get_size()
+        view = pygame.Rect(int(camera_offset[0]), int(camera_offset[1]), width, height)
+        # The index holds sprite centres; widen the query by a cell so sprites straddling the edge are kept.
+        candidates = self.spatial_index.query_cells(view.left / cw - 1, view.top / ch - 1,
+                                                    view.right / cw + 1, view.bottom / ch + 1)
+        interpolate = self.render_alpha < 1.0
+        batch = []
+        for drone_id in sorted(candidates, key=self._draw_order.__getitem__):
+            drone = self.drones[drone_id]
+            if drone.image is None:
+                continue
+            rect = drone.rect
+            if interpolate:
+                rect = rect.copy()
+                rect.center = self.grid.grid_to_pixel(self.render_position(drone))
+            if rect.colliderect(view):
+                batch.append((drone.image, rect.move(-view.left, -view.top)))
+        if not batch:
+            return []
+        return [rect for rect in surface.blits(batch) if rect]
+
+    def save_previous_positions(self):
+        """Remembers the current drone positions; call right before each fixed simulation step."""
+        if self.fleet is not None:
+            n = self.fleet.size
+            if self._previous_positions is None or self._previous_positions.shape[0] != n:
+                self._previous_positions = np.empty((n, 2), dtype=np.float64)
+            np.copyto(self._previous_positions, self.fleet.positions[:n])
+        else:
+            self._previous_by_id = {drone_id: pygame.math.Vector2(drone.position)
+                                    for drone_id, drone in self.drones.items()}
+
+    def render_position(self, drone) -> pygame.math.Vector2:
+        """
+        Returns where to draw `drone`: `render_alpha` of the way from its position before
+        the last step to its current one (the current position if none was saved).
+        """
+        current = drone.position
+        if self.render_alpha >= 1.0:
+            return current
+        index = getattr(drone, "fleet_index", None)
+        if index is not None and self._previous_positions is not None and index < len(self._previous_positions):
+            previous = pygame.math.Vector2(*self._previous_positions[index])
+        else:
+            previous = self._previous_by_id.get(drone.id)
+            if previous is None:
+                return current
+        return previous.lerp(current, max(self.render_alpha, 0.0))
+
+    def sync_spatial_index(self):
+        """
+        Brings `spatial_index` up to date with the drone positions.
+
+        In fleet mode the index cells of all drones are computed in one vectorized
+        pass and only drones that crossed into another index cell are re-bucketed.
+        """
+        index = self.spatial_index
+        if self.fleet is None:
+            for drone_id, drone in self.drones.items():
+                index.update(drone_id, drone.position)
+            return
+        n = self.fleet.size
+        positions = self.fleet.positions[:n]
+        cells = np.floor(positions / index.cell_size).astype(np.int64)
+        known = self._index_cells
+        if len(known) != n:
+            known = np.full((n, 2), np.iinfo(np.int64).min, dtype=np.int64)
+            known[:len(self._index_cells)] = self._index_cells[:n]
+        ids = self._fleet_ids
+        for i in np.flatnonzero((cells != known).any(axis=1)).tolist():
+            index.update(ids[i], positions[i])
+        self._index_cells = cells
+
+    def add_obstacle(self, obstacle: Obstacle):
+        """
+        Adds an obstacle to the world and stamps its cells into the grid.
+
+        Args:
+            obstacle (Obstacle): The obstacle to add.
+        """
+        self.obstacles.append(obstacle)
+        self.grid.add_obstacle(obstacle)
+
+    def check_collision(self, position) -> bool:
+        """
+        Returns True if the given grid position is blocked or outside the grid.
+
+        Args:
+            position: (x, y) grid coordinates.
+        """
+        return self.grid.is_obstacle(int(position[0]), int(position[1]))
 
     def get_player_drone(self) -> Optional[Drone]:
         """Returns the main player-controlled drone."""
@@ -0,0 +1,283 @@
+# FILE: skymind_sim/layer_3_intelligence/pathfinding/d_star_lite.py
+
+import heapq
+import math
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from skymind_sim.layer_1_simulation.world.grid import Grid
+from skymind_sim.utils.log_manager import LogManager
+
+logger = LogManager.get_logger(__name__)
+
+INF = math.inf
+
+
+class _GridSnapshot:
+    """
+    نمای مسطح occupancy و هزینه یک نسخه از گرید.
+
+    برنامه‌ریز برای هر grid.version فقط یک نمونه می‌سازد و همه جستجوها آن را
+    به اشتراک می‌گذارند، تا حافظه با تعداد پهپادها بزرگ نشود.
+    """
+    __slots__ = ("grid_id", "version", "blocked", "cost", "h_scale")
+
+    def __init__(self, grid: Grid):
+        self.grid_id = id(grid)
+        self.version = grid.version
+        self.blocked = grid.occupancy.tobytes()
+        self.cost = grid.cost.ravel().tolist() if grid.cost is not None else None
+        self.h_scale = max(float(grid.cost.min()), 0.0) if grid.cost is not None else 1.0
+
+
+class DStarLiteSearch:
+    """
+    وضعیت جستجوی D* Lite برای یک پهپاد (یا یک هدف مشترک).
+
+    جستجو از هدف به سمت مبدا انجام می‌شود، بنابراین وقتی پهپاد جلو می‌رود یا
+    چند خانه از گرید تغییر می‌کند، فقط بخش آسیب‌دیده درخت کوتاه‌ترین مسیر
+    دوباره محاسبه می‌شود. مقادیر g و rhs به صورت دیکشنری‌های تُنُک نگه داشته
+    می‌شوند تا حافظه متناسب با ناحیه کاوش‌شده باشد، نه اندازه کل نقشه.
+    """
+
+    def __init__(self, grid: Grid, start: Tuple[int, int], goal: Tuple[int, int],
+                 snapshot: Optional[_GridSnapshot] = None):
+        self.grid_id = id(grid)
+        self.width, self.height = grid.width, grid.height
+        self.goal = goal
+        self.start = start
+        self.version = grid.version
+        self._load_grid(grid, snapshot)
+
+        self.km = 0.0
+        self.g: Dict[int, float] = {}
+        self.rhs: Dict[int, float] = {}
+        self._open: Dict[int, Tuple[float, float]] = {}
+        self._heap: List[Tuple[float, float, int]] = []
+        self.last_expanded = 0
+
+        goal_node = self._node(goal)
+        self.rhs[goal_node] = 0.0
+        self._push(goal_node, (self._h(start, goal_node), 0.0))
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    def _load_grid(self, grid: Grid, snapshot: Optional[_GridSnapshot] = None):
+        if snapshot is None or snapshot.grid_id != id(grid) or snapshot.version != grid.version:
+            snapshot = _GridSnapshot(grid)
+        self._blocked = snapshot.blocked
+        self._cost = snapshot.cost
+        self._h_scale = snapshot.h_scale
+
+    def _node(self, pos: Tuple[int, int]) -> int:
+        return pos[1] * self.width + pos[0]
+
+    def _h(self, pos: Tuple[int, int], node: int) -> float:
+        return (abs(pos[0] - node % self.width) + abs(pos[1] - node // self.width)) * self._h_scale
+
+    def _neighbors(self, node: int) -> List[int]:
+        x, y = node % self.width, node // self.width
+        result = []
+        if x + 1 < self.width:
+            result.append(node + 1)
+        if x > 0:
+            result.append(node - 1)
+        if y + 1 < self.height:
+            result.append(node + self.width)
+        if y > 0:
+            result.append(node - self.width)
+        return result
+
+    def _c(self, u: int, v: int) -> float:
+        """هزینه حرکت از u به v (بی‌نهایت اگر یکی از دو خانه مسدود باشد)."""
+        if self._blocked[u] or self._blocked[v]:
+            return INF
+        return self._cost[v] if self._cost is not None else 1.0
+
+    def _key(self, node: int) -> Tuple[float, float]:
+        m = min(self.g.get(node, INF), self.rhs.get(node, INF))
+        return (m + self._h(self.start, node) + self.km, m)
+
+    def _push(self, node: int, key: Tuple[float, float]):
+        self._open[node] = key
+        heapq.heappush(self._heap, (key[0], key[1], node))
+
+    def _top(self) -> Optional[Tuple[Tuple[float, float], int]]:
+        """بالاترین عنصر معتبر صف را برمی‌گرداند (مدخل‌های کهنه دور ریخته می‌شوند)."""
+        heap = self._heap
+        while heap:
+            k1, k2, node = heap[0]
+            if self._open.get(node) == (k1, k2):
+                return (k1, k2), node
+            heapq.heappop(heap)
+        return None
+
+    def _update_vertex(self, node: int):
+        g, rhs = self.g.get(node, INF), self.rhs.get(node, INF)
+        if g != rhs:
+            self._push(node, self._key(node))
+        else:
+            self._open.pop(node, None)
+
+    def _recompute_rhs(self, node: int):
+        if node == self._node(self.goal):
+            return
+        best = INF
+        for s in self._neighbors(node):
+            c = self._c(node, s)
+            if c < INF:
+                best = min(best, c + self.g.get(s, INF))
+        self.rhs[node] = best
+
+    # ------------------------------------------------------------------
+    # Core
+    # ------------------------------------------------------------------
+    def compute_shortest_path(self):
+        start_node = self._node(self.start)
+        g, rhs = self.g, self.rhs
+        expanded = 0
+        while True:
+            top = self._top()
+            if top is None:
+                break
+            k_old, u = top
+            start_key = self._key(start_node)
+            if not (k_old < start_key or rhs.get(start_node, INF) > g.get(start_node, INF)):
+                break
+            expanded += 1
+            k_new = self._key(u)
+            if k_old < k_new:
+                self._push(u, k_new)
+            elif g.get(u, INF) > rhs.get(u, INF):
+                g[u] = rhs[u]
+                self._open.pop(u, None)
+                for s in self._neighbors(u):
+                    c = self._c(s, u)
+                    if c < rhs.get(s, INF) - g[u]:
+                        rhs[s] = c + g[u]
+                        self._update_vertex(s)
+            else:
+                g[u] = INF
+                for s in self._neighbors(u) + [u]:
+                    self._recompute_rhs(s)
+                    self._update_vertex(s)
+        self.last_expanded = expanded
+
+    def apply_changes(self, grid: Grid, changed: List[int], snapshot: Optional[_GridSnapshot] = None):
+        """
+        خانه‌های تغییرکرده را اعمال و rhs آن‌ها و همسایگانشان را به‌روزرسانی می‌کند.
+        """
+        self._load_grid(grid, snapshot)
+        self.version = grid.version
+        touched = set()
+        for node in changed:
+            touched.add(node)
+            touched.update(self._neighbors(node))
+        for node in touched:
+            self._recompute_rhs(node)
+            self._update_vertex(node)
+
+    def move_start(self, start: Tuple[int, int]):
+        """مبدا را جابه‌جا می‌کند و km را برای حفظ اعتبار کلیدهای صف افزایش می‌دهد."""
+        if start != self.start:
+            self.km += self._h(self.start, self._node(start))
+            self.start = start
+
+    def extract_path(self) -> Optional[List[Tuple[int, int]]]:
+        """مسیر را با حرکت حریصانه روی مقادیر g از مبدا تا هدف استخراج می‌کند."""
+        node = self._node(self.start)
+        goal_node = self._node(self.goal)
+        # The start only needs a finite rhs: its successors carry consistent g values.
+        if node != goal_node and self.rhs.get(node, INF) == INF:
+            return None
+        total_path = [self.start]
+        limit = self.width * self.height
+        while node != goal_node:
+            best, best_cost = None, INF
+            for s in self._neighbors(node):
+                cost = self._c(node, s) + self.g.get(s, INF)
+                if cost < best_cost:
+                    best, best_cost = s, cost
+            if best is None or len(total_path) > limit:
+                return None
+            node = best
+            total_path.append((node % self.width, node // self.width))
+        return total_path
+
+
+class DStarLitePlanner:
+    """
+    برنامه‌ریز افزایشی D* Lite برای سناریوهای با موانع متحرک.
+
+    برای هر پهپاد (agent_id) یک DStarLiteSearch نگه می‌دارد. در هر فراخوانی،
+    خانه‌های تغییرکرده از ژورنال `Grid.changes_since` خوانده می‌شوند و فقط
+    بخش آسیب‌دیده جستجو ترمیم می‌شود. اگر هدف عوض شود یا ژورنال کافی نباشد،
+    جستجوی آن پهپاد از نو ساخته می‌شود.
+    """
+    incremental = True
+
+    def __init__(self, max_searches: int = 1024):
+        self.max_searches = max_searches
+        self._searches: "OrderedDict[Hashable, DStarLiteSearch]" = OrderedDict()
+        # Snapshot of the current grid version, shared by every search
+        self._snapshot: Optional[_GridSnapshot] = None
+        self.last_expanded = 0
+
+    def _grid_snapshot(self, grid: Grid) -> _GridSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.grid_id != id(grid) or snapshot.version != grid.version:
+            snapshot = self._snapshot = _GridSnapshot(grid)
+        return snapshot
+
+    def forget(self, agent_id: Hashable):
+        """وضعیت جستجوی یک پهپاد را حذف می‌کند (مثلاً پس از رسیدن به مقصد)."""
+        self._searches.pop(agent_id, None)
+
+    def find_path(self, grid: Grid, start: Tuple[int, int], end: Tuple[int, int],
+                  agent_id: Optional[Hashable] = None) -> Optional[List[Tuple[int, int]]]:
+        """
+        مسیر را با D* Lite پیدا یا ترمیم می‌کند.
+
+        Args:
+            grid (Grid): گرید شبیه‌سازی که شامل موانع است.
+            start (Tuple[int, int]): موقعیت فعلی پهپاد.
+            end (Tuple[int, int]): مقصد.
+            agent_id (Optional[Hashable]): شناسه پهپاد برای نگهداری وضعیت جستجو؛
+                                           اگر None باشد، وضعیت بین پهپادهای هم‌مقصد مشترک است.
+
+        Returns:
+            Optional[List[Tuple[int, int]]]: لیستی از مختصات گرید که مسیر را تشکیل می‌دهند، یا None اگر مسیری پیدا نشود.
+        """
+        start = (int(start[0]), int(start[1]))
+        end = (int(end[0]), int(end[1]))
+        if grid.is_obstacle(*start) or grid.is_obstacle(*end):
+            logger.warning("Start or end cell is invalid or an obstacle.")
+            return None
+
+        key = agent_id if agent_id is not None else ("goal", end)
+        search = self._searches.get(key)
+        changed = None
+        if search is not None and search.goal == end and search.grid_id == id(grid):
+            changed = grid.changes_since(search.version)
+
+        if changed is None:
+            logger.debug(f"D* Lite building a new search for '{key}' from {start} to {end}.")
+            search = DStarLiteSearch(grid, start, end, self._grid_snapshot(grid))
+        else:
+            search.move_start(start)
+            if changed.size:
+                logger.debug(f"D* Lite repairing search for '{key}' after {changed.size} cell change(s).")
+                search.apply_changes(grid, changed.tolist(), self._grid_snapshot(grid))
+
+        self._searches[key] = search
+        self._searches.move_to_end(key)
+        if len(self._searches) > self.max_searches:
+            self._searches.popitem(last=False)
+
+        search.compute_shortest_path()
+        self.last_expanded = search.last_expanded
+        path = search.extract_path()
+        if path is None:
+            logger.warning(f"No path could be found from {start} to {end}.")
+        return path
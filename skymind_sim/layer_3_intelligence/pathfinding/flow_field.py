@@ -0,0 +1,173 @@
+# FILE: skymind_sim/layer_3_intelligence/pathfinding/flow_field.py
+
+import heapq
+import numpy as np
+from typing import Optional, Tuple
+
+from skymind_sim.layer_1_simulation.world.grid import Grid
+from skymind_sim.utils.log_manager import LogManager
+
+logger = LogManager.get_logger(__name__)
+
+# (dx, dy) of the 4-connected moves, in the order used for the next-step table
+_MOVES = np.array([(1, 0), (-1, 0), (0, 1), (0, -1)], dtype=np.int64)
+
+
+class FlowField:
+    """
+    میدان فاصله/جریان معکوس از یک هدف مشترک (مثل ایستگاه شارژ یا depot).
+
+    یک بار با Dijkstra معکوس از هدف ساخته می‌شود و سپس هر تعداد پهپاد می‌توانند
+    گام بعدی خود را در O(1) از آرایه `next_node` بخوانند. برای گریدهای بدون
+    لایه هزینه، فاصله‌ها با یک موج BFS برداری (NumPy) محاسبه می‌شوند.
+
+    Attributes:
+        goal (Tuple[int, int]): مختصات هدف.
+        version (int): نسخه لایه موانع گرید هنگام ساخت میدان.
+        distance (np.ndarray): آرایه float32 با شکل (height, width)؛ inf برای خانه‌های غیرقابل دسترس.
+        next_node (np.ndarray): آرایه int64 تخت از اندیس خانه بعدی؛ -1 برای هدف و خانه‌های غیرقابل دسترس.
+    """
+
+    def __init__(self, grid: Grid, goal: Tuple[int, int]):
+        self.goal = (int(goal[0]), int(goal[1]))
+        self.width, self.height = grid.width, grid.height
+        self.version = grid.version
+
+        if grid.is_obstacle(*self.goal):
+            logger.warning(f"Flow field goal {self.goal} is invalid or an obstacle.")
+            self.distance = np.full((self.height, self.width), np.inf, dtype=np.float32)
+        elif grid.cost is None:
+            self.distance = self._wavefront(grid.occupancy)
+        else:
+            self.distance = self._dijkstra(grid.occupancy, grid.cost)
+        self.next_node = self._build_next_table(grid.occupancy)
+        logger.debug(f"Flow field built for goal {self.goal} on {self.width}x{self.height} grid.")
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    def _wavefront(self, occupancy: np.ndarray) -> np.ndarray:
+        """فاصله هر خانه تا هدف را با BFS برداری (هزینه یکنواخت) محاسبه می‌کند."""
+        width, height = self.width, self.height
+        free = (occupancy.ravel() == 0)
+        dist = np.full(width * height, -1, dtype=np.int64)
+        frontier = np.array([self.goal[1] * width + self.goal[0]], dtype=np.int64)
+        dist[frontier] = 0
+        level = 0
+        while frontier.size:
+            level += 1
+            xs, ys = frontier % width, frontier // width
+            candidates = np.concatenate((
+                frontier[xs + 1 < width] + 1,
+                frontier[xs > 0] - 1,
+                frontier[ys + 1 < height] + width,
+                frontier[ys > 0] - width,
+            ))
+            candidates = candidates[free[candidates] & (dist[candidates] < 0)]
+            frontier = np.unique(candidates)
+            dist[frontier] = level
+        distance = dist.astype(np.float32)
+        distance[dist < 0] = np.inf
+        return distance.reshape(height, width)
+
+    def _dijkstra(self, occupancy: np.ndarray, cost: np.ndarray) -> np.ndarray:
+        """فاصله هر خانه تا هدف را با Dijkstra معکوس روی لایه هزینه محاسبه می‌کند."""
+        width, height = self.width, self.height
+        blocked = occupancy.tobytes()
+        step_cost = cost.ravel().tolist()
+        dist = [float('inf')] * (width * height)
+        goal = self.goal[1] * width + self.goal[0]
+        dist[goal] = 0.0
+        open_set = [(0.0, goal)]
+        while open_set:
+            d, node = heapq.heappop(open_set)
+            if d > dist[node]:
+                continue
+            x, y = node % width, node // width
+            # Entering `node` from a neighbour costs the cost of `node`.
+            enter = step_cost[node]
+            for nx, ny, nb in ((x + 1, y, node + 1), (x - 1, y, node - 1),
+                               (x, y + 1, node + width), (x, y - 1, node - width)):
+                if nx < 0 or ny < 0 or nx >= width or ny >= height or blocked[nb]:
+                    continue
+                nd = d + enter
+                if nd < dist[nb]:
+                    dist[nb] = nd
+                    heapq.heappush(open_set, (nd, nb))
+        return np.asarray(dist, dtype=np.float32).reshape(height, width)
+
+    def _build_next_table(self, occupancy: np.ndarray) -> np.ndarray:
+        """برای هر خانه، همسایه‌ای با کمترین فاصله تا هدف را (به صورت برداری) انتخاب می‌کند."""
+        width, height = self.width, self.height
+        padded = np.full((height + 2, width + 2), np.inf, dtype=np.float32)
+        padded[1:-1, 1:-1] = self.distance
+        # Neighbour distances for each move, shape (4, height, width)
+        neighbour = np.stack([padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width] for dx, dy in _MOVES])
+        best = np.argmin(neighbour, axis=0)
+        best_dist = np.take_along_axis(neighbour, best[None], axis=0)[0]
+
+        ys, xs = np.indices((height, width))
+        next_x = xs + _MOVES[best, 0]
+        next_y = ys + _MOVES[best, 1]
+        next_node = (next_y * width + next_x).ravel()
+        valid = (np.isfinite(self.distance) & (best_dist < self.distance) & (occupancy == 0)).ravel()
+        next_node[~valid] = -1
+        return next_node
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def is_reachable(self, position) -> bool:
+        """True اگر از این خانه مسیری به هدف وجود داشته باشد."""
+        x, y = int(position[0]), int(position[1])
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        return bool(np.isfinite(self.distance[y, x]))
+
+    def next_step(self, position) -> Optional[Tuple[int, int]]:
+        """
+        گام بعدی به سمت هدف را در O(1) برمی‌گرداند.
+
+        Returns:
+            Optional[Tuple[int, int]]: خانه بعدی، یا None اگر پهپاد روی هدف است یا مسیری ندارد.
+        """
+        x, y = int(position[0]), int(position[1])
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        node = int(self.next_node[y * self.width + x])
+        if node < 0:
+            return None
+        return node % self.width, node // self.width
+
+    def next_steps(self, positions: np.ndarray) -> np.ndarray:
+        """
+        گام بعدی همه پهپادها را به صورت برداری محاسبه می‌کند.
+
+        Args:
+            positions (np.ndarray): آرایه (N, 2) از مختصات (x, y).
+
+        Returns:
+            np.ndarray: آرایه (N, 2) از خانه‌های بعدی؛ پهپادهایی که روی هدف هستند
+                        یا مسیری ندارند در جای خود می‌مانند.
+        """
+        positions = np.asarray(positions, dtype=np.int64).reshape(-1, 2)
+        xs, ys = positions[:, 0], positions[:, 1]
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        nodes = np.full(len(positions), -1, dtype=np.int64)
+        nodes[inside] = self.next_node[ys[inside] * self.width + xs[inside]]
+        result = positions.copy()
+        moving = nodes >= 0
+        result[moving, 0] = nodes[moving] % self.width
+        result[moving, 1] = nodes[moving] // self.width
+        return result
+
+    def path_from(self, position) -> Optional[list]:
+        """مسیر کامل از یک خانه تا هدف را با دنبال‌کردن میدان جریان برمی‌گرداند."""
+        if not self.is_reachable(position):
+            return None
+        current = (int(position[0]), int(position[1]))
+        total_path = [current]
+        while current != self.goal:
+            current = self.next_step(current)
+            total_path.append(current)
+        return total_path
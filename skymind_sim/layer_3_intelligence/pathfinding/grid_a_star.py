@@ -0,0 +1,183 @@
+# FILE: skymind_sim/layer_3_intelligence/pathfinding/grid_a_star.py
+
+import heapq
+import math
+from array import array
+from typing import List, Tuple, Optional
+
+from skymind_sim.layer_1_simulation.world.grid import Grid
+from skymind_sim.utils.log_manager import LogManager
+
+logger = LogManager.get_logger(__name__)
+
+# Largest generation value that fits in an unsigned 32-bit stamp.
+_MAX_GENERATION = 0xFFFFFFFF
+
+SQRT2 = math.sqrt(2.0)
+
+# (dx, dy, step length) for 4- and 8-connected movement
+_MOVES_4 = ((1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0))
+_MOVES_8 = _MOVES_4 + ((1, 1, SQRT2), (-1, 1, SQRT2), (1, -1, SQRT2), (-1, -1, SQRT2))
+
+
+def octile_distance(dx: int, dy: int) -> float:
+    """فاصله octile (حرکت ۸-جهته با هزینه قطری √2) را برمی‌گرداند."""
+    dx, dy = abs(dx), abs(dy)
+    return (dx + dy) + (SQRT2 - 2.0) * min(dx, dy)
+
+
+class GridAStarPlanner:
+    """
+    A* مبتنی بر آرایه که مستقیماً روی آرایه اشغال (occupancy) گرید کار می‌کند.
+
+    گره‌ها با اندیس صحیح تخت (y * width + x) نمایش داده می‌شوند. آرایه‌های
+    g-score، والد و وضعیت بسته‌بودن یک بار برای هر ابعاد گرید تخصیص داده
+    می‌شوند و با «شماره نسل» (generation stamp) معتبر می‌شوند، بنابراین هر
+    جستجو نیازی به ریست O(W·H) ندارد. صف اولویت فقط تاپل‌هایی از اعداد
+    (f, h, node) نگه می‌دارد و تساوی f به نفع گره نزدیک‌تر به هدف شکسته می‌شود.
+
+    با diagonal=True جستجو ۸-همسایگی با هیوریستیک octile انجام می‌شود؛ حرکت
+    قطری فقط وقتی مجاز است که هر دو خانه مجاور افقی و عمودی آزاد باشند.
+    """
+
+    def __init__(self, diagonal: bool = False):
+        self.diagonal = diagonal
+        self._moves = _MOVES_8 if diagonal else _MOVES_4
+        self._shape: Tuple[int, int] = (0, 0)
+        self._generation = 0
+        self._g = array('d')
+        self._parent = array('q')
+        self._seen = array('I')
+        self._closed = array('I')
+        # Flattened occupancy/cost snapshots, refreshed when grid.version changes
+        self._grid_id = None
+        self._grid_version = -1
+        self._blocked = b''
+        self._cost: Optional[List[float]] = None
+        self._min_cost = 1.0
+        self.last_expanded = 0
+
+    # ------------------------------------------------------------------
+    # Workspace management
+    # ------------------------------------------------------------------
+    def _prepare(self, grid: Grid):
+        """آرایه‌های کاری را در صورت تغییر ابعاد یا نسخه گرید آماده می‌کند."""
+        shape = (grid.width, grid.height)
+        if shape != self._shape:
+            size = grid.width * grid.height
+            self._g = array('d', bytes(8 * size))
+            self._parent = array('q', bytes(8 * size))
+            self._seen = array('I', bytes(self._seen.itemsize * size))
+            self._closed = array('I', bytes(self._closed.itemsize * size))
+            self._shape = shape
+            self._generation = 0
+            logger.debug(f"GridAStarPlanner allocated workspace for {shape[0]}x{shape[1]} grid.")
+
+        if id(grid) != self._grid_id or grid.version != self._grid_version:
+            self._blocked = grid.occupancy.tobytes()
+            if grid.cost is not None:
+                self._cost = grid.cost.ravel().tolist()
+                self._min_cost = max(float(grid.cost.min()), 0.0)
+            else:
+                self._cost = None
+                self._min_cost = 1.0
+            self._grid_id = id(grid)
+            self._grid_version = grid.version
+
+        self._generation += 1
+        if self._generation >= _MAX_GENERATION:
+            # Wrap-around: clear stamps once every ~4 billion searches.
+            size = len(self._seen)
+            self._seen = array('I', bytes(self._seen.itemsize * size))
+            self._closed = array('I', bytes(self._closed.itemsize * size))
+            self._generation = 1
+        return self._generation
+
+    def _reconstruct_path(self, node: int, start: int, width: int) -> List[Tuple[int, int]]:
+        """مسیر را با دنبال‌کردن آرایه والدها می‌سازد و یک بار معکوس می‌کند."""
+        parent = self._parent
+        total_path = [(node % width, node // width)]
+        while node != start:
+            node = parent[node]
+            total_path.append((node % width, node // width))
+        total_path.reverse()
+        return total_path
+
+    def find_path(self, grid: Grid, start: Tuple[int, int], end: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """
+        کوتاه‌ترین مسیر (۴ یا ۸-همسایگی) بین دو نقطه را پیدا می‌کند.
+
+        Args:
+            grid (Grid): گرید شبیه‌سازی که شامل موانع است.
+            start (Tuple[int, int]): مختصات گرید نقطه شروع.
+            end (Tuple[int, int]): مختصات گرید نقطه پایان.
+
+        Returns:
+            Optional[List[Tuple[int, int]]]: لیستی از مختصات گرید که مسیر را تشکیل می‌دهند، یا None اگر مسیری پیدا نشود.
+        """
+        logger.debug(f"Array A* pathfinding started from {start} to {end}.")
+        self.last_expanded = 0
+        sx, sy = int(start[0]), int(start[1])
+        ex, ey = int(end[0]), int(end[1])
+        if grid.is_obstacle(sx, sy) or grid.is_obstacle(ex, ey):
+            logger.warning("Start or end cell is invalid or an obstacle.")
+            return None
+
+        gen = self._prepare(grid)
+        width, height = grid.width, grid.height
+        blocked, cost, h_scale = self._blocked, self._cost, self._min_cost
+        diagonal, moves = self.diagonal, self._moves
+        g, parent, seen, closed = self._g, self._parent, self._seen, self._closed
+
+        start_node = sy * width + sx
+        end_node = ey * width + ex
+        g[start_node] = 0.0
+        parent[start_node] = start_node
+        seen[start_node] = gen
+
+        if diagonal:
+            h0 = octile_distance(sx - ex, sy - ey) * h_scale
+        else:
+            h0 = (abs(sx - ex) + abs(sy - ey)) * h_scale
+        open_set = [(h0, h0, start_node)]
+        heappush, heappop = heapq.heappush, heapq.heappop
+        expanded = 0
+
+        while open_set:
+            _, _, node = heappop(open_set)
+            if closed[node] == gen:
+                continue
+            closed[node] = gen
+            expanded += 1
+
+            if node == end_node:
+                self.last_expanded = expanded
+                logger.info(f"Path found from {start} to {end}.")
+                return self._reconstruct_path(node, start_node, width)
+
+            x, y = node % width, node // width
+            g_node = g[node]
+            for dx, dy, step in moves:
+                nx, ny = x + dx, y + dy
+                if nx < 0 or ny < 0 or nx >= width or ny >= height:
+                    continue
+                nb = ny * width + nx
+                if blocked[nb] or closed[nb] == gen:
+                    continue
+                if dx and dy and (blocked[node + dx] or blocked[node + dy * width]):
+                    # No corner cutting around obstacles
+                    continue
+                tentative = g_node + (step * cost[nb] if cost is not None else step)
+                if seen[nb] != gen or tentative < g[nb]:
+                    seen[nb] = gen
+                    g[nb] = tentative
+                    parent[nb] = node
+                    if diagonal:
+                        h = octile_distance(nx - ex, ny - ey) * h_scale
+                    else:
+                        h = (abs(nx - ex) + abs(ny - ey)) * h_scale
+                    heappush(open_set, (tentative + h, h, nb))
+
+        self.last_expanded = expanded
+        logger.warning(f"No path could be found from {start} to {end}.")
+        return None
@@ -0,0 +1,354 @@
+# FILE: skymind_sim/layer_3_intelligence/pathfinding/hpa_star.py
+
+import heapq
+import numpy as np
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+from skymind_sim.layer_1_simulation.world.grid import Grid
+from skymind_sim.utils.log_manager import LogManager
+from .grid_a_star import GridAStarPlanner
+
+logger = LogManager.get_logger(__name__)
+
+# Runs of free border cells at least this long get two entrances (one at each end).
+_WIDE_ENTRANCE = 6
+
+Cluster = Tuple[int, int]
+
+
+class HierarchicalPlanner:
+    """
+    مسیریابی سلسله‌مراتبی HPA* برای نقشه‌های بزرگ.
+
+    گرید به خوشه‌های cluster_size×cluster_size تقسیم می‌شود. روی مرز هر دو خوشه
+    مجاور «ورودی‌ها» (entrance) ساخته می‌شوند و فاصله ورودی‌ها درون هر خوشه
+    یک بار برای هر نسخه لایه موانع محاسبه و کش می‌شود. پرس‌وجوهای دوربرد ابتدا
+    روی این گراف انتزاعی کوچک حل می‌شوند و سپس هر یال به صورت محلی درون خوشه
+    خودش پالایش می‌شود. مسیرها نزدیک به بهینه‌اند (نه لزوماً کوتاه‌ترین).
+
+    وقتی خانه‌هایی از گرید تغییر می‌کنند، با کمک `Grid.changes_since` فقط
+    ورودی‌ها و فاصله‌های خوشه‌های آسیب‌دیده و همسایگانشان دوباره ساخته می‌شوند.
+    برای گریدهای دارای لایه هزینه، به A* آرایه‌ای برمی‌گردد.
+    """
+
+    def __init__(self, cluster_size: int = 16):
+        if cluster_size < 2:
+            raise ValueError("cluster_size must be at least 2.")
+        self.cluster_size = cluster_size
+        self._fallback = GridAStarPlanner()
+        self._grid_id = None
+        self._version = -1
+        self._shape = (0, 0)
+        self._blocked = b''
+        self._free: Optional[np.ndarray] = None
+        # (cluster_a, cluster_b) -> [(node_in_a, node_in_b), ...]
+        self._borders: Dict[Tuple[Cluster, Cluster], List[Tuple[int, int]]] = {}
+        # cluster -> {entrance node: number of borders using it}
+        self._cluster_entrances: Dict[Cluster, Dict[int, int]] = {}
+        self._inter: Dict[int, List[int]] = {}
+        self._intra: Dict[Cluster, Dict[int, List[Tuple[int, int]]]] = {}
+        self.last_expanded = 0
+
+    # ------------------------------------------------------------------
+    # Abstraction
+    # ------------------------------------------------------------------
+    def _cluster_of(self, node: int) -> Cluster:
+        width = self._shape[0]
+        return (node % width) // self.cluster_size, (node // width) // self.cluster_size
+
+    def _cluster_bounds(self, cluster: Cluster) -> Tuple[int, int, int, int]:
+        cs = self.cluster_size
+        x0, y0 = cluster[0] * cs, cluster[1] * cs
+        return x0, y0, min(x0 + cs, self._shape[0]), min(y0 + cs, self._shape[1])
+
+    def _clusters_count(self) -> Tuple[int, int]:
+        cs = self.cluster_size
+        return -(-self._shape[0] // cs), -(-self._shape[1] // cs)
+
+    def _build_border(self, a: Cluster, b: Cluster):
+        """ورودی‌های مرز بین خوشه a و خوشه مجاور راست/پایین آن (b) را می‌سازد."""
+        width = self._shape[0]
+        blocked = self._blocked
+        x0, y0, x1, y1 = self._cluster_bounds(a)
+        if b[0] > a[0]:
+            # Vertical border: column x1-1 in a, column x1 in b
+            pairs = [((y * width + x1 - 1), (y * width + x1)) for y in range(y0, y1)]
+        else:
+            # Horizontal border: row y1-1 in a, row y1 in b
+            pairs = [(((y1 - 1) * width + x), (y1 * width + x)) for x in range(x0, x1)]
+
+        entrances = []
+        run: List[Tuple[int, int]] = []
+        for pair in pairs + [None]:
+            if pair is not None and not blocked[pair[0]] and not blocked[pair[1]]:
+                run.append(pair)
+                continue
+            if run:
+                if len(run) >= _WIDE_ENTRANCE:
+                    entrances.extend((run[0], run[-1]))
+                else:
+                    entrances.append(run[len(run) // 2])
+                run = []
+        self._set_border(a, b, entrances)
+
+    def _set_border(self, a: Cluster, b: Cluster, entrances: List[Tuple[int, int]]):
+        """ورودی‌های یک مرز را جایگزین و جدول‌های ورودی/یال‌های بین‌خوشه‌ای را به‌روز می‌کند."""
+        for node_a, node_b in self._borders.pop((a, b), []):
+            for cluster, node, other in ((a, node_a, node_b), (b, node_b, node_a)):
+                counts = self._cluster_entrances[cluster]
+                counts[node] -= 1
+                if not counts[node]:
+                    del counts[node]
+                self._inter[node].remove(other)
+                if not self._inter[node]:
+                    del self._inter[node]
+        if not entrances:
+            return
+        self._borders[(a, b)] = entrances
+        for node_a, node_b in entrances:
+            for cluster, node, other in ((a, node_a, node_b), (b, node_b, node_a)):
+                counts = self._cluster_entrances.setdefault(cluster, {})
+                counts[node] = counts.get(node, 0) + 1
+                self._inter.setdefault(node, []).append(other)
+
+    def _rebuild_borders(self, clusters: Optional[Set[Cluster]] = None):
+        """ورودی‌های همه مرزها (یا فقط مرزهای خوشه‌های داده‌شده) را دوباره می‌سازد."""
+        ncx, ncy = self._clusters_count()
+        if clusters is None:
+            self._borders.clear()
+            self._cluster_entrances.clear()
+            self._inter.clear()
+            clusters = {(cx, cy) for cx in range(ncx) for cy in range(ncy)}
+            owners = clusters
+        else:
+            # A cluster's left/top borders are owned by its left/top neighbour.
+            owners = set()
+            for cx, cy in clusters:
+                owners.update({(cx, cy), (cx - 1, cy), (cx, cy - 1)})
+        for cx, cy in owners:
+            if not (0 <= cx < ncx and 0 <= cy < ncy):
+                continue
+            if cx + 1 < ncx:
+                self._build_border((cx, cy), (cx + 1, cy))
+            if cy + 1 < ncy:
+                self._build_border((cx, cy), (cx, cy + 1))
+
+    def _sync(self, grid: Grid):
+        """انتزاع را با نسخه فعلی لایه موانع گرید هماهنگ می‌کند."""
+        if id(grid) == self._grid_id and grid.version == self._version:
+            return
+        changed = None
+        if id(grid) == self._grid_id and self._shape == (grid.width, grid.height):
+            changed = grid.changes_since(self._version)
+
+        self._blocked = grid.occupancy.tobytes()
+        self._free = grid.occupancy == 0
+        self._shape = (grid.width, grid.height)
+        if changed is None:
+            logger.debug(f"HPA* building abstraction for {grid.width}x{grid.height} grid.")
+            self._rebuild_borders()
+            self._intra.clear()
+        elif changed.size:
+            dirty = {self._cluster_of(int(node)) for node in changed}
+            logger.debug(f"HPA* refreshing {len(dirty)} cluster(s) after {changed.size} cell change(s).")
+            self._rebuild_borders(dirty)
+            for cx, cy in dirty:
+                for cluster in ((cx, cy), (cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)):
+                    self._intra.pop(cluster, None)
+        self._grid_id = id(grid)
+        self._version = grid.version
+
+    def _local_bfs(self, source: int, cluster: Cluster) -> Tuple[Dict[int, int], Dict[int, int]]:
+        """BFS محدود به یک خوشه؛ فاصله و والد هر خانه قابل دسترس را برمی‌گرداند."""
+        width = self._shape[0]
+        blocked = self._blocked
+        x0, y0, x1, y1 = self._cluster_bounds(cluster)
+        dist = {source: 0}
+        parent = {source: source}
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            x, y = node % width, node // width
+            d = dist[node] + 1
+            for nx, ny, nb in ((x + 1, y, node + 1), (x - 1, y, node - 1),
+                               (x, y + 1, node + width), (x, y - 1, node - width)):
+                if x0 <= nx < x1 and y0 <= ny < y1 and nb not in dist and not blocked[nb]:
+                    dist[nb] = d
+                    parent[nb] = node
+                    queue.append(nb)
+        return dist, parent
+
+    def _intra_edges(self, cluster: Cluster) -> Dict[int, List[Tuple[int, int]]]:
+        """
+        فاصله ورودی‌به‌ورودی درون یک خوشه (با کش به ازای نسخه موانع).
+
+        همه ورودی‌های خوشه با یک BFS چندمبدأیی برداری روی آرایه (k, h, w)
+        هم‌زمان پیمایش می‌شوند.
+        """
+        edges = self._intra.get(cluster)
+        if edges is not None:
+            return edges
+
+        entrances = list(self._cluster_entrances.get(cluster, ()))
+        edges = {}
+        if entrances:
+            width = self._shape[0]
+            x0, y0, x1, y1 = self._cluster_bounds(cluster)
+            free = self._free[y0:y1, x0:x1]
+            xs = np.array([e % width for e in entrances]) - x0
+            ys = np.array([e // width for e in entrances]) - y0
+            k = len(entrances)
+            dist = np.full((k, y1 - y0, x1 - x0), -1, dtype=np.int32)
+            frontier = np.zeros(dist.shape, dtype=bool)
+            frontier[np.arange(k), ys, xs] = True
+            dist[frontier] = 0
+            level = 0
+            while frontier.any():
+                level += 1
+                grown = np.zeros_like(frontier)
+                grown[:, :, 1:] |= frontier[:, :, :-1]
+                grown[:, :, :-1] |= frontier[:, :, 1:]
+                grown[:, 1:, :] |= frontier[:, :-1, :]
+                grown[:, :-1, :] |= frontier[:, 1:, :]
+                grown &= free
+                grown &= dist < 0
+                dist[grown] = level
+                frontier = grown
+            pair_dist = dist[:, ys, xs].tolist()
+            for i, entrance in enumerate(entrances):
+                row = pair_dist[i]
+                edges[entrance] = [(entrances[j], row[j]) for j in range(k) if j != i and row[j] > 0]
+        self._intra[cluster] = edges
+        return edges
+
+    def precompute(self, grid: Grid):
+        """همه فاصله‌های درون‌خوشه‌ای را از پیش محاسبه می‌کند (مثلاً پیش از اولین tick)."""
+        self._sync(grid)
+        ncx, ncy = self._clusters_count()
+        for cx in range(ncx):
+            for cy in range(ncy):
+                self._intra_edges((cx, cy))
+        logger.info(f"HPA* precomputed {ncx * ncy} clusters with {len(self._inter)} entrance nodes.")
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def _local_path(self, u: int, v: int, cluster: Cluster) -> Optional[List[int]]:
+        _, parent = self._local_bfs(u, cluster)
+        if v not in parent:
+            return None
+        nodes = [v]
+        while nodes[-1] != u:
+            nodes.append(parent[nodes[-1]])
+        nodes.reverse()
+        return nodes
+
+    def find_path(self, grid: Grid, start: Tuple[int, int], end: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """
+        مسیر را ابتدا روی گراف انتزاعی و سپس با پالایش محلی پیدا می‌کند.
+
+        Args:
+            grid (Grid): گرید شبیه‌سازی که شامل موانع است.
+            start (Tuple[int, int]): مختصات گرید نقطه شروع.
+            end (Tuple[int, int]): مختصات گرید نقطه پایان.
+
+        Returns:
+            Optional[List[Tuple[int, int]]]: لیستی از مختصات گرید که مسیر را تشکیل می‌دهند، یا None اگر مسیری پیدا نشود.
+        """
+        if grid.cost is not None:
+            logger.warning("HPA* requires a uniform-cost grid; falling back to array A*.")
+            return self._fallback.find_path(grid, start, end)
+
+        sx, sy = int(start[0]), int(start[1])
+        ex, ey = int(end[0]), int(end[1])
+        if grid.is_obstacle(sx, sy) or grid.is_obstacle(ex, ey):
+            logger.warning("Start or end cell is invalid or an obstacle.")
+            return None
+
+        self._sync(grid)
+        width = grid.width
+        start_node, end_node = sy * width + sx, ey * width + ex
+        start_cluster, end_cluster = self._cluster_of(start_node), self._cluster_of(end_node)
+
+        if start_cluster == end_cluster:
+            local = self._local_path(start_node, end_node, start_cluster)
+            if local is not None:
+                self.last_expanded = 0
+                return [(n % width, n // width) for n in local]
+
+        # Temporary edges joining start/goal to the entrances of their clusters
+        start_dist, _ = self._local_bfs(start_node, start_cluster)
+        start_edges = [(e, start_dist[e]) for e in self._cluster_entrances.get(start_cluster, [])
+                       if e in start_dist]
+        goal_dist, _ = self._local_bfs(end_node, end_cluster)
+        goal_edges = {e: goal_dist[e] for e in self._cluster_entrances.get(end_cluster, [])
+                      if e in goal_dist}
+
+        abstract = self._abstract_search(start_node, end_node, start_edges, goal_edges, ex, ey)
+        if abstract is None:
+            logger.warning(f"No path could be found from {start} to {end}.")
+            return None
+
+        # Refinement: expand every abstract edge inside its own cluster
+        nodes = [abstract[0]]
+        for u, v in zip(abstract, abstract[1:]):
+            if u == v:
+                continue
+            if v in self._inter.get(u, ()):
+                nodes.append(v)
+                continue
+            segment = self._local_path(u, v, self._cluster_of(u))
+            nodes.extend(segment[1:])
+        logger.info(f"Path found from {start} to {end}.")
+        return [(n % width, n // width) for n in nodes]
+
+    def _abstract_search(self, start_node: int, end_node: int, start_edges, goal_edges,
+                         ex: int, ey: int) -> Optional[List[int]]:
+        """A* روی گراف ورودی‌ها، با یال‌های موقت برای مبدا و مقصد."""
+        width = self._shape[0]
+
+        def h(node: int) -> int:
+            return abs(node % width - ex) + abs(node // width - ey)
+
+        # Node ids: entrances are flat cell indices; -1 / -2 stand for start / goal.
+        START, GOAL = -1, -2
+        g = {START: 0}
+        parent = {START: START}
+        open_set = [(h(start_node), h(start_node), START)]
+        closed = set()
+        expanded = 0
+        while open_set:
+            _, _, node = heapq.heappop(open_set)
+            if node in closed:
+                continue
+            closed.add(node)
+            expanded += 1
+            if node == GOAL:
+                self.last_expanded = expanded
+                path = []
+                while node != START:
+                    path.append(node)
+                    node = parent[node]
+                path.reverse()
+                return [start_node] + [end_node if n == GOAL else n for n in path]
+
+            if node == START:
+                edges = start_edges
+            else:
+                edges = [(n, 1) for n in self._inter.get(node, ())]
+                edges += self._intra_edges(self._cluster_of(node)).get(node, [])
+                if node in goal_edges:
+                    edges.append((GOAL, goal_edges[node]))
+            g_node = g[node]
+            for neighbor, cost in edges:
+                if neighbor in closed:
+                    continue
+                tentative = g_node + cost
+                if tentative < g.get(neighbor, float('inf')):
+                    g[neighbor] = tentative
+                    parent[neighbor] = node
+                    hn = 0 if neighbor == GOAL else h(neighbor)
+                    heapq.heappush(open_set, (tentative + hn, hn, neighbor))
+        self.last_expanded = expanded
+        return None
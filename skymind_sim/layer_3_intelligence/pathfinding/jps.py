@@ -0,0 +1,203 @@
+# FILE: skymind_sim/layer_3_intelligence/pathfinding/jps.py
+
+import heapq
+from typing import List, Tuple, Optional
+
+from skymind_sim.layer_1_simulation.world.grid import Grid
+from skymind_sim.utils.log_manager import LogManager
+from .grid_a_star import GridAStarPlanner, octile_distance
+
+logger = LogManager.get_logger(__name__)
+
+
+def _sign(v: int) -> int:
+    return (v > 0) - (v < 0)
+
+
+class JumpPointPlanner(GridAStarPlanner):
+    """
+    الگوریتم Jump Point Search برای گریدهای ۸-همسایگی با هزینه یکنواخت.
+
+    به جای افزودن تک‌تک همسایه‌ها به صف، در هر جهت تا رسیدن به یک «نقطه پرش»
+    (خانه‌ای با همسایه اجباری یا خود هدف) جلو می‌رود و فقط همان نقاط را
+    گسترش می‌دهد. قوانین حرکت قطری همانند GridAStarPlanner(diagonal=True)
+    است (بدون بریدن گوشه موانع)، پس طول مسیرها با A* octile برابر است.
+    از فضای کاری و آرایه‌های نسل‌دار GridAStarPlanner استفاده می‌کند.
+    اگر گرید لایه هزینه داشته باشد، به A* octile معمولی برمی‌گردد.
+    """
+
+    def __init__(self):
+        super().__init__(diagonal=True)
+
+    def _walkable(self, x: int, y: int) -> bool:
+        return 0 <= x < self._shape[0] and 0 <= y < self._shape[1] and not self._blocked[y * self._shape[0] + x]
+
+    def _jump(self, x: int, y: int, dx: int, dy: int, ex: int, ey: int) -> Optional[Tuple[int, int]]:
+        """
+        از خانه (x, y) که با جهت (dx, dy) به آن وارد شده‌ایم، تا نقطه پرش بعدی
+        به صورت تکراری (بدون بازگشت) پیش می‌رود.
+        """
+        walkable = self._walkable
+        while True:
+            if not walkable(x, y):
+                return None
+            if x == ex and y == ey:
+                return x, y
+            if dx and dy:
+                # A diagonal step is a jump point if either straight sweep finds one.
+                if self._jump(x + dx, y, dx, 0, ex, ey) or self._jump(x, y + dy, 0, dy, ex, ey):
+                    return x, y
+                if not (walkable(x + dx, y) and walkable(x, y + dy)):
+                    return None
+            elif dx:
+                if ((walkable(x, y - 1) and not walkable(x - dx, y - 1)) or
+                        (walkable(x, y + 1) and not walkable(x - dx, y + 1))):
+                    return x, y
+            else:
+                if ((walkable(x - 1, y) and not walkable(x - 1, y - dy)) or
+                        (walkable(x + 1, y) and not walkable(x + 1, y - dy))):
+                    return x, y
+            x += dx
+            y += dy
+
+    def _pruned_neighbors(self, x: int, y: int, px: int, py: int) -> List[Tuple[int, int]]:
+        """همسایه‌های طبیعی و اجباری خانه (x, y) با توجه به جهت ورود از والد را برمی‌گرداند."""
+        walkable = self._walkable
+        if px < 0:
+            # Start node: every legal 8-connected move
+            result = []
+            for dx, dy, _ in self._moves:
+                if not walkable(x + dx, y + dy):
+                    continue
+                if dx and dy and not (walkable(x + dx, y) and walkable(x, y + dy)):
+                    continue
+                result.append((dx, dy))
+            return result
+
+        dx, dy = _sign(x - px), _sign(y - py)
+        result = []
+        if dx and dy:
+            can_y, can_x = walkable(x, y + dy), walkable(x + dx, y)
+            if can_y:
+                result.append((0, dy))
+            if can_x:
+                result.append((dx, 0))
+            if can_x and can_y:
+                result.append((dx, dy))
+        elif dx:
+            next_ok = walkable(x + dx, y)
+            up_ok, down_ok = walkable(x, y + 1), walkable(x, y - 1)
+            if next_ok:
+                result.append((dx, 0))
+                if up_ok:
+                    result.append((dx, 1))
+                if down_ok:
+                    result.append((dx, -1))
+            if up_ok:
+                result.append((0, 1))
+            if down_ok:
+                result.append((0, -1))
+        else:
+            next_ok = walkable(x, y + dy)
+            right_ok, left_ok = walkable(x + 1, y), walkable(x - 1, y)
+            if next_ok:
+                result.append((0, dy))
+                if right_ok:
+                    result.append((1, dy))
+                if left_ok:
+                    result.append((-1, dy))
+            if right_ok:
+                result.append((1, 0))
+            if left_ok:
+                result.append((-1, 0))
+        return result
+
+    def _expand_path(self, jump_points: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """نقاط پرش را به مسیر پیوسته خانه‌به‌خانه تبدیل می‌کند."""
+        total_path = [jump_points[0]]
+        for (x0, y0), (x1, y1) in zip(jump_points, jump_points[1:]):
+            dx, dy = _sign(x1 - x0), _sign(y1 - y0)
+            x, y = x0, y0
+            while (x, y) != (x1, y1):
+                x += dx
+                y += dy
+                total_path.append((x, y))
+        return total_path
+
+    def find_path(self, grid: Grid, start: Tuple[int, int], end: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """
+        کوتاه‌ترین مسیر ۸-همسایگی را با JPS پیدا می‌کند.
+
+        Args:
+            grid (Grid): گرید شبیه‌سازی که شامل موانع است.
+            start (Tuple[int, int]): مختصات گرید نقطه شروع.
+            end (Tuple[int, int]): مختصات گرید نقطه پایان.
+
+        Returns:
+            Optional[List[Tuple[int, int]]]: لیستی از مختصات گرید که مسیر را تشکیل می‌دهند، یا None اگر مسیری پیدا نشود.
+        """
+        if grid.cost is not None:
+            logger.warning("JPS requires a uniform-cost grid; falling back to octile A*.")
+            return super().find_path(grid, start, end)
+
+        logger.debug(f"JPS pathfinding started from {start} to {end}.")
+        self.last_expanded = 0
+        sx, sy = int(start[0]), int(start[1])
+        ex, ey = int(end[0]), int(end[1])
+        if grid.is_obstacle(sx, sy) or grid.is_obstacle(ex, ey):
+            logger.warning("Start or end cell is invalid or an obstacle.")
+            return None
+
+        gen = self._prepare(grid)
+        width = grid.width
+        g, parent, seen, closed = self._g, self._parent, self._seen, self._closed
+
+        start_node = sy * width + sx
+        end_node = ey * width + ex
+        g[start_node] = 0.0
+        parent[start_node] = start_node
+        seen[start_node] = gen
+
+        h0 = octile_distance(sx - ex, sy - ey)
+        open_set = [(h0, h0, start_node)]
+        heappush, heappop = heapq.heappush, heapq.heappop
+        expanded = 0
+
+        while open_set:
+            _, _, node = heappop(open_set)
+            if closed[node] == gen:
+                continue
+            closed[node] = gen
+            expanded += 1
+
+            if node == end_node:
+                self.last_expanded = expanded
+                logger.info(f"Path found from {start} to {end}.")
+                return self._expand_path(self._reconstruct_path(node, start_node, width))
+
+            x, y = node % width, node // width
+            if node == start_node:
+                px = py = -1
+            else:
+                p = parent[node]
+                px, py = p % width, p // width
+            g_node = g[node]
+            for dx, dy in self._pruned_neighbors(x, y, px, py):
+                point = self._jump(x + dx, y + dy, dx, dy, ex, ey)
+                if point is None:
+                    continue
+                jx, jy = point
+                nb = jy * width + jx
+                if closed[nb] == gen:
+                    continue
+                tentative = g_node + octile_distance(jx - x, jy - y)
+                if seen[nb] != gen or tentative < g[nb]:
+                    seen[nb] = gen
+                    g[nb] = tentative
+                    parent[nb] = node
+                    h = octile_distance(jx - ex, jy - ey)
+                    heappush(open_set, (tentative + h, h, nb))
+
+        self.last_expanded = expanded
+        logger.warning(f"No path could be found from {start} to {end}.")
+        return None
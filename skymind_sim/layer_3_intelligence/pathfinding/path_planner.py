@@ -1,8 +1,14 @@
 # FILE: skymind_sim/layer_3_intelligence/pathfinding/path_planner.py
 
-from typing import Optional, List, Tuple
+from collections import OrderedDict
+from typing import Dict, Optional, List, Tuple
 from skymind_sim.layer_1_simulation.world.grid import Grid
 from .a_star import AStarPlanner
+from .grid_a_star import GridAStarPlanner
+from .jps import JumpPointPlanner
+from .flow_field import FlowField
+from .d_star_lite import DStarLitePlanner
+from .hpa_star import HierarchicalPlanner
 
 # === شروع تغییرات ===
 # 1. وارد کردن LogManager به جای Logger
@@ -17,24 +23,51 @@ class PathPlanner:
     کلاسی برای مدیریت و انتخاب الگوریتم‌های مسیریابی.
     این کلاس به عنوان یک facade عمل می‌کند تا بتوان به راحتی الگوریتم مسیریابی را تغییر داد.
     """
-    def __init__(self, algorithm: str = "A_STAR"):
+    # نام الگوریتم -> (سازنده، توضیح برای لاگ)
+    _ALGORITHMS = {
+        "A_STAR": (AStarPlanner, "A* pathfinding algorithm selected."),
+        "GRID_A_STAR": (GridAStarPlanner, "Array-based A* pathfinding algorithm selected."),
+        "OCTILE_A_STAR": (lambda: GridAStarPlanner(diagonal=True), "8-connected octile A* pathfinding algorithm selected."),
+        "JPS": (JumpPointPlanner, "Jump Point Search pathfinding algorithm selected."),
+        "D_STAR_LITE": (DStarLitePlanner, "Incremental D* Lite pathfinding algorithm selected."),
+        "HPA_STAR": (HierarchicalPlanner, "Hierarchical HPA* pathfinding algorithm selected."),
+    }
+
+    def __init__(self, algorithm: str = "A_STAR", cache_size: int = 1024, flow_field_cache_size: int = 16):
         """
         یک الگوریتم مسیریابی را بر اساس نام آن مقداردهی اولیه می‌کند.
         
         Args:
-            algorithm (str): نام الگوریتم مسیریابی (مثلاً "A_STAR").
+            algorithm (str): نام الگوریتم مسیریابی ("A_STAR"، "GRID_A_STAR"، "OCTILE_A_STAR"، "JPS"، "D_STAR_LITE" یا "HPA_STAR").
+            cache_size (int): حداکثر تعداد مسیرهای نگهداری‌شده در کش LRU (صفر یعنی بدون کش).
+            flow_field_cache_size (int): حداکثر تعداد میدان‌های جریان نگهداری‌شده (برای اهداف مشترک).
         """
         self._planner = None
-        if algorithm.upper() == "A_STAR":
-            self._planner = AStarPlanner()
-            logger.info("A* pathfinding algorithm selected.")
+        self.algorithm = algorithm.upper()
+
+        # کش LRU مسیرها: (start, end, algorithm, grid.version) -> path
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[tuple, Optional[List[Tuple[int, int]]]]" = OrderedDict()
+        self._cache_grid: Tuple[Optional[int], int] = (None, -1)
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # میدان‌های جریان به ازای هر هدف مشترک: goal -> FlowField
+        self.flow_field_cache_size = flow_field_cache_size
+        self._flow_fields: "OrderedDict[Tuple[int, int], FlowField]" = OrderedDict()
+
+        if self.algorithm in self._ALGORITHMS:
+            factory, message = self._ALGORITHMS[self.algorithm]
+            self._planner = factory()
+            logger.info(message)
         else:
             # در آینده می‌توان الگوریتم‌های دیگری مثل Dijkstra, D*, ... را اضافه کرد.
             error_msg = f"Algorithm '{algorithm}' is not supported."
             logger.error(error_msg)
             raise ValueError(error_msg)
 
-    def plan_path(self, grid: Grid, start: Tuple[int, int], end: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+    def plan_path(self, grid: Grid, start: Tuple[int, int], end: Tuple[int, int],
+                  agent_id: Optional[str] = None) -> Optional[List[Tuple[int, int]]]:
         """
         یک مسیر را با استفاده از الگوریتم انتخاب شده برنامه‌ریزی می‌کند.
 
@@ -42,6 +75,8 @@ class PathPlanner:
             grid (Grid): گرید شبیه‌سازی.
             start (Tuple[int, int]): نقطه شروع (مختصات گرید).
             end (Tuple[int, int]): نقطه پایان (مختصات گرید).
+            agent_id (Optional[str]): شناسه پهپاد؛ الگوریتم‌های افزایشی (D* Lite) وضعیت
+                                      جستجو را به ازای آن نگه می‌دارند و کش مسیر را دور می‌زنند.
 
         Returns:
             Optional[List[Tuple[int, int]]]: لیستی از نقاط مسیر یا None در صورت عدم موفقیت.
@@ -49,6 +84,80 @@ class PathPlanner:
         if not self._planner:
             logger.error("No pathfinding algorithm has been initialized.")
             return None
-        
+
+        start = (int(start[0]), int(start[1]))
+        end = (int(end[0]), int(end[1]))
+        if getattr(self._planner, "incremental", False):
+            return self._planner.find_path(grid, start, end, agent_id=agent_id)
+        if self.cache_size <= 0:
+            return self._planner.find_path(grid, start, end)
+
+        self._sync_grid(grid)
+        key = (start, end, self.algorithm, grid.version)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            path = self._cache[key]
+            return list(path) if path is not None else None
+
+        self.cache_misses += 1
         logger.debug(f"PathPlanner delegating path planning from {start} to {end} to the selected algorithm.")
-        return self._planner.find_path(grid, start, end)
+        path = self._planner.find_path(grid, start, end)
+        self._cache[key] = tuple(path) if path is not None else None
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return path
+
+    def get_flow_field(self, grid: Grid, goal: Tuple[int, int]) -> FlowField:
+        """
+        میدان جریان معکوس به سمت یک هدف را برمی‌گرداند و آن را برای پهپادهایی
+        که همین هدف را دارند نگه می‌دارد.
+
+        Args:
+            grid (Grid): گرید شبیه‌سازی.
+            goal (Tuple[int, int]): هدف مشترک (مختصات گرید).
+
+        Returns:
+            FlowField: میدانی که گام بعدی هر خانه را در O(1) می‌دهد.
+        """
+        goal = (int(goal[0]), int(goal[1]))
+        self._sync_grid(grid)
+        field = self._flow_fields.get(goal)
+        if field is not None:
+            self._flow_fields.move_to_end(goal)
+            return field
+
+        field = FlowField(grid, goal)
+        if self.flow_field_cache_size > 0:
+            self._flow_fields[goal] = field
+            if len(self._flow_fields) > self.flow_field_cache_size:
+                self._flow_fields.popitem(last=False)
+        return field
+
+    def _sync_grid(self, grid: Grid):
+        """هر تغییر در لایه موانع (grid.version) تمام داده‌های کش‌شده را باطل می‌کند."""
+        grid_key = (id(grid), grid.version)
+        if grid_key != self._cache_grid:
+            if self._cache or self._flow_fields:
+                logger.debug(
+                    f"Obstacle layer changed; invalidating {len(self._cache)} cached path(s) "
+                    f"and {len(self._flow_fields)} flow field(s)."
+                )
+            self._cache.clear()
+            self._flow_fields.clear()
+            self._cache_grid = grid_key
+
+    def clear_cache(self):
+        """تمام مسیرها و میدان‌های جریان کش‌شده را حذف می‌کند (شمارنده‌ها حفظ می‌شوند)."""
+        self._cache.clear()
+        self._flow_fields.clear()
+        self._cache_grid = (None, -1)
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """آمار کش مسیر (تعداد hit، miss و اندازه فعلی) را برمی‌گرداند."""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._cache),
+            "capacity": self.cache_size,
+        }
@@ -1,11 +1,14 @@
 # skymind_sim/main.py
 
 import sys
+import argparse
 import traceback
 import pygame
 from skymind_sim.utils.config_loader import ConfigLoader
 from skymind_sim.utils.log_manager import LogManager
+from skymind_sim.layer_0_presentation.asset_preloader import AssetPreloader
 from skymind_sim.layer_1_simulation.simulation import Simulation
+from skymind_sim.layer_1_simulation.replay import ReplayEngine, ReplayRecorder
 
 # این باید اولین چیزی باشد که اجرا می‌شود تا loggerها به درستی کار کنند
 # و بتوانند فرآیند بارگذاری تنظیمات را نیز لاگ کنند.
@@ -14,10 +17,32 @@ LogManager.initialize()
 # حالا که لاگر آماده است، یک لاگر برای این ماژول می‌گیریم
 logger = LogManager.get_logger(__name__)
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    """آرگومان‌های خط فرمان را تجزیه می‌کند."""
+    parser = argparse.ArgumentParser(description="SkyMind drone simulator")
+    parser.add_argument("--headless", action="store_true",
+                        help="run without a display, sprites or frame pacing")
+    parser.add_argument("--steps", type=int, default=None,
+                        help="number of simulation steps to run (default: until closed)")
+    parser.add_argument("--dt", type=float, default=None,
+                        help="fixed time step in seconds (default: 1/fps)")
+    parser.add_argument("--threaded", action="store_true",
+                        help="run the simulation on a worker thread, separate from rendering")
+    parser.add_argument("--record", metavar="PATH", default=None,
+                        help="write a replay log of inputs and time steps to PATH")
+    parser.add_argument("--replay", metavar="PATH", default=None,
+                        help="re-drive the simulation from a replay log instead of live input")
+    parser.add_argument("--replay-from", type=int, default=None, metavar="TICK",
+                        help="fast-forward without rendering up to TICK, then play back normally")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """
     نقطه ورود اصلی برای اجرای شبیه‌ساز SkyMind.
     """
+    args = parse_args(argv)
+    preloader = None
     try:
         # مقداردهی اولیه ماژول‌های اصلی
         
@@ -28,12 +53,29 @@ def main():
         # ۲. مقداردهی اولیه Pygame
         # بهتر است بعد از بارگذاری تنظیمات باشد، شاید تنظیماتی برای pygame هم داشته باشیم.
         pygame.init()
+
+        # ۳. پیش‌بارگذاری موازی تصاویر و فونت‌ها طبق assets/manifest.json
+        # همزمان با ساخت پنجره و جهان اجرا می‌شود؛ دارایی‌های lazy در پس‌زمینه بارگذاری می‌شوند.
+        if not args.headless:
+            preloader = AssetPreloader().start()
         
-        # ۳. ایجاد و اجرای شبیه‌سازی
+        # ۴. ایجاد و اجرای شبیه‌سازی
         # حالا که همه چیز آماده است، شبیه‌ساز را می‌سازیم.
         logger.info("Starting simulation...")
-        sim = Simulation()
-        sim.run()
+        sim = Simulation(headless=args.headless or None, threaded=args.threaded or None)
+        if preloader is not None:
+            preloader.wait_startup(progress=lambda done, total, name:
+                                   logger.info(f"Loaded asset {done}/{total}: {name}"))
+        if args.replay:
+            engine = ReplayEngine(args.replay)
+            until = None if args.steps is None else args.steps - 1
+            engine.run(sim, until_tick=until, render_from=args.replay_from if args.replay_from is not None else 0)
+        elif args.record:
+            with ReplayRecorder(args.record, meta={"fps": sim.fps, "headless": sim.headless}) as recorder:
+                sim.recorder = recorder
+                sim.run(steps=args.steps, dt=args.dt)
+        else:
+            sim.run(steps=args.steps, dt=args.dt)
 
     except Exception as e:
         # استفاده از لاگر برای ثبت خطاهای پیش‌بینی نشده
@@ -42,6 +84,8 @@ def main():
         
     finally:
         # اطمینان از خروج تمیز از برنامه
+        if preloader is not None:
+            preloader.shutdown()
         pygame.quit()
         logger.info("Pygame has been quit. Simulation finished.")
         # sys.exit() به طور خودکار در پایان اسکریپت اصلی اتفاق می‌افتد،
@@ -1,65 +1,190 @@
 # D:\Payannameh\SkyMind_Sim\skymind_sim\network\communication.py
 import math
 import random
-import time
+
+from skymind_sim.utils.event_system import Event, EventQueue, EventType
+from skymind_sim.utils.spatial_hash import SpatialHash
 
 class UAVCommChannel:
     """
     شبیه‌ساز انتزاعی کانال ارتباطی پهپادها
+
+    تاخیر ارسال در زمان شبیه‌سازی‌شده محاسبه می‌شود و هیچ‌گاه نخ اجرا را
+    متوقف نمی‌کند؛ تحویل پیام‌ها توسط UAVNetworkManager زمان‌بندی می‌شود.
+    اتلاف بسته‌ها از مولد تصادفی خود کانال (`self.rng`) خوانده می‌شود تا با
+    یک seed قابل تکرار باشد.
     """
-    def __init__(self, comm_range=100.0, bandwidth=1_000_000, packet_loss_rate=0.01, base_latency=0.05):
+    def __init__(self, comm_range=100.0, bandwidth=1_000_000, packet_loss_rate=0.01, base_latency=0.05,
+                 seed=None):
         self.comm_range = comm_range      # متر
         self.bandwidth = bandwidth        # بیت بر ثانیه
         self.packet_loss_rate = packet_loss_rate
         self.base_latency = base_latency  # ثانیه
+        self.rng = random.Random(seed)
 
     def in_range(self, pos1, pos2):
         """بررسی در برد بودن دو پهپاد"""
         return math.dist(pos1, pos2) <= self.comm_range
 
+    def latency(self, data_size_bytes):
+        """تاخیر کلی (ثانیه) برای ارسال پیامی با اندازه داده‌شده"""
+        tx_time = data_size_bytes / self.bandwidth
+        return self.base_latency + tx_time
+
     def transmit(self, sender, receiver, data_size_bytes):
         """
         ارسال پیام بین پهپادها
+
+        Returns:
+            tuple: (True, latency) در صورت موفقیت، یا (False, reason). تاخیر فقط
+                   گزارش می‌شود و فراخواننده باید تحویل را در زمان now + latency زمان‌بندی کند.
         """
         if not self.in_range(sender.position, receiver.position):
             return False, "Out of range"
 
-        if random.random() < self.packet_loss_rate:
+        if self.rng.random() < self.packet_loss_rate:
             return False, "Packet lost"
 
-        # محاسبه تاخیر کلی
-        tx_time = data_size_bytes / self.bandwidth
-        total_latency = self.base_latency + tx_time
-
-        # شبیه سازی تاخیر (اختیاری برای سرعت اجرا)
-        time.sleep(total_latency)
-
-        return True, total_latency
+        # محاسبه تاخیر کلی (در زمان شبیه‌سازی؛ بدون sleep)
+        return True, self.latency(data_size_bytes)
 
 
 class UAVNetworkManager:
     """
     مدیریت شبکه بین پهپادها: آپدیت جدول همسایگانی و ارسال پیام‌ها
+
+    پیام‌های موفق به صورت رویداد MESSAGE_DELIVERY در زمان now + latency در یک
+    EventQueue قرار می‌گیرند و با `advance_to` یا `step` وقتی زمان شبیه‌سازی
+    به آن‌ها برسد تحویل داده می‌شوند. می‌توان صف رویداد هسته شبیه‌سازی را
+    به سازنده داد تا تحویل پیام‌ها با بقیه رویدادها در یک خط زمانی باشد.
+
+    موقعیت پهپادها در یک SpatialHash با اندازه خانه برابر با برد ارتباطی نگه
+    داشته می‌شود، بنابراین هر پرس‌وجوی همسایگی فقط ۳×۳ سطل اطراف پهپاد را
+    بررسی می‌کند. یک دیکشنری id→drone هم برای یافتن گیرنده‌ها در O(1) نگه
+    داشته می‌شود. این دیکشنری هنگام تغییر فهرست پهپادها (جایگزینی `drones`،
+    add_drone و remove_drone) و در هر update_neighbors تازه می‌شود؛ تغییر
+    مستقیم فهرست در update_neighbors بعدی دیده می‌شود.
     """
-    def __init__(self, drones, channel: UAVCommChannel):
-        self.drones = drones
+    def __init__(self, drones, channel: UAVCommChannel, events: EventQueue = None):
         self.channel = channel
+        self.index = SpatialHash(channel.comm_range)
+        self._by_id = {}
+        self._order = {}
+        self.drones = drones
+
+        # صف رویدادهای آینده (تحویل پیام‌ها) مرتب بر اساس زمان شبیه‌سازی
+        self.events = events if events is not None else EventQueue()
+
+    @property
+    def drones(self):
+        return self._drones
+
+    @drones.setter
+    def drones(self, drones):
+        self._drones = drones
+        self._by_id = {drone.id: drone for drone in drones}
+
+    def add_drone(self, drone):
+        """پهپادی را به فهرست و جدول id→drone اضافه می‌کند."""
+        self._drones.append(drone)
+        self._by_id[drone.id] = drone
+
+    def remove_drone(self, drone_id):
+        """پهپاد با شناسه داده‌شده را از فهرست، جدول id→drone و شاخص مکانی حذف می‌کند."""
+        drone = self._by_id.pop(drone_id, None)
+        if drone is not None:
+            self._drones.remove(drone)
+            self.index.remove(drone_id)
+
+    def _refresh_index(self):
+        """شاخص مکانی و جدول id→drone را با فهرست فعلی پهپادها همگام می‌کند."""
+        if self.index.cell_size != self.channel.comm_range:
+            self.index = SpatialHash(self.channel.comm_range)
+        by_id, order = {}, {}
+        for i, drone in enumerate(self.drones):
+            by_id[drone.id] = drone
+            order[drone.id] = i
+            self.index.update(drone.id, drone.position)
+        for stale_id in self.index.ids() - by_id.keys():
+            self.index.remove(stale_id)
+        self._by_id, self._order = by_id, order
+
+    def get_drone(self, drone_id):
+        """پهپاد با شناسه داده‌شده را برمی‌گرداند (یا None)."""
+        return self._by_id.get(drone_id)
 
     def update_neighbors(self):
         """آپدیت جدول همسایگی همه پهپادها"""
+        self._refresh_index()
+        comm_range, order = self.channel.comm_range, self._order
         for drone in self.drones:
-            drone.neighbors = [
-                other.id for other in self.drones
-                if other.id != drone.id and self.channel.in_range(drone.position, other.position)
-            ]
+            nearby = self.index.query_radius(drone.position, comm_range)
+            nearby.sort(key=order.__getitem__)
+            drone.neighbors = [other_id for other_id in nearby if other_id != drone.id]
+
+    def send(self, sender, receiver, msg, size_bytes=1024):
+        """
+        یک پیام را از sender به receiver ارسال می‌کند.
+
+        پیام موفق برای تحویل در now + latency زمان‌بندی می‌شود؛ شکست (خارج از
+        برد یا اتلاف بسته) مانند قبل بلافاصله به گیرنده اطلاع داده می‌شود.
+
+        Returns:
+            bool: True اگر پیام برای تحویل زمان‌بندی شده باشد.
+        """
+        success, latency = self.channel.transmit(sender, receiver, size_bytes)
+        if not success:
+            receiver.receive_message(msg, latency, success)
+            return False
+        self.schedule_delivery(receiver.id, msg, latency)
+        return True
+
+    def schedule_delivery(self, receiver_id, msg, latency):
+        """تحویل یک پیام را در زمان now + latency زمان‌بندی می‌کند (هندل قابل لغو برمی‌گرداند)."""
+        return self.events.schedule(latency, EventType.MESSAGE_DELIVERY,
+                                    (receiver_id, msg, latency), self._deliver)
+
+    def _deliver(self, event: Event):
+        receiver_id, msg, latency = event.data
+        receiver = self.get_drone(receiver_id)
+        if receiver is not None:
+            receiver.receive_message(msg, latency, True)
 
     def broadcast(self, sender_id, msg, size_bytes=1024):
         """ارسال پیام Broadcast به همه همسایه‌ها از یک پهپاد"""
-        sender = next((d for d in self.drones if d.id == sender_id), None)
+        sender = self.get_drone(sender_id)
         if not sender:
             return
 
         for neighbor_id in sender.neighbors:
-            receiver = next((d for d in self.drones if d.id == neighbor_id), None)
-            success, latency = self.channel.transmit(sender, receiver, size_bytes)
-            receiver.receive_message(msg, latency, success)
+            receiver = self.get_drone(neighbor_id)
+            if receiver is None:
+                continue
+            self.send(sender, receiver, msg, size_bytes)
+
+    @property
+    def now(self):
+        """زمان فعلی شبیه‌سازی شبکه"""
+        return self.events.now
+
+    def advance_to(self, sim_time):
+        """
+        زمان شبیه‌سازی را تا sim_time جلو می‌برد و همه پیام‌های سررسیده را به ترتیب تحویل می‌دهد.
+
+        Returns:
+            int: تعداد رویدادهای پردازش‌شده.
+        """
+        return self.events.run_until(sim_time)
+
+    def step(self, dt):
+        """زمان شبیه‌سازی را به اندازه dt جلو می‌برد و پیام‌های سررسیده را تحویل می‌دهد."""
+        return self.advance_to(self.now + dt)
+
+    def next_delivery_time(self):
+        """زمان نزدیک‌ترین رویداد در صف، یا None اگر صف خالی باشد."""
+        return self.events.peek_time()
+
+    @property
+    def pending_count(self):
+        """تعداد رویدادهای در انتظار (پیام‌های در حال انتقال)"""
+        return len(self.events)
@@ -85,6 +85,35 @@ class ConfigLoader:
             logger.error(f"Configuration '{name}' not found. Available configs: {list(cls._configs.keys())}")
             raise
 
+    @classmethod
+    def reset(cls):
+        """
+        تنظیمات بارگذاری‌شده را پاک می‌کند تا initialize دوباره (مثلاً با پوشه دیگری) اجرا شود.
+        """
+        cls._configs = {}
+        cls._is_initialized = False
+
+    @classmethod
+    def apply_overrides(cls, overrides: Dict[str, Any]):
+        """
+        مقادیر تنظیمات را با کلیدهای نقطه‌دار بازنویسی می‌کند؛ مثلاً
+        {'simulation.fps': 30, 'world.use_fleet': True}.
+
+        Raises:
+            ValueError: اگر کلید شامل نام ماژول و نام تنظیم نباشد.
+        """
+        if not cls._is_initialized:
+            cls.initialize()
+        for dotted_key, value in overrides.items():
+            parts = dotted_key.split('.')
+            if len(parts) < 2:
+                raise ValueError(f"Config override '{dotted_key}' must look like '<module>.<key>'.")
+            node = cls._configs.setdefault(parts[0], {})
+            for part in parts[1:-1]:
+                node = node.setdefault(part, {})
+            node[parts[-1]] = value
+            logger.debug(f"Config override applied: {dotted_key} = {value!r}")
+
     @classmethod
     def get_all(cls) -> Dict[str, Any]:
         """
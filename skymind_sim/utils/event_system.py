@@ -1,8 +1,10 @@
 # skymind_sim/core/event.py
 
+import heapq
+import itertools
 from enum import Enum, auto
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 class EventType(Enum):
     """
@@ -10,6 +12,8 @@ class EventType(Enum):
     """
     UPDATE_STATE = auto()  # Event to update a drone's state
     VISUALIZER_UPDATE = auto() # Event to update the visualization
+    MESSAGE_DELIVERY = auto()  # A network message reaching its receiver
+    AGENT_STEP = auto()        # An agent scheduled to act
 
 @dataclass(order=True)
 class Event:
@@ -18,7 +22,153 @@ class Event:
     
     The 'order=True' argument makes Event objects comparable based on their fields,
     starting with 'timestamp'. This is crucial for the priority queue.
+    Events with equal timestamps are ordered by 'sequence', so queues that
+    assign increasing sequence numbers deliver simultaneous events FIFO.
     """
     timestamp: float
     event_type: EventType = field(compare=False)
     data: Any = field(default=None, compare=False)
+    sequence: int = field(default=0)
+
+
+class EventHandle:
+    """
+    Handle returned when an event is scheduled; call `cancel()` to revoke it.
+
+    Cancelled events stay in the heap and are discarded lazily when they
+    reach the front, so cancellation is O(1).
+    """
+    __slots__ = ("event", "callback", "cancelled", "_queue")
+
+    def __init__(self, event: Event, callback: Optional[Callable[[Event], Any]], queue: "EventQueue"):
+        self.event = event
+        self.callback = callback
+        self.cancelled = False
+        self._queue = queue
+
+    @property
+    def timestamp(self) -> float:
+        return self.event.timestamp
+
+    def cancel(self) -> bool:
+        """Cancels the event. Returns False if it was already cancelled or has fired."""
+        return self._queue.cancel(self)
+
+
+class EventQueue:
+    """
+    Heap-based future event list driving a discrete-event simulation.
+
+    Events are processed in (timestamp, sequence) order. Each event is either
+    passed to the callback given when it was scheduled or, failing that, to
+    the handlers subscribed to its EventType. Time does not advance in fixed
+    increments: `step` warps `now` straight to the next pending event, and
+    `run_until` processes everything due up to a given time.
+    """
+
+    def __init__(self, start_time: float = 0.0):
+        self.now = start_time
+        self._heap: List[Tuple[Event, EventHandle]] = []
+        self._sequence = itertools.count()
+        self._handlers: Dict[EventType, List[Callable[[Event], Any]]] = {}
+        self._live = 0
+        self.processed = 0
+
+    def __len__(self) -> int:
+        """Number of scheduled events that have not fired or been cancelled."""
+        return self._live
+
+    def subscribe(self, event_type: EventType, handler: Callable[[Event], Any]):
+        """Registers a handler for events of the given type that have no callback."""
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def schedule_at(self, timestamp: float, event_type: EventType, data: Any = None,
+                    callback: Optional[Callable[[Event], Any]] = None) -> EventHandle:
+        """
+        Schedules an event at an absolute simulation time.
+
+        Raises:
+            ValueError: If the timestamp lies in the past.
+        """
+        if timestamp < self.now:
+            raise ValueError(f"Cannot schedule an event at {timestamp}, before the current time {self.now}.")
+        event = Event(timestamp, event_type, data, next(self._sequence))
+        handle = EventHandle(event, callback, self)
+        heapq.heappush(self._heap, (event, handle))
+        self._live += 1
+        return handle
+
+    def schedule(self, delay: float, event_type: EventType, data: Any = None,
+                 callback: Optional[Callable[[Event], Any]] = None) -> EventHandle:
+        """Schedules an event `delay` time units after now."""
+        return self.schedule_at(self.now + delay, event_type, data, callback)
+
+    def cancel(self, handle: EventHandle) -> bool:
+        """Cancels a scheduled event. Returns False if it was already cancelled or has fired."""
+        if handle.cancelled or handle._queue is not self:
+            return False
+        handle.cancelled = True
+        self._live -= 1
+        return True
+
+    def _discard_cancelled(self):
+        heap = self._heap
+        while heap and heap[0][1].cancelled:
+            heapq.heappop(heap)
+
+    def peek_time(self) -> Optional[float]:
+        """Timestamp of the next pending event, or None if the queue is empty."""
+        self._discard_cancelled()
+        return self._heap[0][0].timestamp if self._heap else None
+
+    def _fire(self, event: Event, handle: EventHandle):
+        # Mark as done so that a late cancel() is a no-op.
+        handle.cancelled = True
+        handle._queue = None
+        self._live -= 1
+        self.processed += 1
+        if handle.callback is not None:
+            handle.callback(event)
+        else:
+            for handler in self._handlers.get(event.event_type, ()):
+                handler(event)
+
+    def run_until(self, timestamp: float) -> int:
+        """
+        Processes every event due at or before `timestamp`, then sets `now` to it.
+
+        Returns:
+            int: The number of events processed.
+        """
+        count = 0
+        heap = self._heap
+        while True:
+            self._discard_cancelled()
+            if not heap or heap[0][0].timestamp > timestamp:
+                break
+            event, handle = heapq.heappop(heap)
+            self.now = event.timestamp
+            self._fire(event, handle)
+            count += 1
+        self.now = max(self.now, timestamp)
+        return count
+
+    def step(self) -> Optional[float]:
+        """
+        Warps time to the next pending event and processes every event at that timestamp.
+
+        Returns:
+            Optional[float]: The new simulation time, or None if no events are pending.
+        """
+        next_time = self.peek_time()
+        if next_time is None:
+            return None
+        self.run_until(next_time)
+        return next_time
+
+    def clear(self):
+        """Drops all pending events without firing them."""
+        for _, handle in self._heap:
+            handle.cancelled = True
+        self._heap.clear()
+        self._live = 0
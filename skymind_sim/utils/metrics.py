@@ -3,55 +3,332 @@
 # ============================================
 
 import csv
+import json
+import math
+import os
+import uuid
+from typing import Any, Dict, Hashable, Iterator, List, Optional
+
+import numpy as np
+
+# name -> dtype of each on-disk / in-memory table
+TASK_SCHEMA = {
+    "drone": np.int32,
+    "exec_level": np.int32,
+    "path_length": np.int64,
+    "distance": np.float64,
+    "battery": np.float64,
+    "total_time": np.float64,
+    "stop_count": np.int64,
+    "collision_avoided": np.int64,
+}
+EVENT_SCHEMA = {
+    "drone": np.int32,
+    "latency": np.float64,
+    "success": np.int8,
+    "neighbor_count": np.int32,
+}
+PATH_SCHEMA = {
+    "drone": np.int32,
+    "step": np.int32,
+    "x": np.float64,
+    "y": np.float64,
+}
+
+
+class _Vocabulary:
+    """نگاشت مقادیر تکراری (مثل DroneID) به کدهای صحیح فشرده."""
 
-class MetricsCollector:
     def __init__(self):
-        self.drone_tasks = []
-        self.network_events = []
+        self.values: List[Hashable] = []
+        self._codes: Dict[Hashable, int] = {}
+
+    def encode(self, value: Hashable) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        lookup = np.empty(len(self.values), dtype=object)
+        lookup[:] = self.values
+        return lookup[codes]
+
+
+class ColumnTable:
+    """
+    جدول ستونی با بافرهای نوع‌دار و از پیش تخصیص‌یافته.
+
+    ردیف‌ها در آرایه‌های NumPy به طول `chunk_size` نوشته می‌شوند. وقتی بافر پر
+    شود، chunk کامل به یک فایل `.npz` (یک آرایه برای هر ستون) در `directory`
+    نوشته می‌شود و حافظه دوباره استفاده می‌شود. اگر directory داده نشود،
+    chunkها به صورت آرایه‌های فشرده در حافظه نگه داشته می‌شوند. فایل‌ها با نام
+    `{name}-{prefix}-{n:05d}.npz` نوشته می‌شوند تا جدول‌های هم‌نام چند
+    جمع‌آورنده در یک پوشه فایل‌های یکدیگر را بازنویسی نکنند.
+    """
+
+    def __init__(self, name: str, schema: Dict[str, Any], chunk_size: int = 65536,
+                 directory: Optional[str] = None, prefix: Optional[str] = None):
+        self.name = name
+        self.prefix = prefix
+        self.schema = {column: np.dtype(dtype) for column, dtype in schema.items()}
+        self.chunk_size = max(int(chunk_size), 1)
+        self.directory = directory
+        self._buffer = {column: np.empty(self.chunk_size, dtype=dtype) for column, dtype in self.schema.items()}
+        self._fill = 0
+        self._chunks: List[Any] = []  # in-memory column dicts or chunk file paths
+        self._flushed_rows = 0
+
+    def __len__(self) -> int:
+        return self._flushed_rows + self._fill
+
+    def append(self, *values):
+        """یک ردیف را به ترتیب ستون‌های schema اضافه می‌کند."""
+        row = self._fill
+        for column, value in zip(self._buffer.values(), values):
+            column[row] = value
+        self._fill += 1
+        if self._fill == self.chunk_size:
+            self._flush_chunk()
+
+    def extend(self, columns: Dict[str, np.ndarray]):
+        """چند ردیف را به صورت برداری (دیکشنری ستون → آرایه) اضافه می‌کند."""
+        count = len(next(iter(columns.values())))
+        start = 0
+        while start < count:
+            take = min(self.chunk_size - self._fill, count - start)
+            for column, buffer in self._buffer.items():
+                buffer[self._fill:self._fill + take] = columns[column][start:start + take]
+            self._fill += take
+            start += take
+            if self._fill == self.chunk_size:
+                self._flush_chunk()
+
+    def _flush_chunk(self):
+        if self._fill == 0:
+            return
+        data = {column: buffer[:self._fill].copy() for column, buffer in self._buffer.items()}
+        if self.directory is None:
+            self._chunks.append(data)
+        else:
+            stem = f"{self.name}-{self.prefix}" if self.prefix else self.name
+            path = os.path.join(self.directory, f"{stem}-{len(self._chunks):05d}.npz")
+            np.savez(path, **data)
+            self._chunks.append(path)
+        self._flushed_rows += self._fill
+        self._fill = 0
+
+    def flush(self):
+        """ردیف‌های بافر جاری را (حتی اگر chunk کامل نباشد) ذخیره می‌کند."""
+        self._flush_chunk()
+
+    def iter_chunks(self) -> Iterator[Dict[str, np.ndarray]]:
+        """chunkهای ذخیره‌شده و سپس بافر جاری را به صورت دیکشنری ستونی برمی‌گرداند."""
+        for chunk in self._chunks:
+            if isinstance(chunk, str):
+                with np.load(chunk) as data:
+                    yield {column: data[column] for column in self.schema}
+            else:
+                yield chunk
+        if self._fill:
+            yield {column: buffer[:self._fill] for column, buffer in self._buffer.items()}
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """کل جدول را به صورت آرایه‌های پیوسته برمی‌گرداند."""
+        parts = list(self.iter_chunks())
+        if not parts:
+            return {column: np.empty(0, dtype=dtype) for column, dtype in self.schema.items()}
+        return {column: np.concatenate([part[column] for part in parts]) for column in self.schema}
+
+
+class MetricsCollector:
+    """
+    جمع‌آوری معیارهای ماموریت و شبکه به صورت ستونی و جریانی.
+
+    وظایف، رویدادهای شبکه و نقاط مسیر در سه ColumnTable نوع‌دار نوشته می‌شوند.
+    شناسه‌ها (DroneID و ExecLevel) به کدهای صحیح تبدیل می‌شوند، مقادیر None
+    برای اعداد با NaN و برای CommSuccess/NeighborCount با -1 ذخیره می‌شوند.
+    اگر `output_dir` داده شود، chunkها در حین اجرا روی دیسک نوشته می‌شوند و
+    حافظه مصرفی به اندازه یک chunk برای هر جدول محدود می‌ماند. نام فایل‌های هر
+    جمع‌آورنده شامل `run_name` (پیش‌فرض یک شناسه تصادفی) است، پس چند جمع‌آورنده
+    می‌توانند یک output_dir مشترک داشته باشند.
+
+    مسیر هر وظیفه دیگر در یک خانه CSV نوشته نمی‌شود: جدول اصلی فقط PathLength
+    دارد و نقاط مسیر با export_paths_csv به صورت ردیف‌های (DroneID, Step, X, Y)
+    صادر می‌شوند.
+    """
+
+    COLUMNS = [
+        "DroneID", "ExecLevel", "PathLength", "DistanceTravelled",
+        "BatteryRemaining", "TotalMissionTime", "StopCount", "CollisionAvoided",
+        "Latency", "CommSuccess", "NeighborCount"
+    ]
+
+    def __init__(self, output_dir: Optional[str] = None, chunk_size: int = 65536,
+                 run_name: Optional[str] = None):
+        self.output_dir = output_dir
+        self.run_name = run_name or uuid.uuid4().hex[:12]
+        if output_dir is not None:
+            os.makedirs(output_dir, exist_ok=True)
+        self.drone_ids = _Vocabulary()
+        self.exec_levels = _Vocabulary()
+        self.tasks = ColumnTable("tasks", TASK_SCHEMA, chunk_size, output_dir, self.run_name)
+        self.events = ColumnTable("events", EVENT_SCHEMA, chunk_size, output_dir, self.run_name)
+        self.paths = ColumnTable("paths", PATH_SCHEMA, chunk_size, output_dir, self.run_name)
+
+    @staticmethod
+    def _number(value) -> float:
+        return math.nan if value is None else float(value)
 
     def log_task(self, drone_id, exec_level, path, distance, battery_remaining,
                  total_time, stop_count, collision_avoided):
-        self.drone_tasks.append({
-            "DroneID": drone_id,
-            "ExecLevel": exec_level,
-            "Path": path,
-            "DistanceTravelled": distance,
-            "BatteryRemaining": battery_remaining,
-            "TotalMissionTime": total_time,
-            "StopCount": stop_count,
-            "CollisionAvoided": collision_avoided
-        })
+        drone = self.drone_ids.encode(drone_id)
+        points = np.asarray([(p[0], p[1]) for p in path] if path else np.empty((0, 2)), dtype=np.float64)
+        self.tasks.append(
+            drone, self.exec_levels.encode(exec_level), len(points), self._number(distance),
+            self._number(battery_remaining), self._number(total_time), stop_count or 0, collision_avoided or 0
+        )
+        if len(points):
+            self.paths.extend({
+                "drone": np.full(len(points), drone, dtype=np.int32),
+                "step": np.arange(len(points), dtype=np.int32),
+                "x": points[:, 0],
+                "y": points[:, 1],
+            })
 
     def log_network_event(self, drone_id, latency, success, neighbors_count):
-        self.network_events.append({
-            "DroneID": drone_id,
-            "Latency": latency,
-            "CommSuccess": success,
-            "NeighborCount": neighbors_count
-        })
+        self.events.append(
+            self.drone_ids.encode(drone_id), self._number(latency),
+            -1 if success is None else int(bool(success)),
+            -1 if neighbors_count is None else neighbors_count
+        )
+
+    def flush(self):
+        """همه بافرها و واژه‌نامه شناسه‌ها را روی دیسک می‌نویسد (در حالت output_dir)."""
+        for table in (self.tasks, self.events, self.paths):
+            table.flush()
+        if self.output_dir is not None:
+            with open(os.path.join(self.output_dir, f"vocabulary-{self.run_name}.json"), "w", encoding="utf-8") as f:
+                json.dump({"DroneID": [str(v) for v in self.drone_ids.values],
+                           "ExecLevel": [str(v) for v in self.exec_levels.values]}, f)
+
+    # ------------------------------------------------------------------
+    # Join and export
+    # ------------------------------------------------------------------
+    def iter_joined(self, block_size: int = 65536) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        وظایف را با رویدادهای شبکه همان پهپاد join می‌کند و نتیجه را در بلوک‌های ستونی برمی‌گرداند.
+
+        رویدادها chunk به chunk خوانده می‌شوند و هر بار فقط یک chunk در حافظه است:
+        برای هر chunk یک شاخص DroneID (ترتیب مرتب‌سازی کدها) ساخته می‌شود و بازه
+        رویدادهای هر پهپاد با searchsorted پیدا و به صورت برداری تکثیر می‌شود؛ هزینه
+        O((tasks + events) log events) است نه O(tasks × events). ردیف‌های هر وظیفه
+        به ترتیب ثبت رویدادها می‌آیند و وظیفه‌ای که رویدادی ندارد یک ردیف با مقادیر
+        شبکه خالی می‌گیرد.
+        """
+        for task in self.tasks.iter_chunks():
+            for start in range(0, len(task["drone"]), block_size):
+                block = {column: values[start:start + block_size] for column, values in task.items()}
+                task_index, event_values = self._join_events(block["drone"])
+                yield {
+                    "DroneID": self.drone_ids.decode(block["drone"][task_index]),
+                    "ExecLevel": self.exec_levels.decode(block["exec_level"][task_index]),
+                    "PathLength": block["path_length"][task_index],
+                    "DistanceTravelled": block["distance"][task_index],
+                    "BatteryRemaining": block["battery"][task_index],
+                    "TotalMissionTime": block["total_time"][task_index],
+                    "StopCount": block["stop_count"][task_index],
+                    "CollisionAvoided": block["collision_avoided"][task_index],
+                    "Latency": event_values["latency"],
+                    "CommSuccess": event_values["success"],
+                    "NeighborCount": event_values["neighbor_count"],
+                }
+
+    # Values of the network columns for a task without events
+    _MISSING_EVENT = {"latency": np.nan, "success": -1, "neighbor_count": -1}
+
+    def _join_events(self, drones: np.ndarray):
+        """
+        ردیف‌های join یک بلوک از کدهای پهپاد را با خواندن chunk به chunk رویدادها می‌سازد.
+
+        Returns:
+            (task_index, values): اندیس وظیفه هر ردیف خروجی و ستون‌های شبکه آن ردیف‌ها.
+        """
+        count = len(drones)
+        task_parts: List[np.ndarray] = []
+        value_parts: Dict[str, List[np.ndarray]] = {name: [] for name in self._MISSING_EVENT}
+        matched = np.zeros(count, dtype=bool)
+        for events in self.events.iter_chunks():
+            order = np.argsort(events["drone"], kind="stable")
+            event_drone = events["drone"][order]
+            lo = np.searchsorted(event_drone, drones, side="left")
+            matches = np.searchsorted(event_drone, drones, side="right") - lo
+            total = int(matches.sum())
+            if not total:
+                continue
+            task_index = np.repeat(np.arange(count), matches)
+            offsets = np.arange(total) - np.repeat(np.cumsum(matches) - matches, matches)
+            event_index = order[np.repeat(lo, matches) + offsets]
+            task_parts.append(task_index)
+            for name in value_parts:
+                value_parts[name].append(events[name][event_index])
+            matched[matches > 0] = True
+
+        missing = np.flatnonzero(~matched)
+        task_parts.append(missing)
+        for name, value in self._MISSING_EVENT.items():
+            value_parts[name].append(np.full(len(missing), value, dtype=self.events.schema[name]))
+        task_index = np.concatenate(task_parts)
+        # Stable: the rows of a task keep the chunk (= logging) order of its events.
+        rank = np.argsort(task_index, kind="stable")
+        return task_index[rank], {name: np.concatenate(parts)[rank] for name, parts in value_parts.items()}
+
+    def to_columns(self) -> Dict[str, np.ndarray]:
+        """نتایج join‌شده را به صورت جدول ستونی (نام ستون → آرایه NumPy) برمی‌گرداند."""
+        blocks = list(self.iter_joined())
+        if not blocks:
+            return {name: np.empty(0) for name in self.COLUMNS}
+        return {name: np.concatenate([block[name] for block in blocks]) for name in self.COLUMNS}
+
+    def path_of(self, drone_id) -> np.ndarray:
+        """نقاط مسیر ثبت‌شده برای یک پهپاد را به صورت آرایه (N, 2) برمی‌گرداند."""
+        code = self.drone_ids._codes.get(drone_id)
+        paths = self.paths.columns()
+        mask = paths["drone"] == code
+        return np.stack((paths["x"][mask], paths["y"][mask]), axis=1)
+
+    @staticmethod
+    def _csv_value(value):
+        if isinstance(value, float) and math.isnan(value):
+            return ""
+        return value
 
     def export_csv(self, filename):
         with open(filename, mode="w", newline="", encoding="utf-8") as file:
             writer = csv.writer(file)
-            writer.writerow([
-                "DroneID", "ExecLevel", "Path", "DistanceTravelled",
-                "BatteryRemaining", "TotalMissionTime", "StopCount", "CollisionAvoided",
-                "Latency", "CommSuccess", "NeighborCount"
-            ])
-            for task in self.drone_tasks:
-                related_events = [e for e in self.network_events if e["DroneID"] == task["DroneID"]]
-                if related_events:
-                    for e in related_events:
-                        writer.writerow([
-                            task["DroneID"], task["ExecLevel"], task["Path"],
-                            task["DistanceTravelled"], task["BatteryRemaining"],
-                            task["TotalMissionTime"], task["StopCount"], task["CollisionAvoided"],
-                            e["Latency"], e["CommSuccess"], e["NeighborCount"]
-                        ])
-                else:
-                    writer.writerow([
-                        task["DroneID"], task["ExecLevel"], task["Path"],
-                        task["DistanceTravelled"], task["BatteryRemaining"],
-                        task["TotalMissionTime"], task["StopCount"], task["CollisionAvoided"],
-                        None, None, None
-                    ])
+            writer.writerow(self.COLUMNS)
+            for block in self.iter_joined():
+                block["CommSuccess"] = np.where(block["CommSuccess"] < 0, None,
+                                                block["CommSuccess"] == 1).astype(object)
+                block["NeighborCount"] = np.where(block["NeighborCount"] < 0, None,
+                                                  block["NeighborCount"]).astype(object)
+                rows = zip(*(block[name].tolist() for name in self.COLUMNS))
+                writer.writerows([self._csv_value(v) for v in row] for row in rows)
+
+    def export_npz(self, filename):
+        """جدول join‌شده را به صورت یک فایل ستونی .npz ذخیره می‌کند."""
+        columns = self.to_columns()
+        columns["DroneID"] = columns["DroneID"].astype(str)
+        columns["ExecLevel"] = columns["ExecLevel"].astype(str)
+        np.savez_compressed(filename, **columns)
+
+    def export_paths_csv(self, filename):
+        """نقاط مسیر همه وظایف را به صورت ردیف‌های (DroneID, Step, X, Y) صادر می‌کند."""
+        with open(filename, mode="w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["DroneID", "Step", "X", "Y"])
+            for chunk in self.paths.iter_chunks():
+                ids = self.drone_ids.decode(chunk["drone"]).tolist()
+                writer.writerows(zip(ids, chunk["step"].tolist(), chunk["x"].tolist(), chunk["y"].tolist()))
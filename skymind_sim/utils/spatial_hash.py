@@ -0,0 +1,138 @@
+# skymind_sim/utils/spatial_hash.py
+
+import math
+from typing import Dict, Hashable, Iterable, List, Sequence, Set, Tuple
+
+
+class SpatialHash:
+    """
+    شاخص مکانی با شبکه یکنواخت (bucketed hash) برای جستجوی همسایگی.
+
+    صفحه به خانه‌هایی با اندازه `cell_size` تقسیم می‌شود و هر موجودیت فقط در
+    خانه‌ای که مختصات (x, y) آن در آن قرار دارد ثبت می‌شود. جابه‌جایی‌ها به صورت
+    افزایشی اعمال می‌شوند: تنها وقتی موجودیت از مرز یک خانه عبور کند، سطل‌ها
+    تغییر می‌کنند. جستجوی شعاعی فقط سطل‌های نزدیک را بررسی می‌کند، پس با
+    cell_size برابر با شعاع جستجو، هزینه هر پرس‌وجو متناسب با تراکم محلی است
+    و نه تعداد کل موجودیت‌ها.
+    """
+
+    def __init__(self, cell_size: float):
+        if cell_size <= 0:
+            raise ValueError(f"cell_size must be positive, got {cell_size}.")
+        self.cell_size = float(cell_size)
+        self._buckets: Dict[Tuple[int, int], Dict[Hashable, Sequence[float]]] = {}
+        self._cell_of: Dict[Hashable, Tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._cell_of)
+
+    def __contains__(self, item_id: Hashable) -> bool:
+        return item_id in self._cell_of
+
+    def ids(self) -> Set[Hashable]:
+        """شناسه همه موجودیت‌های ثبت‌شده را برمی‌گرداند."""
+        return set(self._cell_of)
+
+    def _cell(self, position: Sequence[float]) -> Tuple[int, int]:
+        return (math.floor(position[0] / self.cell_size), math.floor(position[1] / self.cell_size))
+
+    def update(self, item_id: Hashable, position: Sequence[float]):
+        """
+        موقعیت یک موجودیت را ثبت یا به‌روزرسانی می‌کند.
+
+        Args:
+            item_id (Hashable): شناسه موجودیت.
+            position (Sequence[float]): موقعیت موجودیت؛ دو مؤلفه اول برای سطل‌بندی استفاده می‌شوند.
+        """
+        cell = self._cell(position)
+        old = self._cell_of.get(item_id)
+        if old is not None and old != cell:
+            bucket = self._buckets[old]
+            del bucket[item_id]
+            if not bucket:
+                del self._buckets[old]
+        self._buckets.setdefault(cell, {})[item_id] = tuple(position)
+        self._cell_of[item_id] = cell
+
+    def remove(self, item_id: Hashable):
+        """یک موجودیت را از شاخص حذف می‌کند (در صورت نبودن، کاری انجام نمی‌شود)."""
+        cell = self._cell_of.pop(item_id, None)
+        if cell is None:
+            return
+        bucket = self._buckets[cell]
+        del bucket[item_id]
+        if not bucket:
+            del self._buckets[cell]
+
+    def clear(self):
+        """همه موجودیت‌ها را حذف می‌کند."""
+        self._buckets.clear()
+        self._cell_of.clear()
+
+    def query_radius(self, position: Sequence[float], radius: float) -> List[Hashable]:
+        """
+        شناسه موجودیت‌هایی را برمی‌گرداند که فاصله آن‌ها تا `position` حداکثر `radius` است.
+
+        فاصله با همه مؤلفه‌های موقعیت (مثلاً ارتفاع در حالت سه‌بعدی) محاسبه می‌شود.
+        """
+        cx0, cy0 = self._cell((position[0] - radius, position[1] - radius))
+        cx1, cy1 = self._cell((position[0] + radius, position[1] + radius))
+        result = []
+        buckets = self._buckets
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = buckets.get((cx, cy))
+                if not bucket:
+                    continue
+                for item_id, other in bucket.items():
+                    if math.dist(position, other) <= radius:
+                        result.append(item_id)
+        return result
+
+    def query_rect(self, left: float, top: float, right: float, bottom: float) -> List[Hashable]:
+        """
+        شناسه موجودیت‌هایی را برمی‌گرداند که (x, y) آن‌ها داخل مستطیل [left, right) × [top, bottom) است.
+        """
+        cx0, cy0 = self._cell((left, top))
+        cx1, cy1 = self._cell((right, bottom))
+        result = []
+        buckets = self._buckets
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = buckets.get((cx, cy))
+                if not bucket:
+                    continue
+                for item_id, other in bucket.items():
+                    if left <= other[0] < right and top <= other[1] < bottom:
+                        result.append(item_id)
+        return result
+
+    def query_cells(self, left: float, top: float, right: float, bottom: float) -> List[Hashable]:
+        """
+        شناسه همه موجودیت‌های سطل‌هایی را برمی‌گرداند که با مستطیل هم‌پوشانی دارند (بدون فیلتر دقیق).
+
+        مناسب برای فراخواننده‌ای که خودش آزمون دقیق (مثلاً برخورد مستطیل اسپرایت) را انجام می‌دهد
+        یا شاخص را فقط هنگام عبور از مرز خانه‌ها به‌روز می‌کند.
+        """
+        cx0, cy0 = self._cell((left, top))
+        cx1, cy1 = self._cell((right, bottom))
+        result = []
+        buckets = self._buckets
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(buckets):
+            # Fewer occupied buckets than cells in the rectangle: scan the buckets instead.
+            for (cx, cy), bucket in buckets.items():
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                    result.extend(bucket)
+            return result
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = buckets.get((cx, cy))
+                if bucket:
+                    result.extend(bucket)
+        return result
+
+    def rebuild(self, items: Iterable[Tuple[Hashable, Sequence[float]]]):
+        """شاخص را از ابتدا با جفت‌های (شناسه، موقعیت) می‌سازد."""
+        self.clear()
+        for item_id, position in items:
+            self.update(item_id, position)
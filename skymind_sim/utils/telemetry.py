@@ -0,0 +1,185 @@
+# skymind_sim/utils/telemetry.py
+
+import json
+import os
+from typing import Dict, Hashable, Iterable, List, Optional
+
+import numpy as np
+
+# One telemetry sample of one drone
+RECORD_DTYPE = np.dtype([
+    ("tick", np.int64),
+    ("drone", np.int32),
+    ("state", np.int8),
+    ("x", np.float64),
+    ("y", np.float64),
+    ("vx", np.float64),
+    ("vy", np.float64),
+    ("energy", np.float64),
+])
+
+STATE_INACTIVE = 0
+STATE_ACTIVE = 1
+
+
+class TelemetryRecorder:
+    """
+    ضبط‌کننده تله‌متری با بافر حلقوی ثابت و از پیش تخصیص‌یافته.
+
+    هر `interval` تیک، موقعیت، سرعت، انرژی و وضعیت همه پهپادها به صورت برداری
+    در یک آرایه رکوردی NumPy (یا np.memmap اگر `ring_path` داده شود) نوشته
+    می‌شود. حافظه مصرفی به `capacity` رکورد محدود است؛ وقتی بافر پر شود،
+    قدیمی‌ترین رکوردها بازنویسی می‌شوند و تعداد رکوردهای ازدست‌رفته در
+    `dropped` شمرده می‌شود.
+
+    `flush` حداکثر `max_rows` رکورد جدید را به انتهای یک فایل باینری
+    append-only اضافه می‌کند، پس هزینه هر فراخوانی محدود است و می‌توان آن را
+    در هر تیک یا هر چند تیک صدا زد. بافر فقط یک نویسنده دارد: نویسنده ابتدا
+    رکوردها را می‌نویسد و سپس شمارنده `head` را جلو می‌برد، بنابراین یک نخ
+    flush که `head` را می‌خواند هرگز رکورد نیمه‌نوشته نمی‌بیند (مگر اینکه بافر
+    در همان لحظه دور کامل بزند).
+    """
+
+    def __init__(self, capacity: int = 1 << 16, interval: int = 1, ring_path: Optional[str] = None):
+        self.capacity = max(int(capacity), 1)
+        self.interval = max(int(interval), 1)
+        if ring_path is not None:
+            self.buffer = np.memmap(ring_path, dtype=RECORD_DTYPE, mode="w+", shape=(self.capacity,))
+        else:
+            self.buffer = np.zeros(self.capacity, dtype=RECORD_DTYPE)
+        self.head = 0           # total records ever written
+        self.flushed = 0        # records persisted (or skipped) by flush
+        self.dropped = 0        # records overwritten before they were flushed
+        self.drone_ids: List[Hashable] = []
+        self._codes: Dict[Hashable, int] = {}
+        # Drone code of each FleetState row, extended as the fleet grows
+        self._fleet_codes = np.empty(0, dtype=np.int32)
+        self._ids_written = 0
+
+    def __len__(self) -> int:
+        """تعداد رکوردهای قابل دسترس در بافر."""
+        return min(self.head, self.capacity)
+
+    def should_record(self, tick: int) -> bool:
+        return tick % self.interval == 0
+
+    def _code(self, drone_id: Hashable) -> int:
+        code = self._codes.get(drone_id)
+        if code is None:
+            code = len(self.drone_ids)
+            self._codes[drone_id] = code
+            self.drone_ids.append(drone_id)
+        return code
+
+    def record(self, tick: int, drones: np.ndarray, positions: np.ndarray, velocities: np.ndarray,
+               energy: np.ndarray, states: np.ndarray):
+        """
+        یک نمونه برای N پهپاد را به صورت برداری در بافر حلقوی می‌نویسد.
+
+        Args:
+            tick (int): شماره تیک.
+            drones (np.ndarray): کد پهپادها (N,).
+            positions, velocities (np.ndarray): آرایه‌های (N, 2).
+            energy (np.ndarray): انرژی باقی‌مانده (N,).
+            states (np.ndarray): وضعیت (N,)، مثلاً STATE_ACTIVE.
+        """
+        count = len(drones)
+        if count == 0:
+            return
+        if count > self.capacity:
+            # Only the newest `capacity` records can survive anyway.
+            skip = count - self.capacity
+            self.head += skip
+            drones, positions, velocities = drones[skip:], positions[skip:], velocities[skip:]
+            energy, states = energy[skip:], states[skip:]
+            count = self.capacity
+        slots = (self.head + np.arange(count)) % self.capacity
+        records = self.buffer
+        records["tick"][slots] = tick
+        records["drone"][slots] = drones
+        records["state"][slots] = states
+        records["x"][slots] = positions[:, 0]
+        records["y"][slots] = positions[:, 1]
+        records["vx"][slots] = velocities[:, 0]
+        records["vy"][slots] = velocities[:, 1]
+        records["energy"][slots] = energy
+        self.head += count
+
+    def capture_fleet(self, tick: int, fleet, drone_ids: Iterable[Hashable]):
+        """
+        یک نمونه از FleetState (ساختار SoA) بدون حلقه روی پهپادها ثبت می‌کند.
+
+        `drone_ids` شناسه‌ها را به ترتیب ردیف‌های fleet می‌دهد؛ کد هر ردیف فقط یک بار
+        با `_code` ساخته و در آرایه‌ای نگه داشته می‌شود.
+        """
+        if not self.should_record(tick):
+            return
+        n = fleet.size
+        known = len(self._fleet_codes)
+        if known < n:
+            new = [self._code(drone_id) for drone_id in list(drone_ids)[known:n]]
+            self._fleet_codes = np.concatenate([self._fleet_codes, np.asarray(new, dtype=np.int32)])
+        self.record(tick, self._fleet_codes[:n], fleet.positions[:n], fleet.velocities[:n],
+                    fleet.energy[:n], fleet.active[:n].astype(np.int8))
+
+    def capture(self, tick: int, drones: Iterable):
+        """یک نمونه از فهرستی از اشیای پهپاد (position، velocity و در صورت وجود energy/active) ثبت می‌کند."""
+        if not self.should_record(tick):
+            return
+        drones = list(drones)
+        if not drones:
+            return
+        codes = np.fromiter((self._code(d.id if hasattr(d, "id") else d.get_id()) for d in drones),
+                            dtype=np.int32, count=len(drones))
+        positions = np.array([(d.position[0], d.position[1]) for d in drones], dtype=np.float64)
+        velocities = np.array([(d.velocity[0], d.velocity[1]) if getattr(d, "velocity", None) is not None
+                               else (0.0, 0.0) for d in drones], dtype=np.float64)
+        energy = np.array([getattr(d, "energy", np.nan) for d in drones], dtype=np.float64)
+        states = np.array([STATE_ACTIVE if getattr(d, "active", True) else STATE_INACTIVE for d in drones],
+                          dtype=np.int8)
+        self.record(tick, codes, positions, velocities, energy, states)
+
+    def latest(self, count: Optional[int] = None) -> np.ndarray:
+        """آخرین `count` رکورد (پیش‌فرض: همه رکوردهای موجود) را به ترتیب زمانی برمی‌گرداند."""
+        available = len(self)
+        count = available if count is None else min(count, available)
+        slots = (self.head - count + np.arange(count)) % self.capacity
+        return self.buffer[slots]
+
+    def flush(self, path: str, max_rows: Optional[int] = None) -> int:
+        """
+        رکوردهای جدید را به انتهای فایل باینری `path` اضافه می‌کند.
+
+        Args:
+            path (str): فایل append-only مقصد (رکوردهای خام با RECORD_DTYPE).
+            max_rows (Optional[int]): سقف رکوردهای نوشته‌شده در این فراخوانی.
+
+        Returns:
+            int: تعداد رکوردهای نوشته‌شده.
+        """
+        head = self.head
+        oldest = head - min(head, self.capacity)
+        if self.flushed < oldest:
+            self.dropped += oldest - self.flushed
+            self.flushed = oldest
+        count = head - self.flushed
+        if max_rows is not None:
+            count = min(count, max_rows)
+        if count <= 0:
+            return 0
+        slots = (self.flushed + np.arange(count)) % self.capacity
+        with open(path, "ab") as f:
+            self.buffer[slots].tofile(f)
+        self.flushed += count
+        if self._ids_written != len(self.drone_ids):
+            with open(path + ".ids.json", "w", encoding="utf-8") as f:
+                json.dump([str(d) for d in self.drone_ids], f)
+            self._ids_written = len(self.drone_ids)
+        return count
+
+    @staticmethod
+    def load(path: str, mmap: bool = True) -> np.ndarray:
+        """فایلی را که با flush نوشته شده به صورت آرایه رکوردی (در صورت امکان memory-mapped) می‌خواند."""
+        if mmap and os.path.getsize(path):
+            return np.memmap(path, dtype=RECORD_DTYPE, mode="r")
+        return np.fromfile(path, dtype=RECORD_DTYPE)
@@ -0,0 +1,62 @@
+# tests/test_asset_loader.py
+
+import pytest
+from skymind_sim.layer_0_presentation.asset_loader import AssetLoader
+from skymind_sim.layer_1_simulation.world.world import World
+
+IMAGE = "drone_2.png"
+
+@pytest.fixture(autouse=True)
+def _default_cache():
+    AssetLoader.configure(cache_size=512, rotation_step=15.0, use_atlas=False, atlas_pages=8)
+    yield
+    AssetLoader.configure(cache_size=512, rotation_step=15.0, use_atlas=False, atlas_pages=8)
+
+def test_drones_share_one_scaled_surface():
+    """Tests that spawning many drones scales the image once."""
+    world = World()
+    for i in range(50):
+        world.add_drone(f"d{i}", (i % 10, i // 10))
+    images = {id(drone.image) for drone in world.drones.values()}
+    assert len(images) == 1
+    assert world.player_drone.image.get_size() == world.grid.cell_size
+
+def test_variants_keyed_on_size_and_rotation_bucket_with_lru_eviction():
+    """Tests rotation bucketing and least-recently-used eviction."""
+    base = AssetLoader.get_scaled(IMAGE, (30, 30))
+    assert AssetLoader.get_scaled(IMAGE, (30, 30), angle=7) is base
+    assert AssetLoader.get_scaled(IMAGE, (30, 30), angle=44) is not base
+    assert AssetLoader.rotation_bucket(-15) == AssetLoader.rotation_bucket(345)
+
+    AssetLoader.configure(cache_size=2)
+    small = AssetLoader.get_scaled(IMAGE, (10, 10))
+    AssetLoader.get_scaled(IMAGE, (20, 20))
+    assert AssetLoader.get_scaled(IMAGE, (10, 10)) is small
+    AssetLoader.get_scaled(IMAGE, (40, 40))
+    assert AssetLoader.get_scaled(IMAGE, (10, 10)) is small
+    assert len(AssetLoader._variant_cache) == 2
+
+def test_atlas_packs_variants_into_shared_pages():
+    """Tests that atlas mode hands out subsurfaces of shared pages."""
+    AssetLoader.configure(atlas_size=(64, 64))
+    first = AssetLoader.get_scaled(IMAGE, (30, 30))
+    second = AssetLoader.get_scaled(IMAGE, (30, 30), angle=90)
+    large = AssetLoader.get_scaled(IMAGE, (60, 60))
+    assert first.get_parent() is second.get_parent()
+    assert large.get_parent() is not first.get_parent()
+    assert len(AssetLoader._atlas_pages) == 2
+
+def test_atlas_pages_stay_bounded_under_eviction():
+    """Tests that pages emptied by LRU eviction are freed and the page limit is respected."""
+    AssetLoader.configure(cache_size=4, rotation_step=1.0, atlas_size=(64, 64))
+    for angle in range(0, 360, 3):
+        AssetLoader.get_scaled(IMAGE, (30, 30), angle=angle)
+    assert len(AssetLoader._variant_cache) == 4
+    assert len(AssetLoader._atlas_pages) <= 4
+
+    AssetLoader.configure(cache_size=64, atlas_pages=3)
+    for angle in range(0, 360, 3):
+        # Touch the oldest variant each time so no page ever empties on its own.
+        AssetLoader.get_scaled(IMAGE, (30, 30), angle=0)
+        AssetLoader.get_scaled(IMAGE, (30, 30), angle=angle)
+        assert len(AssetLoader._atlas_pages) <= 3
@@ -0,0 +1,102 @@
+# tests/test_asset_preloader.py
+
+import json
+import logging
+import threading
+import pygame
+from skymind_sim.layer_0_presentation.asset_loader import AssetLoader
+from skymind_sim.layer_0_presentation.asset_preloader import AssetPreloader
+
+def _manifest(tmp_path, images, fonts):
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps({"images": images, "fonts": fonts}), encoding="utf-8")
+    return str(path)
+
+def test_preloader_reports_startup_progress_and_fills_caches(tmp_path, monkeypatch):
+    """Tests that startup and lazy assets are loaded on worker threads into AssetLoader."""
+    monkeypatch.setattr(AssetLoader, "_image_cache", {})
+    monkeypatch.setattr(AssetLoader, "_font_cache", {})
+    threads = set()
+    decode = AssetLoader._decode_image
+    monkeypatch.setattr(AssetLoader, "_decode_image",
+                        staticmethod(lambda name: threads.add(threading.current_thread().name) or decode(name)))
+    manifest = _manifest(tmp_path, [{"name": "drone_2.png", "priority": "startup"}],
+                         [{"name": "Roboto-Regular.ttf", "sizes": [12, 18], "priority": "lazy"}])
+
+    preloader = AssetPreloader(manifest, workers=2).start()
+    seen = []
+    assert preloader.wait_startup(progress=lambda done, total, name: seen.append((done, total, name)))
+    preloader.shutdown(wait=True)
+
+    assert seen == [(1, 1, "drone_2.png")]
+    assert preloader.total == 3 and preloader.progress == 1.0 and not preloader.failed
+    assert all(name.startswith("assets") for name in threads)
+    assert "drone_2.png" in AssetLoader._image_cache and "Roboto-Regular.ttf_18" in AssetLoader._font_cache
+    assert AssetLoader.get_font("Roboto-Regular.ttf", 12) is AssetLoader._font_cache["Roboto-Regular.ttf_12"]
+    assert not AssetLoader._pending
+
+def test_get_image_waits_for_in_flight_load(tmp_path, monkeypatch):
+    """Tests that a first use during preloading reuses the background decode."""
+    monkeypatch.setattr(AssetLoader, "_image_cache", {})
+    release = threading.Event()
+    calls = []
+    decode = AssetLoader._decode_image
+
+    def slow_decode(name):
+        calls.append(name)
+        release.wait(5)
+        return decode(name)
+
+    monkeypatch.setattr(AssetLoader, "_decode_image", staticmethod(slow_decode))
+    preloader = AssetPreloader(_manifest(tmp_path, [{"name": "drone_2.png"}], []), workers=1).start()
+    threading.Timer(0.05, release.set).start()
+
+    image = AssetLoader.get_image("drone_2.png")
+    preloader.shutdown(wait=True)
+    assert calls == ["drone_2.png"] and image is AssetLoader._image_cache["drone_2.png"]
+
+def test_fonts_are_created_one_at_a_time(tmp_path, monkeypatch):
+    """Tests that font loads never overlap while images decode in parallel."""
+    monkeypatch.setattr(AssetLoader, "_font_cache", {})
+    active, overlaps, threads = [0], [], set()
+    create = pygame.font.Font
+
+    def tracked_font(*args):
+        active[0] += 1
+        overlaps.append(active[0])
+        threads.add(threading.current_thread().name)
+        try:
+            return create(*args)
+        finally:
+            active[0] -= 1
+
+    monkeypatch.setattr(pygame.font, "Font", tracked_font)
+    fonts = [{"name": name, "sizes": [10, 14, 20], "priority": "startup"}
+             for name in ("Roboto-Regular.ttf", "Vazirmatn-Regular.ttf")]
+    preloader = AssetPreloader(_manifest(tmp_path, [], fonts), workers=4).start()
+    assert preloader.wait_startup(timeout=10)
+    preloader.shutdown(wait=True)
+
+    assert len(AssetLoader._font_cache) == 6
+    assert max(overlaps) == 1
+    assert all(name.startswith("assets-fonts") for name in threads)
+
+def test_shutdown_cancels_queued_assets_cleanly(tmp_path, monkeypatch):
+    """Tests that assets still queued at shutdown are cancelled without callback errors or stale state."""
+    monkeypatch.setattr(AssetLoader, "_image_cache", {})
+    release = threading.Event()
+    decode = AssetLoader._decode_image
+    monkeypatch.setattr(AssetLoader, "_decode_image", staticmethod(lambda name: release.wait(5) and decode(name)))
+    images = [{"name": "drone_2.png", "priority": "startup"}] + \
+             [{"name": f"missing_{i}.png", "priority": "lazy"} for i in range(4)]
+    errors = []
+    monkeypatch.setattr(logging.getLogger("concurrent.futures"), "exception", lambda msg, *args: errors.append(msg))
+    preloader = AssetPreloader(_manifest(tmp_path, images, []), workers=1).start()
+
+    preloader.shutdown()
+    release.set()
+    preloader._startup[0].result(timeout=5)
+
+    assert preloader.cancelled == 4 and preloader.done == 5 and preloader.progress == 1.0
+    assert not preloader.failed and not AssetLoader._pending
+    assert errors == []
@@ -0,0 +1,43 @@
+# tests/test_event_system.py
+
+import pytest
+from skymind_sim.utils.event_system import Event, EventQueue, EventType
+
+def test_event_queue_orders_and_warps_time():
+    """Tests (timestamp, sequence) ordering and time-warp to the next event."""
+    queue = EventQueue()
+    fired = []
+    queue.subscribe(EventType.UPDATE_STATE, lambda e: fired.append((queue.now, e.data)))
+    queue.schedule_at(100.0, EventType.UPDATE_STATE, "late")
+    queue.schedule_at(5.0, EventType.UPDATE_STATE, "first")
+    queue.schedule_at(5.0, EventType.UPDATE_STATE, "second")
+
+    assert queue.step() == 5.0
+    assert fired == [(5.0, "first"), (5.0, "second")]
+    assert queue.step() == 100.0 and queue.step() is None
+    assert queue.processed == 3
+
+def test_event_queue_cancellation_and_callbacks():
+    """Tests that cancelled events never fire and that callbacks can reschedule."""
+    queue = EventQueue()
+    fired = []
+
+    def tick(event):
+        fired.append(event.timestamp)
+        if event.timestamp < 3:
+            queue.schedule(1, EventType.AGENT_STEP, callback=tick)
+
+    queue.schedule_at(1, EventType.AGENT_STEP, callback=tick)
+    doomed = queue.schedule_at(2.5, EventType.AGENT_STEP, callback=tick)
+    assert len(queue) == 2
+    assert doomed.cancel() and not doomed.cancel()
+    assert len(queue) == 1
+
+    assert queue.run_until(10) == 3
+    assert fired == [1, 2, 3] and queue.now == 10
+    with pytest.raises(ValueError):
+        queue.schedule_at(5, EventType.AGENT_STEP)
+
+def test_event_sequence_breaks_timestamp_ties():
+    """Tests that Event ordering falls back to the sequence number."""
+    assert Event(1.0, EventType.UPDATE_STATE, sequence=1) < Event(1.0, EventType.VISUALIZER_UPDATE, sequence=2)
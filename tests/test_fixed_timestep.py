@@ -0,0 +1,44 @@
+# tests/test_fixed_timestep.py
+
+import pygame
+from skymind_sim.layer_1_simulation.simulation import Simulation
+
+class _Clock:
+    """Replays a scripted sequence of frame times (ms)."""
+    def __init__(self, frames):
+        self.frames = list(frames)
+
+    def tick(self, fps):
+        return self.frames.pop(0)
+
+class _Input:
+    def handle_events(self):
+        return {"quit": False, "movement_intent": pygame.math.Vector2(1, 0)}
+
+class _Renderer:
+    """Records what each rendered frame would have drawn."""
+    def __init__(self, sim, frames):
+        self.sim, self.frames, self.seen = sim, frames, []
+
+    def render(self, world):
+        player = world.player_drone
+        self.seen.append((self.sim.current_step, world.render_alpha, world.render_position(player).x))
+        if len(self.seen) == self.frames:
+            self.sim.stop()
+
+def test_accumulator_steps_interpolates_and_caps():
+    """Tests fixed steps per frame, interpolated drawing and the max-steps-per-frame cap."""
+    sim = Simulation(headless=True)
+    sim.headless, sim.fixed_dt, sim.max_steps_per_frame, sim.time_scale = False, 0.02, 5, 1.0
+    sim.clock, sim.input_handler = _Clock([50, 5, 500]), _Input()
+    sim.renderer = _Renderer(sim, 3)
+    start_x, speed = sim.player_drone.position.x, sim.player_drone.speed
+
+    sim.run()
+
+    (steps_1, alpha_1, x_1), (steps_2, alpha_2, _), (steps_3, alpha_3, _) = sim.renderer.seen
+    assert (steps_1, steps_2, steps_3) == (2, 2, 7)
+    assert abs(alpha_1 - 0.5) < 1e-9 and abs(alpha_2 - 0.75) < 1e-9 and abs(alpha_3 - 0.75) < 1e-9
+    # Drawn halfway between the positions after step 1 and step 2
+    assert abs(x_1 - (start_x + 1.5 * 0.02 * speed)) < 1e-9
+    assert abs(sim.sim_time - 7 * 0.02) < 1e-9
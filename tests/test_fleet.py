@@ -0,0 +1,50 @@
+# tests/test_fleet.py
+
+import numpy as np
+from pygame.math import Vector2
+from skymind_sim.layer_1_simulation.world.grid import Grid
+from skymind_sim.layer_1_simulation.entities.drone import Drone
+from skymind_sim.layer_1_simulation.entities.fleet import FleetState
+
+def test_fleet_integrate_and_energy_drain():
+    """Tests vectorized integration, energy drain and that inactive or empty drones stay put."""
+    fleet = FleetState(capacity=2)
+    rows = fleet.add_many([(0, 0), (1, 1), (2, 2)], speed=2.0, energy=10.0)
+    fleet.velocities[:3] = [(1, 0), (0, 2), (3, 4)]
+    fleet.active[rows[1]] = False
+
+    fleet.integrate(0.5, energy_per_unit=1.0)
+
+    assert fleet.capacity >= 3
+    assert np.allclose(fleet.positions[:3], [(0.5, 0), (1, 1), (3.5, 4.0)])
+    assert np.allclose(fleet.energy[:3], [9.5, 10.0, 7.5])
+
+    fleet.energy[0] = 0.0
+    fleet.integrate(1.0)
+    assert np.allclose(fleet.positions[0], (0.5, 0))
+
+def test_drone_is_view_onto_fleet():
+    """Tests that fleet-backed drones read and write their row and survive array growth."""
+    grid = Grid(width=10, height=10, cell_size=(10, 10))
+    fleet = FleetState(capacity=1)
+    first = Drone("d1", grid, position=(1, 2), fleet=fleet)
+    second = Drone("d2", grid, position=(3, 4), fleet=fleet)
+
+    first.move(Vector2(1, 0))
+    second.position += Vector2(1, 1)
+    fleet.integrate(1.0)
+
+    assert first.position == Vector2(1 + first.speed, 2)
+    assert second.position == Vector2(4, 5)
+    assert second.fleet_index == 1
+    assert first.rect.center == (int((1 + first.speed) * 10), 20)
+
+def test_standalone_drone_update_unchanged():
+    """Tests that drones without a fleet keep their own state."""
+    grid = Grid(width=10, height=10, cell_size=(10, 10))
+    drone = Drone("solo", grid, position=(1, 1))
+    drone.move(Vector2(0, 1))
+    drone.update(0.2)
+
+    assert drone.fleet_index is None
+    assert drone.position == Vector2(1, 1 + 0.2 * drone.speed)
@@ -0,0 +1,84 @@
+# tests/test_grid.py
+
+import pytest
+import numpy as np
+from skymind_sim.layer_1_simulation.world.grid import Grid
+from skymind_sim.layer_1_simulation.world.obstacle import Obstacle
+from skymind_sim.layer_3_intelligence.pathfinding.a_star import AStarPlanner
+
+@pytest.fixture
+def grid():
+    """Provides a small 10x8 grid with 10px cells."""
+    return Grid(width=10, height=8, cell_size=(10, 10))
+
+def test_grid_occupancy_initialization(grid):
+    """Tests that the occupancy array is compact and starts empty."""
+    assert grid.occupancy.shape == (8, 10)
+    assert grid.occupancy.dtype == np.uint8
+    assert not grid.occupancy.any()
+    assert grid.cost is None
+
+def test_stamp_obstacle_positions(grid):
+    """Tests vectorized stamping from Obstacle.positions and the version counter."""
+    version = grid.version
+    stamped = grid.add_obstacle(Obstacle([(1, 2), (3, 4), (50, 50)]))
+
+    assert stamped == 2
+    assert grid.is_obstacle(1, 2)
+    assert grid.is_obstacle(3, 4)
+    assert not grid.is_obstacle(2, 1)
+    assert grid.is_obstacle(-1, 0), "Out-of-bounds cells should count as blocked."
+    assert grid.version > version
+
+def test_load_obstacles_from_map_schemas(grid):
+    """Tests the three rectangle schemas used in data/maps."""
+    grid.load_obstacles_from_map({"obstacles": [
+        [0, 0, 20, 10],                                   # pixels, list form
+        {"x": 45, "y": 45, "width": 10, "height": 10},   # pixels, dict form
+        {"position": [8, 6], "size": [2, 2]},            # cells
+    ]})
+
+    assert grid.occupancy[0, 0:2].all() and not grid.occupancy[0, 2]
+    assert grid.occupancy[4:6, 4:6].all()
+    assert grid.occupancy[6:8, 8:10].all()
+
+def test_cell_views_with_a_star(grid):
+    """Tests that the object-based A* planner works on top of the occupancy array."""
+    grid.stamp_rectangles([(5, 0, 1, 7)])
+    path = AStarPlanner().find_path(grid, (0, 0), (9, 0))
+
+    assert path[0] == (0, 0) and path[-1] == (9, 0)
+    assert all(not grid.is_obstacle(x, y) for x, y in path)
+    assert len(path) == 1 + 9 + 2 * 7
+
+def test_cost_layer_shape_validation(grid):
+    """Tests that a cost layer must match the grid shape."""
+    with pytest.raises(ValueError, match="does not match"):
+        grid.set_cost_layer(np.ones((3, 3)))
+
+def test_change_journal_tracks_cells_since_version(grid):
+    """Tests that changes_since reports changed cells and detects untracked edits."""
+    version = grid.version
+    grid.set_obstacle(2, 3)
+    grid.stamp_rectangles([(0, 0, 2, 1)])
+
+    assert sorted(grid.changes_since(version).tolist()) == [0, 1, 3 * 10 + 2]
+    assert grid.changes_since(grid.version).size == 0
+
+    grid.occupancy[5, 5] = 1
+    grid.version += 1  # Bypasses the journal
+    assert grid.changes_since(version) is None
+
+def test_restamping_unchanged_cells_keeps_the_version(grid):
+    """Tests that stamping cells that already hold the value does not invalidate caches."""
+    grid.stamp_positions([(1, 1), (2, 2)])
+    grid.stamp_rectangles([(4, 4, 2, 2)])
+    version = grid.version
+
+    grid.stamp_positions([(1, 1), (2, 2)])
+    grid.stamp_rectangles([(4, 4, 2, 2)])
+    grid.stamp_positions([(7, 7)], blocked=False)
+    assert grid.version == version
+
+    grid.stamp_rectangles([(4, 4, 3, 1)])
+    assert grid.version == version + 1 and grid.changes_since(version).tolist() == [4 * 10 + 6]
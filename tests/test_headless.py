@@ -0,0 +1,34 @@
+# tests/test_headless.py
+
+import pygame
+from skymind_sim.layer_1_simulation.simulation import Simulation
+
+def test_headless_simulation_runs_fixed_steps():
+    """Tests that headless mode opens no display, loads no sprites and steps with a fixed dt."""
+    sim = Simulation(headless=True)
+    sim.movement_intent = pygame.math.Vector2(1, 0)
+    start_x = sim.player_drone.position.x
+
+    sim.run(steps=50, dt=0.1)
+
+    assert pygame.display.get_surface() is None
+    assert sim.renderer is None and sim.player_drone.image is None
+    assert sim.current_step == 50
+    assert abs(sim.sim_time - 5.0) < 1e-9
+    assert abs(sim.player_drone.position.x - (start_x + 5.0 * sim.player_drone.speed)) < 1e-9
+
+def test_single_steps_match_a_run_without_logging(monkeypatch):
+    """Tests that step() advances exactly like run() and writes no log records."""
+    sim, reference = Simulation(headless=True), Simulation(headless=True)
+    for s in (sim, reference):
+        s.movement_intent = pygame.math.Vector2(0, 1)
+    reference.run(steps=20, dt=0.1)
+
+    records = []
+    monkeypatch.setattr(sim.logger, "handle", records.append)
+    monkeypatch.setattr(sim.logger, "isEnabledFor", lambda level: True)
+    for _ in range(20):
+        sim.step(0.1)
+
+    assert records == []
+    assert sim.current_step == 20 and sim.player_drone.position == reference.player_drone.position
@@ -0,0 +1,48 @@
+# tests/test_map_compiler.py
+
+import os
+import shutil
+import numpy as np
+from skymind_sim.layer_1_simulation.world.grid import Grid
+from skymind_sim.layer_1_simulation.world.map_compiler import compile_map, load_map
+
+MAPS_DIR = os.path.join(os.path.dirname(__file__), "..", "data", "maps")
+
+def test_ascii_map_markers_and_occupancy():
+    """Tests that ASCII maps keep walls, start and end markers."""
+    compiled = compile_map(os.path.join(MAPS_DIR, "map1.txt"))
+    assert (compiled.width, compiled.height) == (20, 11)
+    assert compiled.starts == [(1, 1), (1, 8)] and compiled.ends == [(18, 5)]
+    assert compiled.occupancy[0].all() and compiled.occupancy[1, 4] == 1 and compiled.occupancy[1, 1] == 0
+
+def test_json_maps_match_grid_stamping():
+    """Tests that the JSON schemas rasterize exactly like Grid.load_obstacles_from_map."""
+    compiled = compile_map(os.path.join(MAPS_DIR, "simple_map.json"))
+    grid = Grid(40, 30, (30, 30))
+    grid.stamp_rectangles([(10, 10, 1, 3), (15, 20, 3, 1)])
+    assert np.array_equal(compiled.occupancy, grid.occupancy)
+    assert [s["position"] for s in compiled.spawns] == [[5, 5], [25, 15]]
+
+    basic = compile_map(os.path.join(MAPS_DIR, "basic_map.json"))
+    assert (basic.width, basic.height) == (32, 24) and basic.meta["cell_size"] == [32, 32]
+    assert basic.spawns == [{"id": 1, "position": [3, 3]}] and basic.meta["goals"] == [[10, 8], [20, 5]]
+
+def test_load_map_uses_hash_keyed_memmap_cache(tmp_path):
+    """Tests that the cache is reused, memory-mapped, and invalidated when the source changes."""
+    source = str(tmp_path / "map.txt")
+    shutil.copy(os.path.join(MAPS_DIR, "complex_map_01.txt"), source)
+    cache_dir = str(tmp_path / "cache")
+
+    first = load_map(source, cache_dir=cache_dir)
+    cached = load_map(source, cache_dir=cache_dir)
+    assert isinstance(cached.packed, np.memmap)
+    assert np.array_equal(cached.occupancy, first.occupancy) and cached.meta == first.meta
+    assert len(os.listdir(cache_dir)) == 1
+
+    with open(source, "a", encoding="utf-8") as f:
+        f.write("#####\n")
+    assert load_map(source, cache_dir=cache_dir).height == first.height + 1
+    assert len(os.listdir(cache_dir)) == 2
+
+    grid = Grid(10, 5, (30, 30))
+    assert cached.apply(grid) == int(first.occupancy[:5, :10].sum())
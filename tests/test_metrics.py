@@ -0,0 +1,60 @@
+# tests/test_metrics.py
+
+import csv
+import numpy as np
+from skymind_sim.utils.metrics import MetricsCollector
+
+def _fill(metrics):
+    metrics.log_task("a", "A_STAR", [(0, 0), (1, 0), (2, 0)], 2, 90.0, 1.5, 0, 1)
+    metrics.log_task("b", "JPS", [], 0, None, 0.0, 1, 0)
+    metrics.log_task("c", "A_STAR", [(5, 5)], 0, 50.0, 2.0, 0, 0)
+    for latency, ok in ((0.05, True), (None, False), (0.07, True)):
+        metrics.log_network_event("c", latency, ok, 3)
+    metrics.log_network_event("a", 0.06, True, 1)
+
+def test_join_matches_naive_nested_scan(tmp_path):
+    """Tests the indexed join against the original per-task filtering, with chunks flushed to disk."""
+    metrics = MetricsCollector(output_dir=str(tmp_path / "run"), chunk_size=2)
+    _fill(metrics)
+    metrics.flush()
+    columns = metrics.to_columns()
+
+    assert columns["DroneID"].tolist() == ["a", "b", "c", "c", "c"]
+    assert columns["PathLength"].tolist() == [3, 0, 1, 1, 1]
+    assert np.isnan(columns["Latency"][1]) and np.isnan(columns["Latency"][3])
+    assert columns["CommSuccess"].tolist() == [1, -1, 1, 0, 1]
+    assert columns["NeighborCount"].tolist() == [1, -1, 3, 3, 3]
+    assert np.isnan(columns["BatteryRemaining"][1])
+    assert len(list((tmp_path / "run").glob("events-*.npz"))) == 2
+    assert metrics.path_of("a").tolist() == [[0, 0], [1, 0], [2, 0]]
+
+def test_csv_exports_keep_paths_out_of_cells(tmp_path):
+    """Tests the joined CSV layout and the long-format path export."""
+    metrics = MetricsCollector()
+    _fill(metrics)
+    metrics.export_csv(tmp_path / "metrics.csv")
+    metrics.export_paths_csv(tmp_path / "paths.csv")
+
+    with open(tmp_path / "metrics.csv", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == MetricsCollector.COLUMNS
+    assert rows[2] == ["b", "JPS", "0", "0.0", "", "0.0", "1", "0", "", "", ""]
+    assert rows[4][-3:] == ["", "False", "3"]
+    with open(tmp_path / "paths.csv", encoding="utf-8") as f:
+        assert list(csv.reader(f))[1:] == [["a", "0", "0.0", "0.0"], ["a", "1", "1.0", "0.0"],
+                                           ["a", "2", "2.0", "0.0"], ["c", "0", "5.0", "5.0"]]
+
+def test_collectors_can_share_an_output_dir(tmp_path):
+    """Tests that two collectors flushing to one directory keep separate chunk files."""
+    first = MetricsCollector(output_dir=str(tmp_path), chunk_size=2)
+    second = MetricsCollector(output_dir=str(tmp_path), chunk_size=2)
+    _fill(first)
+    second.log_network_event("z", 0.5, True, 7)
+    second.log_network_event("z", 0.6, True, 7)
+    second.log_task("z", "JPS", [], 0, None, 1.0, 0, 0)
+    for metrics in (first, second):
+        metrics.flush()
+
+    assert len(list(tmp_path.glob("events-*.npz"))) == 3
+    assert first.to_columns()["DroneID"].tolist() == ["a", "b", "c", "c", "c"]
+    assert second.to_columns()["NeighborCount"].tolist() == [7, 7]
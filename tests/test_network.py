@@ -0,0 +1,91 @@
+# tests/test_network.py
+
+import math
+import random
+from types import SimpleNamespace
+from skymind_sim.network.communication import UAVCommChannel, UAVNetworkManager
+from skymind_sim.utils.spatial_hash import SpatialHash
+
+def _make_drones(count, seed=0, extent=1000.0):
+    rng = random.Random(seed)
+    return [SimpleNamespace(id=f"uav_{i}", position=(rng.uniform(0, extent), rng.uniform(0, extent)),
+                            neighbors=[], inbox=[]) for i in range(count)]
+
+def test_update_neighbors_matches_brute_force():
+    """Tests that spatial-hash neighbor discovery matches the all-pairs definition, also after moves."""
+    drones = _make_drones(300)
+    channel = UAVCommChannel(comm_range=80.0)
+    manager = UAVNetworkManager(drones, channel)
+
+    for step in range(2):
+        manager.update_neighbors()
+        for drone in drones:
+            expected = [o.id for o in drones if o.id != drone.id and math.dist(drone.position, o.position) <= 80.0]
+            assert drone.neighbors == expected
+        for drone in drones:
+            drone.position = (drone.position[0] + 37.0, drone.position[1] - 11.0)
+
+    drones.pop()
+    manager.update_neighbors()
+    assert len(manager.index) == len(drones)
+
+def test_broadcast_resolves_receivers_by_id():
+    """Tests that broadcast delivers to every neighbor."""
+    drones = _make_drones(3, extent=1.0)
+    for drone in drones:
+        drone.receive_message = lambda msg, latency, ok, d=drone: d.inbox.append((msg, ok))
+    channel = UAVCommChannel(comm_range=10.0, packet_loss_rate=0.0, base_latency=0.0)
+    manager = UAVNetworkManager(drones, channel)
+    manager.update_neighbors()
+
+    manager.broadcast("uav_0", "hello", size_bytes=0)
+    manager.advance_to(0.0)
+
+    assert drones[0].inbox == []
+    assert drones[1].inbox == [("hello", True)] and drones[2].inbox == [("hello", True)]
+
+def test_id_lookup_follows_drone_list_changes():
+    """Tests that get_drone sees added and removed drones and a miss does not rebuild the table."""
+    drones = _make_drones(3, extent=1.0)
+    manager = UAVNetworkManager(drones, UAVCommChannel(comm_range=10.0))
+    table = manager._by_id
+
+    assert manager.get_drone("missing") is None and manager._by_id is table
+    extra = SimpleNamespace(id="uav_9", position=(0.5, 0.5), neighbors=[])
+    manager.add_drone(extra)
+    assert manager.get_drone("uav_9") is extra
+    manager.update_neighbors()
+    manager.remove_drone("uav_0")
+    assert manager.get_drone("uav_0") is None and len(drones) == 3 and "uav_0" not in manager.index.ids()
+
+    manager.drones = drones[:1]
+    assert manager.get_drone("uav_9") is None and manager.get_drone("uav_1") is drones[0]
+
+def test_deliveries_follow_simulated_latency():
+    """Tests that messages are delivered when simulated time reaches now + latency, without blocking."""
+    drones = _make_drones(2, extent=1.0)
+    received = []
+    drones[1].receive_message = lambda msg, latency, ok: received.append((manager.now, msg))
+    channel = UAVCommChannel(comm_range=10.0, bandwidth=1000, packet_loss_rate=0.0, base_latency=0.5)
+    manager = UAVNetworkManager(drones, channel)
+
+    manager.send(drones[0], drones[1], "big", size_bytes=1000)    # 0.5 + 1.0 s
+    manager.send(drones[0], drones[1], "small", size_bytes=100)   # 0.5 + 0.1 s
+
+    assert manager.pending_count == 2 and manager.next_delivery_time() == 0.6
+    assert manager.step(0.5) == 0
+    assert manager.step(0.5) == 1
+    manager.advance_to(10.0)
+    assert received == [(0.6, "small"), (1.5, "big")]
+    assert manager.now == 10.0
+
+def test_spatial_hash_rect_query():
+    """Tests rectangle queries and incremental removal."""
+    index = SpatialHash(cell_size=10.0)
+    index.update("a", (5, 5))
+    index.update("b", (25, 5))
+    index.update("a", (-3, 2))
+
+    assert index.query_rect(-5, 0, 20, 10) == ["a"]
+    index.remove("a")
+    assert "a" not in index and index.query_rect(-100, -100, 100, 100) == ["b"]
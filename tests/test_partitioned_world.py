@@ -0,0 +1,53 @@
+# tests/test_partitioned_world.py
+
+import math
+import numpy as np
+import pytest
+from skymind_sim.layer_1_simulation.world.grid import Grid
+from skymind_sim.layer_1_simulation.world.partitioned_world import PartitionedWorld
+
+def _scenario(world):
+    rng = np.random.default_rng(11)
+    positions = rng.uniform(1, 39, size=(120, 2))
+    positions = positions[world.grid.occupancy[positions[:, 1].astype(int), positions[:, 0].astype(int)] == 0]
+    world.add_drones(positions, rng.uniform(-3, 3, size=(len(positions), 2)))
+    return [world.step(0.25) for _ in range(8)]
+
+def _grid():
+    grid = Grid(width=40, height=40, cell_size=(10, 10))
+    grid.stamp_rectangles([(18, 5, 4, 30)])
+    return grid
+
+def test_worker_processes_match_in_process_stepping():
+    """Tests that tile workers in separate processes produce the same state as sequential stepping."""
+    with PartitionedWorld(_grid(), tiles=(2, 2), capacity=256, interaction_radius=3.0, processes=0) as serial, \
+         PartitionedWorld(_grid(), tiles=(2, 2), capacity=256, interaction_radius=3.0) as parallel:
+        serial_stats = _scenario(serial)
+        parallel_stats = _scenario(parallel)
+
+        assert serial_stats == parallel_stats
+        assert sum(s["migrated"] for s in parallel_stats) > 0
+        assert np.array_equal(serial.positions, parallel.positions)
+        assert np.array_equal(parallel.owners, parallel.layout.tile_of(parallel.positions))
+        assert np.array_equal(serial.neighbor_counts, parallel.neighbor_counts)
+
+def test_halo_neighbors_match_brute_force():
+    """Tests that neighbor counts across tile edges (via halos) equal the all-pairs result."""
+    with PartitionedWorld(_grid(), tiles=(4, 4), capacity=256, interaction_radius=3.0, processes=0) as world:
+        _scenario(world)
+        positions = world.positions
+        for i, p in enumerate(positions):
+            distances = [math.dist(p, q) for j, q in enumerate(positions) if j != i]
+            assert world.neighbor_counts[i] == sum(d <= 3.0 for d in distances)
+            nearest = min(distances)
+            assert math.isclose(world.min_separation[i], nearest) or (nearest > 3.0 and np.isinf(world.min_separation[i]))
+        assert not world.grid.occupancy[positions[:, 1].astype(int), positions[:, 0].astype(int)].any()
+
+def test_interaction_radius_larger_than_a_tile_is_rejected():
+    """Tests that halo exchange with adjacent tiles only is never asked to cover a wider radius."""
+    with pytest.raises(ValueError):
+        PartitionedWorld(_grid(), tiles=(4, 4), interaction_radius=10.5, processes=0)
+    with pytest.raises(ValueError):
+        PartitionedWorld(_grid(), tiles=(3, 1), interaction_radius=13.0, processes=0)
+    with PartitionedWorld(_grid(), tiles=(4, 4), interaction_radius=10.0, processes=0) as world:
+        assert world.radius == 10.0
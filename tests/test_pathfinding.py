@@ -0,0 +1,220 @@
+# tests/test_pathfinding.py
+
+import random
+from types import SimpleNamespace
+import pytest
+import numpy as np
+from skymind_sim.layer_1_simulation.world.grid import Grid
+from skymind_sim.layer_3_intelligence.pathfinding.a_star import AStarPlanner
+from skymind_sim.layer_3_intelligence.pathfinding.grid_a_star import GridAStarPlanner
+from skymind_sim.layer_3_intelligence.pathfinding.jps import JumpPointPlanner
+from skymind_sim.layer_3_intelligence.pathfinding.path_planner import PathPlanner
+from skymind_sim.layer_3_intelligence.pathfinding.flow_field import FlowField
+from skymind_sim.layer_1_simulation.movement.drone_mover import DroneMover
+
+@pytest.fixture
+def maze_grid():
+    """Provides a 30x20 grid with a reproducible scattering of obstacles."""
+    grid = Grid(width=30, height=20, cell_size=(10, 10))
+    rng = np.random.default_rng(7)
+    grid.occupancy[:] = rng.random((20, 30)) < 0.25
+    grid.occupancy[0, 0] = 0
+    grid.occupancy[19, 29] = 0
+    grid.version += 1
+    return grid
+
+def _assert_valid_path(grid, path, start, end, diagonal=False):
+    """Checks that a path is contiguous, obstacle-free and joins start to end."""
+    assert path[0] == start and path[-1] == end
+    for (x0, y0), (x1, y1) in zip(path, path[1:]):
+        dx, dy = abs(x1 - x0), abs(y1 - y0)
+        assert max(dx, dy) == 1 and (diagonal or dx + dy == 1)
+        assert not grid.is_obstacle(x1, y1)
+
+def test_grid_a_star_matches_object_a_star(maze_grid):
+    """Tests that the array-based A* finds paths of the same length as the classic A*."""
+    classic, array_based = AStarPlanner(), GridAStarPlanner()
+    rng = random.Random(3)
+    free = [(x, y) for y in range(20) for x in range(30) if not maze_grid.is_obstacle(x, y)]
+    for _ in range(25):
+        start, end = rng.choice(free), rng.choice(free)
+        expected = classic.find_path(maze_grid, start, end)
+        path = array_based.find_path(maze_grid, start, end)
+        if expected is None:
+            assert path is None
+        else:
+            _assert_valid_path(maze_grid, path, start, end)
+            assert len(path) == len(expected)
+
+def test_grid_a_star_reuses_workspace_after_obstacle_change(maze_grid):
+    """Tests that repeated searches see obstacle changes without a full reset."""
+    planner = GridAStarPlanner()
+    maze_grid.occupancy[:] = 0
+    maze_grid.version += 1
+    assert len(planner.find_path(maze_grid, (0, 0), (5, 0))) == 6
+
+    maze_grid.stamp_rectangles([(3, 0, 1, 19)])
+    path = planner.find_path(maze_grid, (0, 0), (5, 0))
+    _assert_valid_path(maze_grid, path, (0, 0), (5, 0))
+    assert (3, 19) in path
+
+def test_grid_a_star_unreachable_goal():
+    """Tests that a walled-off goal returns None."""
+    grid = Grid(width=5, height=5, cell_size=(10, 10))
+    grid.stamp_positions([(3, 4), (4, 3), (3, 3)])
+    assert GridAStarPlanner().find_path(grid, (0, 0), (4, 4)) is None
+
+def test_path_planner_rejects_unknown_algorithm():
+    """Tests that PathPlanner raises for unsupported algorithm names."""
+    with pytest.raises(ValueError, match="not supported"):
+        PathPlanner("NOT_AN_ALGORITHM")
+
+@pytest.mark.parametrize("algorithm", ["OCTILE_A_STAR", "JPS"])
+def test_diagonal_planners_agree_on_length(maze_grid, algorithm):
+    """Tests that JPS and octile A* return equally long 8-connected paths."""
+    reference = PathPlanner("OCTILE_A_STAR")
+    planner = PathPlanner(algorithm)
+    rng = random.Random(11)
+    free = [(x, y) for y in range(20) for x in range(30) if not maze_grid.is_obstacle(x, y)]
+    for _ in range(25):
+        start, end = rng.choice(free), rng.choice(free)
+        expected = reference.plan_path(maze_grid, start, end)
+        path = planner.plan_path(maze_grid, start, end)
+        if expected is None:
+            assert path is None
+            continue
+        _assert_valid_path(maze_grid, path, start, end, diagonal=True)
+        cost = lambda p: sum(np.hypot(x1 - x0, y1 - y0) for (x0, y0), (x1, y1) in zip(p, p[1:]))
+        assert cost(path) == pytest.approx(cost(expected))
+
+def test_jps_expands_fewer_nodes_on_open_floor():
+    """Tests that JPS expands far fewer nodes than 4-connected A* on an open map."""
+    grid = Grid(width=60, height=60, cell_size=(10, 10))
+    grid.stamp_rectangles([(20, 10, 5, 30)])
+    jps, a_star = JumpPointPlanner(), GridAStarPlanner()
+    assert jps.find_path(grid, (0, 0), (59, 59)) is not None
+    assert a_star.find_path(grid, (0, 0), (59, 59)) is not None
+    assert jps.last_expanded * 10 < a_star.last_expanded
+
+def test_path_cache_hits_and_invalidation():
+    """Tests LRU caching of repeated queries and invalidation on obstacle changes."""
+    grid = Grid(width=10, height=10, cell_size=(10, 10))
+    planner = PathPlanner("GRID_A_STAR", cache_size=2)
+
+    first = planner.plan_path(grid, (0, 0), (9, 0))
+    first.pop(0)  # Callers may mutate the returned list
+    assert planner.plan_path(grid, (0, 0), (9, 0))[0] == (0, 0)
+    assert planner.get_cache_stats()["hits"] == 1
+
+    planner.plan_path(grid, (0, 0), (0, 9))
+    planner.plan_path(grid, (0, 0), (9, 9))  # Evicts the least recently used entry
+    assert planner.get_cache_stats()["size"] == 2
+
+    grid.set_obstacle(5, 0)
+    path = planner.plan_path(grid, (0, 0), (9, 0))
+    assert (5, 0) not in path
+    assert planner.get_cache_stats() == {"hits": 1, "misses": 4, "size": 1, "capacity": 2}
+
+def test_flow_field_matches_a_star_distances(maze_grid):
+    """Tests that flow-field distances and paths agree with A* path lengths."""
+    field = FlowField(maze_grid, (29, 19))
+    planner = GridAStarPlanner()
+    for start in [(0, 0), (5, 5), (12, 3), (20, 15)]:
+        expected = planner.find_path(maze_grid, start, (29, 19))
+        if expected is None:
+            assert not field.is_reachable(start)
+            continue
+        assert field.distance[start[1], start[0]] == len(expected) - 1
+        path = field.path_from(start)
+        _assert_valid_path(maze_grid, path, start, (29, 19))
+        assert len(path) == len(expected)
+
+def test_flow_field_vectorized_steps_match_scalar(maze_grid):
+    """Tests that next_steps for many drones matches per-drone next_step lookups."""
+    field = PathPlanner("GRID_A_STAR").get_flow_field(maze_grid, (29, 19))
+    free = np.argwhere(maze_grid.occupancy == 0)[:, ::-1]
+    steps = field.next_steps(free)
+    for pos, step in zip(free.tolist(), steps.tolist()):
+        expected = field.next_step(pos)
+        assert tuple(step) == (expected if expected is not None else tuple(pos))
+
+def test_drone_mover_shares_flow_field_between_drones():
+    """Tests that drones heading to the same goal reuse one flow field and arrive."""
+    grid = Grid(width=12, height=12, cell_size=(10, 10))
+    grid.stamp_rectangles([(6, 0, 1, 10)])
+    world = SimpleNamespace(grid=grid, check_collision=lambda p: grid.is_obstacle(p[0], p[1]))
+    mover = DroneMover(world, use_flow_fields=True)
+    drones = [SimpleNamespace(id=f"drone_{i}", active=True, position=(0, i), destination=(11, 0),
+                              path=[], path_history=[], collision_avoided=0) for i in range(5)]
+
+    for _ in range(40):
+        mover.move_drones(drones)
+
+    assert all(d.position == (11, 0) for d in drones)
+    assert len(mover.path_planner._flow_fields) == 1
+
+def test_d_star_lite_repairs_after_cell_changes(maze_grid):
+    """Tests that D* Lite keeps optimal path lengths while drones move and cells change."""
+    maze_grid.occupancy[:] = 0
+    maze_grid.version += 1
+    planner = PathPlanner("D_STAR_LITE")
+    reference = GridAStarPlanner()
+    goal = (29, 19)
+    position = (0, 0)
+    rng = random.Random(5)
+
+    for _ in range(30):
+        path = planner.plan_path(maze_grid, position, goal, agent_id="drone_1")
+        expected = reference.find_path(maze_grid, position, goal)
+        if expected is None:
+            assert path is None
+            break
+        assert len(path) == len(expected)
+        _assert_valid_path(maze_grid, path, position, goal)
+        if len(path) > 1:
+            position = path[1]
+        # Block a couple of cells ahead on the route, like traffic crossing the corridor
+        ahead = path[2:-1]
+        for x, y in rng.sample(ahead, min(2, len(ahead))):
+            maze_grid.set_obstacle(x, y)
+        cell = (rng.randrange(30), rng.randrange(20))
+        if cell not in (position, goal):
+            maze_grid.set_obstacle(*cell, blocked=False)
+
+def test_d_star_lite_searches_share_one_grid_snapshot(maze_grid):
+    """Tests that per-agent D* Lite searches share the occupancy/cost snapshot of a grid version."""
+    from skymind_sim.layer_3_intelligence.pathfinding.d_star_lite import DStarLitePlanner
+    planner = DStarLitePlanner()
+    for i in range(3):
+        planner.find_path(maze_grid, (0, 0), (29, 19), agent_id=f"drone_{i}")
+    searches = list(planner._searches.values())
+    assert all(search._blocked is searches[0]._blocked for search in searches)
+
+    maze_grid.set_obstacle(5, 5, blocked=not maze_grid.is_obstacle(5, 5))
+    for i in range(3):
+        planner.find_path(maze_grid, (0, 0), (29, 19), agent_id=f"drone_{i}")
+    assert all(search._blocked is planner._snapshot.blocked for search in planner._searches.values())
+
+def test_hpa_star_paths_are_valid_and_near_optimal():
+    """Tests HPA* against array A* on a multi-cluster map, before and after obstacle changes."""
+    grid = Grid(width=64, height=48, cell_size=(10, 10))
+    grid.occupancy[:] = np.random.default_rng(4).random((48, 64)) < 0.2
+    grid.version += 1
+    planner = PathPlanner("HPA_STAR", cache_size=0)
+    reference = GridAStarPlanner()
+    rng = random.Random(9)
+    free = [(x, y) for y in range(48) for x in range(64) if not grid.is_obstacle(x, y)]
+
+    for round_ in range(2):
+        for _ in range(20):
+            start, end = rng.choice(free), rng.choice(free)
+            expected = reference.find_path(grid, start, end)
+            path = planner.plan_path(grid, start, end)
+            if expected is None:
+                assert path is None
+                continue
+            _assert_valid_path(grid, path, start, end)
+            assert len(path) <= 1.5 * len(expected) + 2
+        # Second round runs on an incrementally refreshed abstraction
+        grid.stamp_rectangles([(20, 0, 1, 30), (40, 18, 1, 30)])
+        free = [p for p in free if not grid.is_obstacle(*p)]
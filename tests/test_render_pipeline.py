@@ -0,0 +1,70 @@
+# tests/test_render_pipeline.py
+
+import time
+import numpy as np
+import pygame
+from skymind_sim.layer_0_presentation.renderer import Renderer
+from skymind_sim.layer_1_simulation.render_pipeline import SnapshotBuffer, SnapshotView
+from skymind_sim.layer_1_simulation.simulation import Simulation
+from skymind_sim.layer_1_simulation.world.world import World
+
+def test_snapshot_buffer_never_overwrites_a_held_snapshot():
+    """Tests the double-buffer hand-off: held snapshots stay intact and read-only."""
+    world = World(use_fleet=True, headless=True)
+    buffer = SnapshotBuffer()
+    assert buffer.acquire() is None
+
+    assert buffer.publish(world, 1, 0.1, (0.0, 0.0))
+    held = buffer.acquire()
+    world.player_drone.position = (9, 9)
+    assert buffer.publish(world, 2, 0.2, (4.0, 0.0))
+    assert not buffer.publish(world, 3, 0.3, (8.0, 0.0))
+    assert held.step == 1 and tuple(held.positions[0]) != (9.0, 9.0)
+    assert not held.positions.flags.writeable
+    buffer.release()
+
+    latest = buffer.acquire()
+    assert latest.step == 2 and tuple(latest.positions[0]) == (9.0, 9.0)
+    assert held.sim_span == 0.0 and abs(latest.sim_span - 0.1) < 1e-12
+    assert np.array_equal(latest.previous, held.positions)
+    assert latest.camera_offset_at(0.5) == (2.0, 0.0)
+    buffer.release()
+
+def test_snapshot_view_interpolates_and_culls():
+    """Tests that snapshot drawing interpolates positions and skips off-screen drones."""
+    world = World(use_fleet=True)
+    world.add_drone("far", (45, 35))
+    buffer = SnapshotBuffer()
+    world.player_drone.position = (2, 2)
+    buffer.publish(world, 1, 0.0, (0.0, 0.0))
+    world.player_drone.position = (4, 2)
+    buffer.publish(world, 4, 0.3, (0.0, 0.0))
+    assert abs(buffer.acquire().sim_span - 0.3) < 1e-12
+    buffer.release()
+
+    rects = SnapshotView(world.grid, buffer.acquire(), alpha=0.5).draw_entities(pygame.Surface((320, 240)), (0, 0))
+    cw, ch = world.grid.cell_size
+    assert len(rects) == 1 and rects[0].center == (3 * cw, 2 * ch)
+
+class _Clock:
+    def tick(self, fps):
+        time.sleep(0.001)
+        return 1
+
+class _Input:
+    def handle_events(self):
+        return {"quit": False, "movement_intent": pygame.math.Vector2(1, 0)}
+
+def test_threaded_run_steps_simulation_off_the_render_thread():
+    """Tests that the worker thread runs every step while the caller renders snapshots."""
+    sim = Simulation(headless=True)
+    sim.clock, sim.input_handler, sim.time_scale = _Clock(), _Input(), 1000.0
+    sim.renderer = Renderer(surface=pygame.Surface((160, 120)))
+    sim.movement_intent = pygame.math.Vector2(1, 0)
+    start_x = sim.player_drone.position.x
+
+    sim.run_threaded(steps=200, dt=0.05)
+
+    assert sim.current_step == 200 and abs(sim.sim_time - 10.0) < 1e-9
+    assert sim.snapshots.published > 0 and sim.renderer._last_offset is not None
+    assert abs(sim.player_drone.position.x - (start_x + 10.0 * sim.player_drone.speed)) < 1e-6
@@ -0,0 +1,85 @@
+# tests/test_renderer.py
+
+from types import SimpleNamespace
+import pygame
+from skymind_sim.layer_0_presentation.camera import Camera
+from skymind_sim.layer_0_presentation.renderer import Renderer
+from skymind_sim.layer_1_simulation.world.grid import Grid
+from skymind_sim.layer_1_simulation.world.world import World
+
+def _renderer(world, size=(320, 240)):
+    renderer = Renderer(surface=pygame.Surface(size))
+    width, height = world.grid.get_world_size_in_pixels()
+    renderer.set_camera(Camera(None, size[0], size[1], width, height))
+    return renderer
+
+def _pixels(surface):
+    return pygame.image.tobytes(surface, "RGB")
+
+def test_dirty_rect_frames_match_full_redraw():
+    """Tests that incremental frames are pixel-identical to a frame drawn from scratch."""
+    world = World()
+    world.add_drone("second", (3, 2))
+    renderer = _renderer(world)
+    renderer.render(world)
+
+    world.player_drone.position = (2.4, 1.5)
+    world.drones["second"].position = (6, 4)
+    renderer.render(world)
+    assert len(renderer._dirty) == 2
+
+    assert _pixels(renderer.screen) == _pixels(_render_fresh(world))
+
+def _render_fresh(world):
+    renderer = _renderer(world)
+    renderer.render(world)
+    return renderer.screen
+
+def test_static_layer_is_rebuilt_only_when_grid_changes():
+    """Tests that the cached static layer follows the grid version."""
+    world = World()
+    renderer = _renderer(world)
+    renderer.render(world)
+    static = dict(renderer._tiles)
+    renderer.render(world)
+    assert renderer._tiles == static
+
+    world.grid.stamp_rectangles([(8, 6, 1, 1)])
+    renderer.render(world)
+    assert renderer._tiles[(0, 0)] is not static[(0, 0)]
+    cw, ch = world.grid.cell_size
+    assert renderer.screen.get_at((8 * cw + cw // 2, 6 * ch + ch // 2))[:3] == world.grid.obstacle_color
+
+def test_large_grid_renders_from_bounded_tiles(monkeypatch):
+    """Tests that a map far larger than memory allows as one surface renders from a few tiles."""
+    monkeypatch.setattr(Renderer, "STATIC_TILE_SIZE", 128)
+    grid = Grid(width=1000, height=1000, cell_size=(30, 30))
+    grid.occupancy[::7, ::3] = 1
+    grid.version += 1
+    world = SimpleNamespace(grid=grid, draw_entities=lambda surface, offset: [])
+    renderer = _renderer(world)
+
+    for x in range(0, 30000 - 320, 2971):
+        renderer.render(world, camera_offset=(x, x // 2))
+        assert len(renderer._tiles) <= renderer._tile_limit
+    offset = (12345, 6789)
+    renderer.render(world, camera_offset=offset)
+    expected = grid.render_static_layer(renderer.bg_color, pygame.Rect(offset, (320, 240)))
+    assert _pixels(renderer.screen) == _pixels(expected)
+
+    renderer.render(world, camera_offset=(29900, 29900))
+    assert renderer.screen.get_at((319, 239))[:3] == renderer.bg_color
+
+def test_draw_entities_culls_to_viewport():
+    """Tests that only drones inside the viewport are drawn and that moved drones are re-indexed."""
+    world = World(use_fleet=True)
+    for i in range(200):
+        world.add_drone(f"far_{i}", (40 + i % 10, 30 + i // 10 % 10))
+    surface = pygame.Surface((320, 240))
+    origin = pygame.math.Vector2(0, 0)
+
+    assert len(world.draw_entities(surface, origin)) == 1
+    world.drones["far_0"].position = (2, 2)
+    assert len(world.draw_entities(surface, origin)) == 2
+    assert "far_0" in world.spatial_index.query_cells(0, 0, 4, 4)
+    assert len(world.draw_entities(pygame.Surface((400, 400)), pygame.math.Vector2(38 * 30, 28 * 30))) == 199
@@ -0,0 +1,53 @@
+# tests/test_replay.py
+
+import pygame
+from skymind_sim.layer_1_simulation.simulation import Simulation
+from skymind_sim.layer_1_simulation.replay import ReplayEngine, ReplayRecorder
+from skymind_sim.network.communication import UAVCommChannel
+
+def _drive(sim, channel, steps):
+    """Runs a session with changing input and one loss draw per step."""
+    outcomes = []
+    for step in range(steps):
+        sim.movement_intent = pygame.math.Vector2(1 if step < 30 else 0, -1 if step % 20 < 10 else 0)
+        sim.run(steps=1, dt=0.05 if step < 40 else 0.1)
+        outcomes.append(channel.rng.random() < 0.5)
+    return outcomes
+
+def test_replay_reproduces_recorded_run(tmp_path):
+    """Tests that a replayed run reaches the recorded state and draws, and that the log stays compact."""
+    path = str(tmp_path / "session.rpl")
+    sim, channel = Simulation(headless=True), UAVCommChannel()
+    with ReplayRecorder(path) as recorder:
+        sim.recorder = recorder
+        recorder.attach_channel(channel)
+        outcomes = _drive(sim, channel, 60)
+
+    engine = ReplayEngine(path)
+    assert engine.last_tick == 59 and len(engine._draws) == 60
+
+    replayed, replay_channel = Simulation(headless=True), UAVCommChannel(seed=123)
+    engine.attach_channel(replay_channel, 0)
+    assert engine.run(replayed, until_tick=29) == 30
+    assert replayed.current_step == 30
+    engine.run(replayed)
+
+    assert replayed.player_drone.position == sim.player_drone.position
+    assert abs(replayed.sim_time - sim.sim_time) < 1e-12
+    assert [replay_channel.rng.random() < 0.5 for _ in range(60)] == outcomes
+
+def test_replay_runs_to_the_last_step_with_steady_input(tmp_path):
+    """Tests that a run with constant input and no channels replays every recorded step."""
+    path = str(tmp_path / "steady.rpl")
+    sim = Simulation(headless=True)
+    sim.movement_intent = pygame.math.Vector2(1, 0)
+    with ReplayRecorder(path) as recorder:
+        sim.recorder = recorder
+        sim.run(steps=100, dt=0.05)
+
+    engine = ReplayEngine(path)
+    assert engine.last_tick == 99
+
+    replayed = Simulation(headless=True)
+    assert engine.run(replayed) == 100
+    assert replayed.player_drone.position == sim.player_drone.position
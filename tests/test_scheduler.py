@@ -0,0 +1,80 @@
+# tests/test_scheduler.py
+
+from skymind_sim.layer_1_simulation.scheduler import Scheduler
+from skymind_sim.utils.telemetry import TelemetryRecorder
+
+class _Agent:
+    """Records the ticks it ran on and answers with a scripted next-step value."""
+    def __init__(self, agent_id, plan=None):
+        self.id = agent_id
+        self.ticks = []
+        self.plan = plan or (lambda tick: None)
+
+    def get_id(self):
+        return self.id
+
+    def step(self, tick):
+        self.ticks.append(tick)
+        return self.plan(tick)
+
+def test_agents_run_every_tick_by_default():
+    """Tests the classic fixed-tick behaviour when step returns None."""
+    scheduler = Scheduler()
+    agent = _Agent("a")
+    scheduler.add(agent)
+    for _ in range(3):
+        scheduler.execute_tick()
+    assert agent.ticks == [0, 1, 2]
+
+def test_sleep_and_wake():
+    """Tests that a sleeping agent is skipped until woken."""
+    scheduler = Scheduler()
+    agent = _Agent("a", lambda tick: Scheduler.SLEEP)
+    scheduler.add(agent)
+    for _ in range(3):
+        scheduler.execute_tick()
+    assert agent.ticks == [0]
+    scheduler.wake(agent, 5)
+    scheduler.run_until(6)
+    assert agent.ticks == [0, 5]
+
+def test_cancel_removes_the_pending_step():
+    """Tests that a cancelled agent does not run."""
+    scheduler = Scheduler()
+    agent, other = _Agent("a"), _Agent("b")
+    scheduler.add(agent)
+    scheduler.add(other)
+    assert scheduler.cancel(agent)
+    assert not scheduler.cancel(agent)
+    scheduler.run_until(2)
+    assert agent.ticks == [] and other.ticks == [0, 1, 2]
+
+def test_run_until_skips_idle_ticks():
+    """Tests that only ticks with scheduled work are executed."""
+    scheduler = Scheduler()
+    agent = _Agent("a", lambda tick: tick + 100)
+    scheduler.add(agent)
+    executed = []
+    original = scheduler.execute_tick
+    scheduler.execute_tick = lambda: executed.append(scheduler.current_tick) or original()
+
+    scheduler.run_until(350)
+
+    assert agent.ticks == [0, 100, 200, 300]
+    assert executed == [0, 100, 200, 300]
+    assert scheduler.current_tick == 351
+    assert scheduler.advance_to_next_event() == 400
+
+def test_execute_tick_samples_telemetry():
+    """Tests that every executed tick records one sample per agent."""
+    scheduler = Scheduler()
+    agent = _Agent("a", lambda tick: tick + 2)
+    agent.position, agent.velocity = (1.0, 2.0), (0.5, 0.0)
+    scheduler.add(agent)
+    scheduler.telemetry = TelemetryRecorder(capacity=16)
+    scheduler.run_until(4)
+
+    samples = scheduler.telemetry.latest()
+    assert samples["tick"].tolist() == [0, 2, 4]
+    assert scheduler.telemetry.drone_ids == ["a"]
+    assert samples["x"].tolist() == [1.0] * 3 and samples["vx"].tolist() == [0.5] * 3
@@ -0,0 +1,110 @@
+# tests/test_snapshot.py
+
+from types import SimpleNamespace
+import numpy as np
+import pytest
+from skymind_sim.layer_1_simulation.world.world import World
+from skymind_sim.layer_1_simulation.world.snapshot import WorldSnapshot
+from skymind_sim.layer_1_simulation.scheduler import Scheduler
+from skymind_sim.network.communication import UAVCommChannel
+
+def _warm_world():
+    world = World(use_fleet=True, headless=True)
+    world.grid.stamp_rectangles([(10, 10, 3, 2)])
+    world.add_drone("cargo", (3, 4)).path = [(3, 4), (4, 4), (5, 4)]
+    world.player_drone.velocity = (1.0, 0.5)
+    world.player_drone.energy = 42.0
+    for _ in range(4):
+        world.update(0.25)
+    return world
+
+def test_snapshot_round_trip_restores_state(tmp_path):
+    """Tests that a restored world and channel continue exactly like the original."""
+    world, channel = _warm_world(), UAVCommChannel(seed=5)
+    channel.rng.random()
+    path = str(tmp_path / "warm.snap")
+    WorldSnapshot.capture(world, channels=[channel]).save(path)
+    expected_draws = [channel.rng.random() for _ in range(3)]
+    world.update(1.0)
+    expected_position = world.player_drone.position
+
+    fresh, fresh_channel = World(use_fleet=True, headless=True), UAVCommChannel(seed=99)
+    WorldSnapshot.load(path).restore(fresh, channels=[fresh_channel])
+
+    assert np.array_equal(fresh.grid.occupancy, world.grid.occupancy)
+    assert fresh.tick == 4 and fresh.player_drone.energy == 42.0
+    assert fresh.drones["cargo"].path == [(3, 4), (4, 4), (5, 4)]
+    assert [fresh_channel.rng.random() for _ in range(3)] == expected_draws
+    fresh.update(1.0)
+    assert fresh.player_drone.position == expected_position
+
+def test_snapshot_memory_map_is_copy_on_write(tmp_path):
+    """Tests zero-copy loading and that branching edits never touch the file."""
+    path = str(tmp_path / "warm.snap")
+    WorldSnapshot.capture(_warm_world()).save(path)
+
+    branch = WorldSnapshot.load(path)
+    assert isinstance(branch.arrays["occupancy"].base, np.memmap) or isinstance(branch.arrays["occupancy"], np.memmap)
+    branch.arrays["occupancy"][:] = 1
+
+    assert WorldSnapshot.load(path, mmap_mode=None).arrays["occupancy"].sum() == 6
+
+def test_failed_restore_leaves_the_world_untouched(tmp_path):
+    """Tests that a channel-count mismatch is rejected before anything is restored."""
+    path = str(tmp_path / "warm.snap")
+    WorldSnapshot.capture(_warm_world()).save(path)
+    fresh = World(headless=True)
+    position, version = fresh.player_drone.position, fresh.grid.version
+
+    with pytest.raises(ValueError):
+        WorldSnapshot.load(path).restore(fresh, channels=[UAVCommChannel()])
+
+    assert fresh.grid.version == version and fresh.grid.occupancy.sum() == 0
+    assert set(fresh.drones) == {"player_1"} and fresh.player_drone.position == position
+    assert fresh.tick == 0
+
+def test_restore_resumes_the_scheduler(tmp_path):
+    """Tests that the scheduler continues from the captured tick."""
+    world, scheduler = _warm_world(), Scheduler()
+    scheduler.run_until(9)
+    snapshot = WorldSnapshot.capture(world, scheduler=scheduler)
+
+    restored = Scheduler()
+    snapshot.restore(World(use_fleet=True, headless=True), scheduler=restored)
+
+    assert restored.current_tick == 10 and restored.events.now == 10
+    ticks = []
+    restored.add(SimpleNamespace(id="a", get_id=lambda: "a", step=ticks.append))
+    restored.run_until(11)
+    assert ticks == [10, 11]
+
+def test_restore_rewinds_a_running_scheduler():
+    """Tests that agents of a scheduler that ran past the snapshot step on every tick after the rewind."""
+    world, scheduler = _warm_world(), Scheduler()
+    ticks = []
+    scheduler.add(SimpleNamespace(id="a", get_id=lambda: "a", step=ticks.append))
+    scheduler.run_until(49)
+    snapshot = WorldSnapshot.capture(world, scheduler=scheduler)
+    scheduler.run_until(99)
+
+    ticks.clear()
+    snapshot.restore(world, scheduler=scheduler)
+    scheduler.add(SimpleNamespace(id="b", get_id=lambda: "b", step=lambda tick: None))
+    scheduler.run_until(53)
+
+    assert scheduler.current_tick == 54 and ticks == [50, 51, 52, 53]
+    with pytest.raises(ValueError):
+        WorldSnapshot.capture(world).restore(world, scheduler=scheduler)
+
+def test_load_occupancy_journals_only_changed_cells():
+    """Tests that replacing the occupancy layer reports the exact changed cells."""
+    world = World(headless=True)
+    grid = world.grid
+    occupancy = grid.occupancy.copy()
+    occupancy[2, 3] = 1
+    version = grid.version
+    assert grid.load_occupancy(occupancy) == 1
+    assert grid.changes_since(version).tolist() == [2 * grid.width + 3]
+    assert grid.load_occupancy(occupancy) == 0 and grid.version == version + 1
+    with pytest.raises(ValueError):
+        grid.load_occupancy(occupancy[:, 1:])
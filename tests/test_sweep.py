@@ -0,0 +1,45 @@
+# tests/test_sweep.py
+
+from skymind_sim.experiments.sweep import build_runs, run_sweep, write_table
+from skymind_sim.utils.config_loader import ConfigLoader
+
+def test_build_runs_derives_deterministic_seeds():
+    """Tests the cartesian product of parameters and that seeds depend only on the base seed."""
+    grid = {"fleet_size": [2, 4], "packet_loss_rate": [0.0, 0.5]}
+    runs = build_runs(grid, repeats=2, base_seed=7)
+
+    assert len(runs) == 8 and [r.run_id for r in runs] == list(range(8))
+    assert [r.seed for r in runs] == [r.seed for r in build_runs(grid, repeats=2, base_seed=7)]
+    assert len({r.seed for r in runs}) == 8
+
+def test_parallel_sweep_matches_serial(tmp_path):
+    """Tests that pooled runs reproduce serial results and that config overrides reach each run."""
+    runs = build_runs({"fleet_size": [3], "packet_loss_rate": [0.0, 0.9], "simulation.fps": [20], "comm_range": [100]},
+                      base_seed=1, steps=30)
+    serial = run_sweep(runs, workers=0)
+    pooled = run_sweep(runs, workers=2)
+
+    ignore = {"WallTime"}
+    assert {k: v for k, v in serial.items() if k not in ignore} == {k: v for k, v in pooled.items() if k not in ignore}
+    assert set(serial["run_id"]) == {0, 1}
+    assert set(serial["simulation.fps"]) == {20}
+    lossy = [ok for run_id, ok in zip(serial["run_id"], serial["CommSuccess"]) if run_id == 1 and ok is not None]
+    assert lossy.count(0) > lossy.count(1)
+
+    ConfigLoader.reset()
+    write_table(serial, str(tmp_path / "sweep.csv"))
+    write_table(serial, str(tmp_path / "sweep.npz"))
+    assert (tmp_path / "sweep.csv").read_text(encoding="utf-8").startswith("run_id,seed,")
+
+def test_energy_sweep_drains_mission_batteries():
+    """Tests that world.energy_per_unit reaches the mission agents and missing values are None."""
+    runs = build_runs({"fleet_size": [3], "battery_capacity": [20.0], "world.energy_per_unit": [0.0, 1.0]},
+                      base_seed=3, steps=40)
+    table = run_sweep(runs, workers=0)
+
+    battery = {run_id: [] for run_id in (0, 1)}
+    for run_id, remaining in zip(table["run_id"], table["BatteryRemaining"]):
+        battery[run_id].append(remaining)
+    assert set(battery[0]) == {20.0}
+    assert min(battery[1]) < 20.0 and all(0.0 <= b <= 20.0 for b in battery[1])
+    assert -1 not in table["CommSuccess"] and -1 not in table["NeighborCount"]
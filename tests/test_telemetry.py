@@ -0,0 +1,84 @@
+# tests/test_telemetry.py
+
+from types import SimpleNamespace
+import numpy as np
+from skymind_sim.layer_1_simulation.world.world import World
+from skymind_sim.layer_1_simulation.world.grid import Grid
+from skymind_sim.layer_1_simulation.movement.drone_mover import DroneMover
+from skymind_sim.utils.telemetry import TelemetryRecorder
+
+def _record(recorder, tick, count=3):
+    recorder.record(tick, np.arange(count, dtype=np.int32), np.full((count, 2), tick, dtype=float),
+                    np.zeros((count, 2)), np.full(count, 100.0 - tick), np.ones(count, dtype=np.int8))
+
+def test_ring_buffer_wraps_and_flush_is_bounded(tmp_path):
+    """Tests overwrite of the oldest samples, bounded flushes and drop accounting."""
+    recorder = TelemetryRecorder(capacity=8, ring_path=str(tmp_path / "ring.bin"))
+    out = str(tmp_path / "telemetry.bin")
+    for tick in range(2):
+        _record(recorder, tick)
+    assert recorder.flush(out, max_rows=4) == 4
+
+    for tick in range(2, 5):
+        _record(recorder, tick)
+    assert len(recorder) == 8
+    assert recorder.latest()["tick"].tolist() == [2, 2, 3, 3, 3, 4, 4, 4]
+
+    assert recorder.flush(out) == 8
+    assert recorder.dropped == 3
+    saved = TelemetryRecorder.load(out)
+    assert saved["tick"].tolist() == [0, 0, 0, 1] + [2, 2, 3, 3, 3, 4, 4, 4]
+
+def test_world_update_records_every_n_ticks():
+    """Tests the World.update hook in fleet mode with a sampling interval."""
+    world = World(use_fleet=True, headless=True)
+    world.add_drone("extra", (1, 1))
+    world.telemetry = TelemetryRecorder(capacity=64, interval=2)
+    world.player_drone.velocity = (1.0, 0.0)
+    for _ in range(5):
+        world.update(0.5)
+
+    samples = world.telemetry.latest()
+    assert samples["tick"].tolist() == [0, 0, 2, 2, 4, 4]
+    assert world.telemetry.drone_ids == ["player_1", "extra"]
+    player = samples[samples["drone"] == 0]
+    assert np.allclose(np.diff(player["x"]), 1.0)
+
+def test_fleet_rows_map_to_drone_codes():
+    """Tests that fleet samples use the recorder's drone codes, not the fleet row numbers."""
+    world = World(use_fleet=True, headless=True)
+    recorder = TelemetryRecorder(capacity=64)
+    recorder.capture(0, [SimpleNamespace(id="scout", position=(0, 0), velocity=None)])
+    world.telemetry = recorder
+    world.update(0.1)
+    world.add_drone("extra", (1, 1))
+    world.update(0.1)
+
+    assert recorder.drone_ids == ["scout", "player_1", "extra"]
+    assert recorder.latest()["drone"].tolist() == [0, 1, 1, 2]
+
+def test_fleet_codes_follow_row_order_not_dict_order():
+    """Tests that re-inserting a drone into world.drones does not shift the telemetry ids."""
+    world = World(use_fleet=True, headless=True)
+    world.add_drone("extra", (1, 1))
+    world.drones["player_1"] = world.drones.pop("player_1")
+    world.telemetry = TelemetryRecorder(capacity=16)
+    world.player_drone.velocity = (2.0, 0.0)
+    world.update(0.5)
+
+    samples = world.telemetry.latest()
+    codes = {world.telemetry.drone_ids[code]: x for code, x in zip(samples["drone"].tolist(), samples["x"].tolist())}
+    assert codes == {"player_1": world.player_drone.position[0], "extra": 1.0}
+
+def test_drone_mover_bounds_path_history():
+    """Tests that DroneMover keeps path_history within history_limit."""
+    grid = Grid(width=40, height=1, cell_size=(10, 10))
+    world = SimpleNamespace(grid=grid, check_collision=lambda p: grid.is_obstacle(p[0], p[1]))
+    drone = SimpleNamespace(id="d", active=True, position=(0, 0), destination=(39, 0), path=[],
+                            path_history=[(0, 0)], collision_avoided=0)
+    mover = DroneMover(world, history_limit=5)
+    for _ in range(30):
+        mover.move_drone(drone)
+
+    assert drone.position == (30, 0)
+    assert list(drone.path_history) == [(26, 0), (27, 0), (28, 0), (29, 0), (30, 0)]